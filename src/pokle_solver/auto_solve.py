@@ -15,10 +15,76 @@ else:
     # Running as module - use relative imports
     from .card import Card
     from .solver import Solver
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import Locator, sync_playwright
+from itertools import permutations
+from types import MappingProxyType
+from typing import Final
 import re
 
 
+# Trophy image name -> finishing place (1=best)
+PLACE_DICT: Final = MappingProxyType({"gold": 1, "silver": 2, "bronze": 3})
+# Guess button card-color attribute -> solver color code
+COLOR_DICT: Final = MappingProxyType({"darkgreen": "g", "gold": "y", "grey": "e"})
+# Face card rank -> rank button label
+FACE_CARDS: Final = MappingProxyType({11: "J", 12: "Q", 13: "K", 14: "A"})
+# Rank -> rank button label, indexed directly by rank (slots 0-1 unused)
+RANK_STR: Final = tuple(
+    "" if rank < 2 else FACE_CARDS.get(rank, str(rank)) for rank in range(15)
+)
+# Trophies in player order -> players in finishing order, for all 6 orderings
+_PERM_CACHE: Final = MappingProxyType(
+    {
+        perm: tuple(
+            i
+            for i, _ in sorted(
+                enumerate(perm, start=1), key=lambda it: PLACE_DICT[it[1]]
+            )
+        )
+        for perm in permutations(PLACE_DICT)
+    }
+)
+# In-page script mapping each trophy element to its image name (e.g. "gold")
+TROPHY_NAMES_JS: Final = (
+    "els => els.map(e => ((e.getAttribute('style') || '')"
+    ".match(/url\\(\"([^.]+)\\.svg/) || [])[1])"
+)
+
+
+def parse_suit(style: str | None) -> str | None:
+    """Extract a hole card's suit from its style attribute.
+
+    Styles that are missing or carry no background image (e.g. a card that
+    failed to load) are rejected before running the regex.
+
+    Args:
+        style (str | None): Style attribute such as 'background-image: url("h_card.svg")'.
+
+    Returns:
+        str | None: Upper-case suit letter ('H', 'D', 'C', 'S'), or None if not found.
+    """
+    if not style or "url(" not in style:
+        return None
+    suit_match = re.search(r'url\("(.).+?\.svg', style)
+    return suit_match.group(1).upper() if suit_match else None
+
+
+def parse_round_trophies(row: Locator) -> list[str]:
+    """Read the trophy names shown in one round's row of the results table.
+
+    The style attributes are matched inside the page so all trophies are read
+    in a single round-trip instead of one ``get_attribute`` call per trophy.
+
+    Args:
+        row (Locator): Table row for the flop, turn, or river.
+
+    Returns:
+        list[str]: Trophy names in player order, e.g. ['silver', 'gold', 'bronze'].
+    """
+    trophies = row.locator(".trophy-pic").evaluate_all(TROPHY_NAMES_JS)
+    return [trophy for trophy in trophies if trophy]
+
+
 if __name__ == "__main__":
     with sync_playwright() as p:
         # Launch the browser and open a new page
@@ -39,8 +105,7 @@ if __name__ == "__main__":
             for card in range(1, 3):
                 rank = page.locator(f"#p{player}card{card}").text_content()
                 style = page.locator(f"#p{player}card{card}").get_attribute("style")
-                suit_match = re.search(r'url\("(.).+?\.svg', style) if style else None
-                suit = suit_match.group(1).upper() if suit_match else None
+                suit = parse_suit(style)
                 player_hole_cards.append(Card.from_string(f"{rank}{suit}"))
             all_hole_cards.append(player_hole_cards)
 
@@ -49,27 +114,10 @@ if __name__ == "__main__":
         places = []
         for round_name in rounds:
             row = page.locator(f"tr:has(td.stage-tag:has-text('{round_name}'))")
-            trophy_pics = row.locator(".trophy-pic").all()
-            round_trophies = []
-            for trophy in trophy_pics:
-                style = trophy.get_attribute("style")
-                trophy_match = (
-                    re.search(r'url\("([^.]+)\.svg', style) if style else None
-                )
-                if trophy_match:
-                    trophy_str = trophy_match.group(1)
-                    round_trophies.append(trophy_str)
-            places.append(round_trophies)
+            places.append(parse_round_trophies(row))
 
         # Convert trophy names to player positions for each round
-        place_dict = {"gold": 1, "silver": 2, "bronze": 3}
-        for round in range(len(places)):
-            places[round] = [
-                i
-                for i, t in sorted(
-                    enumerate(places[round], start=1), key=lambda it: place_dict[it[1]]
-                )
-            ]
+        places = [list(_PERM_CACHE[tuple(trophies)]) for trophies in places]
 
         # Enter the data into the solver and compute possible tables
         solver = Solver(
@@ -83,9 +131,7 @@ if __name__ == "__main__":
         possible_tables = solver.solve()
         print(f"Possible tables found: {len(possible_tables)}")
 
-        face_cards = {11: "J", 12: "Q", 13: "K", 14: "A"}
         card_colors = ["e" for _ in range(5)]
-        colors_dict = {"darkgreen": "g", "gold": "y", "grey": "e"}
 
         is_all_green = False
         while not is_all_green:
@@ -97,7 +143,7 @@ if __name__ == "__main__":
             # Input the max entropy table back into the game and submit
             for i, card in enumerate(maxh_table):
                 page.locator('button.guess-button[active="true"]').nth(i).click()
-                rank_str = face_cards.get(card.rank, str(card.rank))
+                rank_str = RANK_STR[card.rank]
                 page.locator("button.rank-button", has_text=rank_str).click()
                 page.locator("button.suit-button", has_text=card.suit.lower()).click()
 
@@ -105,7 +151,7 @@ if __name__ == "__main__":
 
             # Get the feedback colors for the guessed table
             for i, card in enumerate(maxh_table):
-                rank_str = face_cards.get(card.rank, str(card.rank))
+                rank_str = RANK_STR[card.rank]
                 card_color = None
                 try:
                     card_color = page.locator(
@@ -121,7 +167,7 @@ if __name__ == "__main__":
                     card_color = fallback.last.get_attribute("card-color")
 
                 card_colors[i] = (
-                    colors_dict.get(card_color, card_colors[i])
+                    COLOR_DICT.get(card_color, card_colors[i])
                     if card_color
                     else card_colors[i]
                 )
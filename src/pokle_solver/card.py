@@ -9,6 +9,10 @@ Classes:
     ColorCard: Card with color feedback (green/yellow/grey)
 """
 
+from typing import Iterable
+
+import numpy as np
+
 # Card rank constants
 RANK_ACE = 14
 RANK_KING = 13
@@ -21,12 +25,79 @@ RANK_MAX = 14
 # Valid suits
 VALID_SUITS = {"H", "D", "C", "S"}
 SUITS = ["H", "D", "C", "S"]  # List version for iteration
+# Suit offset within a rank's block of four card indices
+_SUIT_INDICES = {"C": 0, "D": 1, "H": 2, "S": 3}
+
+# Rank -> display string, e.g. 10 -> '10', 11 -> 'J'
+_RANK_TO_STR = {
+    **{rank: str(rank) for rank in range(RANK_MIN, RANK_TEN + 1)},
+    RANK_JACK: "J",
+    RANK_QUEEN: "Q",
+    RANK_KING: "K",
+    RANK_ACE: "A",
+}
+
+# Rank string -> rank ('T' and '10' both accepted for tens)
+_RANK_FROM_STR = {
+    **{rank_str: rank for rank, rank_str in _RANK_TO_STR.items()},
+    "T": RANK_TEN,
+}
+
+# One prime per rank (2 -> 2, ..., A -> 41); a product of primes identifies a
+# multiset of ranks regardless of order
+RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# Normalized card string -> (rank, suit) for all 52 cards
+_CARD_FROM_STR = {
+    f"{rank_str}{suit}": (rank, suit)
+    for rank_str, rank in _RANK_FROM_STR.items()
+    for suit in SUITS
+}
 
 # Color constants for ColorCard
 COLOR_GREEN = "g"
 COLOR_YELLOW = "y"
 COLOR_GREY = "e"
-VALID_COLORS = {COLOR_GREEN, COLOR_YELLOW, COLOR_GREY}
+VALID_COLORS = frozenset({COLOR_GREEN, COLOR_YELLOW, COLOR_GREY})
+_INVALID_COLOR_MESSAGE = f"Color must be one of {sorted(VALID_COLORS)}"
+# Color code packed below the card_index in a ColorCard's hash
+_COLOR_INDICES = {COLOR_GREY: 0, COLOR_YELLOW: 1, COLOR_GREEN: 2}
+
+# ANSI styling used by pstr()
+_SUIT_SYMBOLS = {"H": "♥", "D": "♦", "C": "♣", "S": "♠"}
+_SUIT_TEXT_COLORS = {
+    "H": "\033[38;2;255;0;0m",
+    "D": "\033[38;2;255;0;0m",
+    "C": "\033[30m",
+    "S": "\033[30m",
+}  # Red for H/D, Black for C/S
+_CARD_BG_COLOR = "\033[47m"  # White background
+_COLOR_BG_COLORS = {
+    COLOR_GREEN: "\033[42m",  # Green background
+    COLOR_YELLOW: "\033[43m",  # Yellow background
+    COLOR_GREY: "\033[48;2;160;160;160m",  # Light grey RGB background
+}
+_RESET_COLOR = "\033[0m"
+
+
+def _build_pstr(rank: int, suit: str, bg_color: str) -> str:
+    """Build the ANSI-colored display string for one card on a background."""
+    # Pad the visible content to 3 characters BEFORE adding color codes
+    visible_str = f"{_RANK_TO_STR[rank]}{_SUIT_SYMBOLS[suit]}".rjust(3)
+    return f"{bg_color}{_SUIT_TEXT_COLORS[suit]}{visible_str}{_RESET_COLOR}"
+
+
+# Every possible pstr() output, indexed by card_index (then color for ColorCard)
+_PSTR_TABLE = tuple(
+    _build_pstr(rank, suit, _CARD_BG_COLOR)
+    for rank in range(RANK_MIN, RANK_MAX + 1)
+    for suit in _SUIT_INDICES
+)
+_COLOR_PSTR_TABLE = tuple(
+    {color: _build_pstr(rank, suit, bg) for color, bg in _COLOR_BG_COLORS.items()}
+    for rank in range(RANK_MIN, RANK_MAX + 1)
+    for suit in _SUIT_INDICES
+)
 
 
 class Card:
@@ -47,10 +118,18 @@ class Card:
         >>> card = Card.from_tuple((13, 'S'))  # King of Spades
     """
 
-    __slots__ = ("_rank", "_suit", "_hash", "_card_index")
-    # Class-level cache for card indices (max 52 entries)
-    _card_index_cache = {}
-    _suit_indices = {"C": 0, "D": 1, "H": 2, "S": 3}
+    __slots__ = (
+        "_rank",
+        "_suit",
+        "_hash",
+        "_card_index",
+        "_str",
+        "_repr",
+        "_rank_bit",
+        "_suit_bit",
+        "_suit_count",
+        "_prime",
+    )
 
     def __init__(self, rank: int, suit: str):
         if rank < RANK_MIN or rank > RANK_MAX:
@@ -60,26 +139,35 @@ class Card:
         if suit not in VALID_SUITS:
             raise ValueError(f"Suit must be one of {VALID_SUITS}")
 
-        cache_key = (rank, suit)
-        if cache_key not in Card._card_index_cache:
-            Card._card_index_cache[cache_key] = (rank - 2) * 4 + Card._suit_indices[
-                suit
-            ]
-        self._card_index = Card._card_index_cache[cache_key]
-
+        # Rank offset in the high bits, 2-bit suit in the low bits
+        self._card_index = ((rank - RANK_MIN) << 2) | _SUIT_INDICES[suit]
         self._rank = rank
         self._suit = suit
-        self._hash = None  # Lazy hash computation
+        # card_index is unique per rank/suit, so it doubles as the hash
+        self._hash = self._card_index
+        self._str = _RANK_TO_STR[rank] + suit
+        self._repr = f"Card(rank={rank}, suit='{suit}')"
+        # Bitmask building blocks: OR across a hand, then popcount/mask.
+        # _rank_bit is one of 13 rank bits; _suit_bit sits in a 13-bit lane per suit.
+        self._rank_bit = 1 << (rank - RANK_MIN)
+        self._suit_bit = 1 << (13 * _SUIT_INDICES[suit] + rank - RANK_MIN)
+        # _suit_count adds one to a 4-bit per-suit counter, so summing it over
+        # a hand counts the cards of each suit
+        self._suit_count = 1 << (4 * _SUIT_INDICES[suit])
+        self._prime = RANK_PRIMES[rank - RANK_MIN]
 
     @classmethod
     def from_string(cls, card_string: str) -> "Card":
         """Create a Card from a string representation.
 
+        Cards are immutable, so this returns the pooled instance from
+        ``Card.intern`` rather than allocating; subclasses get a new instance.
+
         Args:
             card_string (str): String like 'AH', '10D', 'KS', etc.
 
         Returns:
-            Card: New Card instance.
+            Card: The pooled Card instance (new instance for subclasses).
 
         Raises:
             ValueError: If card_string is invalid or None.
@@ -89,15 +177,143 @@ class Card:
             >>> card = Card.from_string('10D')  # 10 of Diamonds
             >>> card = Card.from_string('KS')  # King of Spades
         """
+        if cls is Card and isinstance(card_string, str):
+            card = _POOLED_FROM_STR.get(card_string)
+            if card is not None:
+                return card
         if card_string is None:
             raise ValueError("card_string must be provided")
-        s = card_string.strip().upper()
-        if len(s) < 2 or len(s) > 3:
-            raise ValueError(f"Invalid card string: {card_string}")
-        rank = cls.rank_from_string(s[:-1])
-        suit = s[-1]
+        rank, suit = cls._parse_card_string(card_string)
+        if cls is Card:
+            return _CARD_POOL[((rank - RANK_MIN) << 2) | _SUIT_INDICES[suit]]
         return cls(rank, suit)
 
+    @staticmethod
+    def _parse_card_string(card_string: str) -> tuple[int, str]:
+        """Look up the (rank, suit) pair for a card string like 'AH' or '10d'.
+
+        Canonical spellings are a single table lookup; anything else, such as
+        '14H' or '02H', is split into rank and suit and parsed as before.
+
+        Raises:
+            ValueError: If card_string has the wrong length, or its rank or
+                suit is invalid (with the same message as Card(rank, suit)).
+        """
+        normalized = card_string.strip().upper()
+        card = _CARD_FROM_STR.get(normalized)
+        if card is not None:
+            return card
+        if not 2 <= len(normalized) <= 3:
+            raise ValueError(f"Invalid card string: {card_string}")
+        # Same checks, in the same order, as Card(rank, suit)
+        rank = Card.rank_from_string(normalized[:-1])
+        suit = normalized[-1]
+        if suit not in VALID_SUITS:
+            raise ValueError(f"Suit must be one of {VALID_SUITS}")
+        return rank, suit
+
+    @staticmethod
+    def intern(rank: int, suit: str) -> "Card":
+        """Return the shared canonical Card for a rank and suit.
+
+        Unlike ``Card(rank, suit)``, which always allocates, repeated calls with
+        the same rank and suit return the same object. ColorCards are never
+        pooled since their color can change.
+
+        Args:
+            rank (int): Card rank from 2-14.
+            suit (str): Card suit, one of 'H', 'D', 'C', 'S'.
+
+        Returns:
+            Card: The pooled Card instance.
+
+        Raises:
+            ValueError: If rank or suit is invalid.
+
+        Examples:
+            >>> Card.intern(14, 'H') is Card.intern(14, 'H')
+            True
+        """
+        if not (RANK_MIN <= rank <= RANK_MAX and suit in _SUIT_INDICES):
+            Card(rank, suit)  # Raises the constructor's ValueError
+        return _CARD_POOL[((rank - RANK_MIN) << 2) | _SUIT_INDICES[suit]]
+
+    def pack(self) -> int:
+        """Pack this card into a single integer.
+
+        The packed value is the card index (0-51), which fits in 6 bits, so a
+        5-card hand fits in 30 bits of one integer.
+
+        Returns:
+            int: Packed card value.
+
+        Examples:
+            >>> Card(14, 'S').pack()
+            51
+        """
+        return self._card_index
+
+    @staticmethod
+    def unpack(packed: int) -> "Card":
+        """Get the pooled Card for a value produced by ``pack``.
+
+        Args:
+            packed (int): Packed card value (0-51).
+
+        Returns:
+            Card: The interned Card instance.
+
+        Raises:
+            IndexError: If packed is outside 0-51.
+
+        Examples:
+            >>> Card.unpack(51)
+            Card(rank=14, suit='S')
+        """
+        if not 0 <= packed <= 51:
+            raise IndexError("Card indices must be in the range 0-51")
+        return _CARD_POOL[packed]
+
+    @staticmethod
+    def from_indices(indices: np.ndarray) -> np.ndarray:
+        """Map an array of card indices to the pooled Card instances.
+
+        Args:
+            indices (np.ndarray): Integer array of card indices (0-51), any shape.
+
+        Returns:
+            np.ndarray: Object array of the same shape holding interned Cards.
+
+        Raises:
+            IndexError: If any index is outside 0-51.
+
+        Examples:
+            >>> Card.from_indices(np.array([0, 51]))
+            array([Card(rank=2, suit='C'), Card(rank=14, suit='S')], dtype=object)
+        """
+        indices = np.asarray(indices)
+        if indices.size and (indices.min() < 0 or indices.max() > 51):
+            raise IndexError("Card indices must be in the range 0-51")
+        return _CARD_ARRAY[indices]
+
+    @staticmethod
+    def indices(cards: Iterable["Card"]) -> np.ndarray:
+        """Get the card indices of a sequence of Cards.
+
+        Inverse of ``from_indices`` for a flat sequence of cards.
+
+        Args:
+            cards (Iterable[Card]): Cards to encode.
+
+        Returns:
+            np.ndarray: 1D int8 array of card indices.
+
+        Examples:
+            >>> Card.indices([Card(2, 'C'), Card(14, 'S')])
+            array([ 0, 51], dtype=int8)
+        """
+        return np.fromiter((card._card_index for card in cards), dtype=np.int8)
+
     @classmethod
     def from_tuple(cls, card_tuple: tuple[int | str, str]) -> "Card":
         """Create a Card from a tuple representation.
@@ -140,6 +356,9 @@ class Card:
     def card_index(self) -> int:
         """Get the card index (0-51) for this card.
 
+        The index packs ``rank - 2`` above a 2-bit suit, so ``index >> 2`` and
+        ``index & 3`` recover the rank offset and suit.
+
         Returns:
             int: Card index in the range 0-51
         """
@@ -150,7 +369,7 @@ class Card:
         """Convert a rank string to its integer value.
 
         Args:
-            rank_str (str): Rank as string ('A', 'K', 'Q', 'J', 'T', or '2'-'10').
+            rank_str (str): Rank as string ('A', 'K', 'Q', 'J', 'T', or '2'-'14').
 
         Returns:
             int: Integer rank (2-14).
@@ -165,25 +384,28 @@ class Card:
             13
             >>> Card.rank_from_string('10')
             10
+            >>> Card.rank_from_string('14')
+            14
         """
-        face_cards = {
-            "T": RANK_TEN,
-            "J": RANK_JACK,
-            "Q": RANK_QUEEN,
-            "K": RANK_KING,
-            "A": RANK_ACE,
-        }
+        rank = _RANK_FROM_STR.get(rank_str.upper())
+        if rank is not None:
+            return rank
+        # Numeric spellings outside the table, e.g. '14' for an Ace or '02'
         try:
-            return int(face_cards.get(rank_str, rank_str))
+            rank = int(rank_str)
         except ValueError:
-            raise ValueError("Rank must be an integer or a valid face card")
+            raise ValueError("Rank must be an integer or a valid face card") from None
+        if rank < RANK_MIN or rank > RANK_MAX:
+            raise ValueError(
+                f"Rank must be between {RANK_MIN} and {RANK_MAX} (where {RANK_JACK}=J, {RANK_QUEEN}=Q, {RANK_KING}=K, {RANK_ACE}=A)"
+            )
+        return rank
 
     def __repr__(self) -> str:
-        return f"Card(rank={self._rank}, suit='{self._suit}')"
+        return self._repr
 
     def __str__(self) -> str:
-        face_cards = {RANK_JACK: "J", RANK_QUEEN: "Q", RANK_KING: "K", RANK_ACE: "A"}
-        return f"{face_cards.get(self._rank, self._rank)}{self._suit}"
+        return self._str
 
     def pstr(self) -> str:
         """Return a pretty-printed colored string representation of the Card.
@@ -196,37 +418,21 @@ class Card:
             >>> card.pstr()  # Returns colored output (shown as plain text here)
             ' A♥'
         """
-        face_cards = {RANK_JACK: "J", RANK_QUEEN: "Q", RANK_KING: "K", RANK_ACE: "A"}
-        suit_symbols = {"H": "♥", "D": "♦", "C": "♣", "S": "♠"}
-        suit_colors = {
-            "H": "\033[38;2;255;0;0m",
-            "D": "\033[38;2;255;0;0m",
-            "C": "\033[30m",
-            "S": "\033[30m",
-        }  # Red for H/D, Black for C/S
-
-        reset_color = "\033[0m"
-        rank_str = face_cards.get(self._rank, str(self._rank))
-        suit_symbol = suit_symbols[self._suit]
-
-        # Pad the visible content to 3 characters BEFORE adding color codes
-        visible_str = f"{rank_str}{suit_symbol}".rjust(3)
-
-        text_color = suit_colors[self._suit]
-        bg_color = "\033[47m"
-
-        return f"{bg_color}{text_color}{visible_str}{reset_color}"
+        return _PSTR_TABLE[self._card_index]
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, Card):
-            return self._rank == other._rank and self._suit == other._suit
+            # card_index encodes rank and suit, so one int compare suffices
+            return self._card_index == other._card_index
         return NotImplemented
 
     def __hash__(self) -> int:
-        if self._hash is None:
-            self._hash = hash((self._rank, self._suit))
         return self._hash
 
+    def __int__(self) -> int:
+        # The 0-51 card index, so np.array(cards, dtype=np.int8) encodes a table
+        return self._card_index
+
     def __lt__(self, other: object) -> bool:
         if isinstance(other, Card):
             return self._rank < other._rank
@@ -249,7 +455,7 @@ class Card:
 
     def __ne__(self, other: object) -> bool:
         if isinstance(other, Card):
-            return self._rank != other._rank or self._suit != other._suit
+            return self._card_index != other._card_index
         return NotImplemented
 
     def is_same_suit(self, other: "Card") -> bool:
@@ -268,7 +474,8 @@ class Card:
             >>> Card(10, 'H').is_same_suit(Card(10, 'D'))
             False
         """
-        if isinstance(other, Card):
+        cls = type(other)
+        if cls is Card or cls is ColorCard:
             return self._suit == other._suit
         return NotImplemented
 
@@ -288,7 +495,8 @@ class Card:
             >>> Card(10, 'H').is_same_rank(Card(14, 'H'))
             False
         """
-        if isinstance(other, Card):
+        cls = type(other)
+        if cls is Card or cls is ColorCard:
             return self._rank == other._rank
         return NotImplemented
 
@@ -311,7 +519,7 @@ class Card:
             'AH_g'
         """
         if color not in VALID_COLORS:
-            raise ValueError(f"Color must be one of {VALID_COLORS}")
+            raise ValueError(_INVALID_COLOR_MESSAGE)
         return ColorCard(self._rank, self._suit, color)
 
 
@@ -343,9 +551,10 @@ class ColorCard(Card):
     def __init__(self, rank: int, suit: str, color: str = COLOR_GREY):
         super().__init__(rank, suit)
         if color not in VALID_COLORS:
-            raise ValueError(f"Color must be one of {VALID_COLORS}")
+            raise ValueError(_INVALID_COLOR_MESSAGE)
         self._color = color
-        self._hash_color = None  # Lazy hash computation
+        self._hash_color = (self._card_index << 2) | _COLOR_INDICES[color]
+        self._repr = f"ColorCard(rank={rank}, suit='{suit}', color='{color}')"
 
     @classmethod
     def from_string(cls, card_string: str) -> "ColorCard":
@@ -362,13 +571,12 @@ class ColorCard(Card):
             >>> card = ColorCard.from_string('10D_y')  # Yellow 10 of Diamonds
             >>> card = ColorCard.from_string('KS')  # Grey King of Spades (default)
         """
-        if "_" in card_string:
-            card_part, color_part = card_string.split("_")
-            base_card = super().from_string(card_part)
-            return cls(base_card.rank, base_card.suit, color_part)
-        else:
-            base_card = super().from_string(card_string)
-            return cls(base_card.rank, base_card.suit, COLOR_GREY)
+        if card_string is None:
+            raise ValueError("card_string must be provided")
+        card_part, separator, color = card_string.strip().rpartition("_")
+        if not separator:
+            card_part, color = color, COLOR_GREY
+        return cls(*cls._parse_card_string(card_part), color)
 
     @classmethod
     def from_tuple(
@@ -404,9 +612,7 @@ class ColorCard(Card):
         return cls(rank, suit, color)
 
     def __repr__(self) -> str:
-        return (
-            f"ColorCard(rank={self._rank}, suit='{self._suit}', color='{self.color}')"
-        )
+        return self._repr
 
     def __str__(self) -> str:
         return super().__str__() + f"_{self.color}"
@@ -421,14 +627,7 @@ class ColorCard(Card):
             >>> card = ColorCard(14, 'H', 'g')
             >>> card.pstr()  # Returns colored output with green background
         """
-        base_str = super().pstr()
-        bg_colors = {
-            "g": "\033[42m",  # Green background
-            "y": "\033[43m",  # Yellow background
-            "e": "\033[48;2;160;160;160m",  # Light grey RGB background
-        }
-        bg_color = bg_colors[self.color]
-        return base_str.replace("\033[47m", bg_color)
+        return _COLOR_PSTR_TABLE[self._card_index][self._color]
 
     @property
     def color(self) -> str:
@@ -437,30 +636,25 @@ class ColorCard(Card):
     @color.setter
     def color(self, value: str) -> None:
         if value not in VALID_COLORS:
-            raise ValueError(f"Color must be one of {VALID_COLORS}")
+            raise ValueError(_INVALID_COLOR_MESSAGE)
         self._color = value
+        self._hash_color = (self._card_index << 2) | _COLOR_INDICES[value]
+        self._repr = (
+            f"ColorCard(rank={self._rank}, suit='{self._suit}', color='{value}')"
+        )
 
     def __hash__(self):
-        if self._hash_color is None:
-            self._hash_color = hash((self._rank, self._suit, self.color))
         return self._hash_color
 
     def __eq__(self, other):
         if isinstance(other, ColorCard):
-            return (
-                self._rank == other._rank
-                and self._suit == other._suit
-                and self._color == other._color
-            )
+            # _hash_color packs card_index and color into one int
+            return self._hash_color == other._hash_color
         return NotImplemented
 
     def __ne__(self, other):
         if isinstance(other, ColorCard):
-            return (
-                self._rank != other._rank
-                or self._suit != other._suit
-                or self._color != other._color
-            )
+            return self._hash_color != other._hash_color
         return NotImplemented
 
     def is_same_color(self, other):
@@ -479,6 +673,25 @@ class ColorCard(Card):
             >>> ColorCard(14, 'H', 'g').is_same_color(ColorCard(14, 'H', 'y'))
             False
         """
-        if isinstance(other, ColorCard):
+        if type(other) is ColorCard:
             return self._color == other._color
         return NotImplemented
+
+
+# Canonical Card instances handed out by Card.intern(), indexed by card_index.
+# Seeded with all 52 cards at import so lookups never miss.
+_CARD_POOL = tuple(
+    Card(rank, suit)
+    for rank in range(RANK_MIN, RANK_MAX + 1)
+    for suit in _SUIT_INDICES
+)
+# Object array view of the pool for vectorized lookups in Card.from_indices()
+_CARD_ARRAY = np.empty(len(_CARD_POOL), dtype=object)
+_CARD_ARRAY[:] = _CARD_POOL
+# Upper- and lower-case card strings -> pooled Card, so Card.from_string can
+# return common inputs with one dict lookup before normalizing anything
+_POOLED_FROM_STR = {
+    variant: _CARD_POOL[((rank - RANK_MIN) << 2) | _SUIT_INDICES[suit]]
+    for card_string, (rank, suit) in _CARD_FROM_STR.items()
+    for variant in (card_string, card_string.lower())
+}
@@ -8,6 +8,9 @@ This script can be run either as a module (python -m pokle_solver.cli)
 or directly as a script (python cli.py).
 
 Functions:
+    parse_cards: Parse a player's hole cards
+    parse_ranks: Parse the players' hand ranks for a phase
+    parse_colors: Parse color feedback for a guessed table
     cli: Main interactive CLI function
 """
 
@@ -30,6 +33,48 @@ else:
     from .solver import Solver
 
 
+def parse_cards(hole_str: str, player_number: int) -> list[Card]:
+    """Parse a player's hole cards from a string like '10H KD'.
+
+    Raises:
+        ValueError: If a card is invalid or there are not exactly two cards.
+    """
+    hole = [Card.from_string(card_str) for card_str in hole_str.split()]
+    if len(hole) != 2:
+        raise ValueError(f"Please enter exactly two cards for Player {player_number}.")
+    return hole
+
+
+def parse_ranks(ranks_str: str) -> list[int]:
+    """Parse each player's hand rank from a string like '2 1 3'.
+
+    Returns:
+        list[int]: Player numbers ordered from best to worst hand.
+
+    Raises:
+        ValueError: If the ranks are not a permutation of 1, 2, 3.
+    """
+    hand_ranks = ranks_str.split()
+    if sorted(hand_ranks) != ["1", "2", "3"]:
+        raise ValueError("Please enter valid ranks (1, 2, 3) for each player.")
+    hand_ranks = [int(rank) for rank in hand_ranks]
+    return [i for i, _ in sorted(enumerate(hand_ranks, start=1), key=lambda x: x[1])]
+
+
+def parse_colors(color_str: str) -> list[str]:
+    """Parse color feedback from a string like 'g y e e g'.
+
+    Raises:
+        ValueError: If there are not exactly five colors from 'g', 'y', 'e'.
+    """
+    card_colors = color_str.lower().split()
+    if len(card_colors) != 5 or not all(
+        color in ["g", "y", "e"] for color in card_colors
+    ):
+        raise ValueError("Please enter exactly 5 colors using 'g', 'y', or 'e'.")
+    return card_colors
+
+
 def cli() -> None:
     player_holes = []
     player_number = 1
@@ -38,12 +83,7 @@ def cli() -> None:
             f"Enter Player {player_number} hole cards (e.g. 10H KD): "
         ).upper()
         try:
-            hole = [Card.from_string(card_str) for card_str in hole_str.split()]
-            if len(hole) != 2:
-                raise ValueError(
-                    f"Please enter exactly two cards for Player {player_number}."
-                )
-            player_holes.append(hole)
+            player_holes.append(parse_cards(hole_str, player_number))
             player_number += 1
         except ValueError as e:
             print(f"Error: {e}")
@@ -58,15 +98,8 @@ def cli() -> None:
         ranks_str = input(
             f"Enter player rank of each player's hand in the {phase} (e.g. 2 1 3): "
         )
-        hand_ranks = ranks_str.split()
         try:
-            if sorted(hand_ranks) != ["1", "2", "3"]:
-                raise ValueError("Please enter valid ranks (1, 2, 3) for each player.")
-            hand_ranks = [int(rank) for rank in hand_ranks]
-            hand_ranks = [
-                i for i, _ in sorted(enumerate(hand_ranks, start=1), key=lambda x: x[1])
-            ]
-            hand_ranks_list.append(hand_ranks)
+            hand_ranks_list.append(parse_ranks(ranks_str))
             game_phase_number += 1
         except ValueError as e:
             print(f"Error: {e}")
@@ -85,15 +118,9 @@ def cli() -> None:
         solver.print_game(maxh_table)
         color_input = input(
             "Enter color feedback for river cards (g=green, y=yellow, e=grey), e.g. g y e e g: "
-        ).lower()
-        card_colors = color_input.split()
+        )
         try:
-            if len(card_colors) != 5 or not all(
-                color in ["g", "y", "e"] for color in card_colors
-            ):
-                raise ValueError(
-                    "Please enter exactly 5 colors using 'g', 'y', or 'e'."
-                )
+            card_colors = parse_colors(color_input)
             solver.next_table_guess(card_colors)
             print(f"Possible tables remaining: {len(solver.valid_tables)}")
             is_all_green = all(color == "g" for color in card_colors)
@@ -17,14 +17,20 @@ import os
 # Use generic ARM64 target to avoid CPU-specific scheduling model bugs
 os.environ["NUMBA_CPU_NAME"] = "generic"
 
-from .card import Card, ColorCard, RANK_MIN, RANK_MAX, VALID_SUITS as SUITS
-from itertools import combinations
-from scipy.stats import entropy
-from dataclasses import dataclass
-from typing import Optional, Sequence, Iterable, Iterator
+from .card import (
+    Card,
+    ColorCard,
+    RANK_MIN,
+    RANK_MAX,
+    VALID_SUITS as SUITS,
+)
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations, repeat
+from multiprocessing import get_context
+from dataclasses import dataclass, field
+from typing import Optional, Sequence, Iterable, Iterator, TextIO
 from numba import guvectorize, int8, int16
 import numpy as np
-import polars as pl
 
 
 # Constants for hand rankings
@@ -50,6 +56,9 @@ COLOR_GREY = "e"
 COLOR_YELLOW = "y"
 COLOR_GREEN = "g"
 VALID_COLORS = [COLOR_GREY, COLOR_YELLOW, COLOR_GREEN]
+# Decimal place of each table position in a packed comparison code; the digit
+# at each place is that card's index into VALID_COLORS
+_COLOR_PLACES = np.array([10_000, 1_000, 100, 10, 1])
 
 # Number of players
 NUM_PLAYERS = 3
@@ -61,7 +70,7 @@ TURN_SIZE = 4
 RIVER_SIZE = 5
 
 
-@dataclass
+@dataclass(slots=True)
 class HandRanking:
     """Result of evaluating a poker hand.
 
@@ -76,14 +85,37 @@ class HandRanking:
         tie_breakers (tuple): Tuple of card ranks for breaking ties between hands
                              of the same type, ordered by importance
         best_hand (tuple): The 5 Card objects that form the best possible hand
+        key (int): rank and tie_breakers packed into one int that orders and
+                   compares equal exactly like the tuple (rank, tie_breakers)
     """
 
     rank: int  # Numerical rank (1=high card, 2=pair, ..., 9=straight flush)
     tie_breakers: tuple  # Tuple of ranks for tie-breaking
     best_hand: tuple  # Tuple of Card objects in the best 5-card hand
+    key: int = field(default=-1, compare=False, repr=False)
 
+    def __post_init__(self):
+        if self.key < 0:
+            self.key = HandRanking.pack_key(self.rank, self.tie_breakers)
 
-@dataclass
+    @staticmethod
+    def pack_key(rank: int, tie_breakers: tuple) -> int:
+        """Pack a hand rank and up to 5 tie-breaker ranks into one int.
+
+        Each card rank (2-14) takes 4 bits after the hand rank, with missing
+        tie-breakers left as zero, so shorter tuples still sort first.
+
+        Examples:
+            >>> HandRanking.pack_key(2, (10, 14, 9)) > HandRanking.pack_key(2, (10, 13))
+            True
+        """
+        key = rank
+        for i in range(5):
+            key = (key << 4) | (tie_breakers[i] if i < len(tie_breakers) else 0)
+        return key
+
+
+@dataclass(slots=True)
 class PhaseEvaluation:
     """Configuration for evaluating a poker game phase (flop, turn, or river).
 
@@ -95,27 +127,75 @@ class PhaseEvaluation:
         table (list): The table state to evaluate (list of Card objects)
         expected_rankings (list): Expected hand strength rankings for each player
                                  (list of 3 integers, permutation of [1, 2, 3])
-        prev_cards_used (set | None): Set of cards already used in previous phases
+        prev_cards_used (int | None): Bitmask of table cards already used in previous
+                                      phases (bit i set for card_index i)
         validate_all_cards_used (bool): Whether to check all cards are from the deck
+        prev_hand_keys (tuple | None): Per-player (suit_counts, rank_key) lookup keys for
+                                       the hole cards plus every table card but the
+                                       last, so only the new card has to be folded in
 
     Examples:
         >>> phase = PhaseEvaluation(
         ...     table=[Card(10, 'H'), Card(14, 'D'), Card(7, 'S')],
         ...     expected_rankings=[2, 1, 3],  # P2 best, P1 second, P3 worst
-        ...     prev_cards_used=set()
+        ...     prev_cards_used=0
         ... )
     """
 
     table: list
     expected_rankings: list
-    prev_cards_used: Optional[set] = None
+    prev_cards_used: Optional[int] = None
     validate_all_cards_used: bool = False
+    prev_hand_keys: Optional[tuple[tuple[int, int], ...]] = None
+
+
+# Adding 3 to each 4-bit suit counter (sums of Card._suit_count) carries into
+# the counter's top bit exactly when the suit has five or more cards
+_FLUSH_COUNT_BIAS = 0x3333
+_FLUSH_COUNT_BITS = 0x8888
+
+# Prime product of a hand's ranks -> (hand rank, tie breakers, best-hand runs,
+# packed HandRanking.key). Filled lazily by Solver.__rank_hand for hands that
+# cannot make a flush; bounded by the number of 5-7 card rank multisets.
+_RANK_PATTERNS: dict[int, tuple[int, tuple, tuple[tuple[int, int], ...], int]] = {}
+
+# (prime product << 13 | flush suit's rank bits) -> (hand rank, tie breakers,
+# best-hand ranks, packed HandRanking.key) for hands holding five or more
+# cards of one suit. Five suited cards out of seven leave no room for a full
+# house or quads, so the result only depends on these two keys.
+_FLUSH_PATTERNS: dict[int, tuple[int, tuple, tuple[int, ...], int]] = {}
 
 
 MASTER_DECK = [
-    Card(rank, suit) for rank in range(RANK_MIN, RANK_MAX + 1) for suit in SUITS
+    Card.intern(rank, suit)
+    for rank in range(RANK_MIN, RANK_MAX + 1)
+    for suit in SUITS
 ]
 
+# print_game display pieces: two-letter hand types, a background per place
+# (gold, silver, bronze) and one row of the guess history
+_HAND_RANK_SYMBOLS = {
+    HAND_RANK_HIGH_CARD: "HC",
+    HAND_RANK_PAIR: "1P",
+    HAND_RANK_TWO_PAIR: "2P",
+    HAND_RANK_THREE_KIND: "3K",
+    HAND_RANK_STRAIGHT: "St",
+    HAND_RANK_FLUSH: "Fl",
+    HAND_RANK_FULL_HOUSE: "FH",
+    HAND_RANK_FOUR_KIND: "4K",
+    HAND_RANK_STRAIGHT_FLUSH: "SF",
+}
+_PLACE_BG_COLORS = {
+    1: "\033[48;2;255;215;0m",
+    2: "\033[48;2;192;192;192m",
+    3: "\033[48;2;205;127;50m",
+}
+_RESET_COLOR = "\033[0m"
+_GUESS_ROW = "| {} {} {} | {} | {} |"
+
+# MASTER_DECK sorted by card_index, the order Solver enumerates boards in
+_DECK_BY_INDEX = sorted(MASTER_DECK, key=lambda card: card.card_index)
+
 
 class Solver:
     """Solves for valid poker table runouts given player hole cards and hand rankings.
@@ -203,18 +283,81 @@ class Solver:
         self.turn_hand_ranks = turn_hand_ranks
         self.river_hand_ranks = river_hand_ranks
 
-        self.current_deck = MASTER_DECK.copy()
         self.__valid_tables = []
         self.__maxh_table = []
+        # use_sampling value __maxh_table was computed with; None once stale
+        self.__maxh_sampling: bool | None = None
         self.__used_tables = []
+        # (valid tables the keys were built from, their card index tuples)
+        self.__valid_table_keys: tuple[list, set[tuple[int, ...]]] = ([], set())
+        # (valid tables the boards were built from, their (n, 5) card indices)
+        self.__valid_boards: tuple[list, np.ndarray] = (
+            [],
+            np.empty((0, RIVER_SIZE), dtype=np.int8),
+        )
         self.__print_maxh_table = []
         self.__current_colors = []
-        self.__compared_tables = pl.LazyFrame()
-        self.__rivers_dict = dict()
-        # Cache all hole cards set for performance (used in __evaluate_phase)
-        self.__all_hole_cards = {
-            card for hole in self.hole_cards.values() for card in hole
-        }
+        # Color code the maxh table would get against each valid table, in order
+        self.__maxh_comparison: np.ndarray | None = None
+        # Boards and used cards are tracked as 52-bit masks over card indices
+        self.__hole_mask = 0
+        for hole in self.hole_cards.values():
+            for card in hole:
+                self.__hole_mask |= 1 << card.card_index
+        # Remaining deck in card_index order, so enumeration order is stable
+        self.current_deck = [
+            card
+            for card in _DECK_BY_INDEX
+            if not (self.__hole_mask >> card.card_index) & 1
+        ]
+
+    @classmethod
+    def from_arrays(
+        cls,
+        hole_indices: np.ndarray,
+        flop_hand_ranks: np.ndarray,
+        turn_hand_ranks: np.ndarray,
+        river_hand_ranks: np.ndarray,
+    ) -> "Solver":
+        """Build a Solver from card index and hand rank arrays.
+
+        Args:
+            hole_indices (np.ndarray): The 6 hole card indices (0-51), P1's two
+                cards first, then P2's, then P3's.
+            flop_hand_ranks (np.ndarray): Expected rankings for the flop phase.
+            turn_hand_ranks (np.ndarray): Expected rankings for the turn phase.
+            river_hand_ranks (np.ndarray): Expected rankings for the river phase.
+
+        Returns:
+            Solver: Solver over the pooled Cards for those indices.
+
+        Raises:
+            ValueError: If hole_indices does not hold exactly 6 indices, or the
+                hand ranks are not permutations of 1-3.
+            IndexError: If any hole card index is outside 0-51.
+
+        Examples:
+            >>> holes = Card.indices(Card.from_string(s) for s in "QD QC 10H 2H 9H KH".split())
+            >>> solver = Solver.from_arrays(holes, [2, 1, 3], [1, 3, 2], [2, 1, 3])
+        """
+        holes = np.asarray(hole_indices)
+        if holes.shape != (NUM_PLAYERS * HOLE_CARDS_PER_PLAYER,):
+            raise ValueError(
+                f"Hole card indices must be an array of exactly {NUM_PLAYERS * HOLE_CARDS_PER_PLAYER} values."
+            )
+        p1hole, p2hole, p3hole = (
+            Card.from_indices(holes)
+            .reshape(NUM_PLAYERS, HOLE_CARDS_PER_PLAYER)
+            .tolist()
+        )
+        return cls(
+            p1hole,
+            p2hole,
+            p3hole,
+            np.asarray(flop_hand_ranks).tolist(),
+            np.asarray(turn_hand_ranks).tolist(),
+            np.asarray(river_hand_ranks).tolist(),
+        )
 
     @property
     def valid_tables(self) -> list[list[Card]]:
@@ -230,6 +373,53 @@ class Solver:
         """
         return self.__valid_tables
 
+    @property
+    def valid_boards(self) -> np.ndarray:
+        """Get the valid tables as one contiguous array of card indices.
+
+        Row i holds the card indices of ``valid_tables[i]`` in table order. The
+        array is rebuilt whenever the valid tables are replaced, and filtered
+        alongside them by next_table_guess(), so treat it as read-only.
+
+        Returns:
+            np.ndarray: (n, 5) int8 array of card indices (0-51).
+
+        Examples:
+            >>> solver.solve()
+            >>> solver.valid_boards.shape
+            (412, 5)
+        """
+        tables, boards = self.__valid_boards
+        if tables is not self.__valid_tables:
+            tables = self.__valid_tables
+            boards = Card.indices(card for table in tables for card in table).reshape(
+                -1, RIVER_SIZE
+            )
+            self.__valid_boards = (tables, boards)
+        return boards
+
+    def is_valid_table(self, table: Sequence[Card | None]) -> bool:
+        """Check whether a table, in this exact card order, is still valid.
+
+        Equivalent to ``table in solver.valid_tables`` but a set lookup. The
+        set of card index tuples is rebuilt whenever the valid tables are
+        replaced.
+
+        Args:
+            table (Sequence[Card | None]): Table to look up.
+
+        Returns:
+            bool: True if the table is one of the valid tables.
+        """
+        tables, keys = self.__valid_table_keys
+        if tables is not self.__valid_tables:
+            tables = self.__valid_tables
+            keys = {tuple(card._card_index for card in t) for t in tables}
+            self.__valid_table_keys = (tables, keys)
+        if any(not isinstance(card, Card) for card in table):
+            return False
+        return tuple(card._card_index for card in table) in keys
+
     @staticmethod
     def __rank_hand(table: list[Card], hole: list[Card]) -> HandRanking:
         """Evaluate the best 5-card poker hand from hole cards and table cards.
@@ -254,7 +444,89 @@ class Solver:
             (14,)  # Ace-high
         """
         cards = hole + list(table)
+        return Solver.__rank_keyed_hand(cards, *Solver.__hand_keys(cards))
 
+    @staticmethod
+    def __hand_keys(cards: list[Card]) -> tuple[int, int]:
+        """Compute the (suit_counts, rank_key) lookup keys for a set of cards.
+
+        One pass for both: the per-suit card counts for flush detection and the
+        prime product identifying the multiset of ranks. Adding a card later is
+        just ``suit_counts + card._suit_count`` and ``rank_key * card._prime``.
+        """
+        suit_counts = 0
+        rank_key = 1
+        for card in cards:
+            suit_counts += card._suit_count
+            rank_key *= card._prime
+        return suit_counts, rank_key
+
+    @staticmethod
+    def __rank_keyed_hand(
+        cards: list[Card], suit_counts: int, rank_key: int
+    ) -> HandRanking:
+        """Rank cards whose lookup keys from __hand_keys are already known."""
+        flush_bit = (suit_counts + _FLUSH_COUNT_BIAS) & _FLUSH_COUNT_BITS
+        if flush_bit:
+            # Flushes depend on suits, so they use their own lookup keyed on
+            # the flush suit's ranks as well as the rank multiset. At most
+            # seven cards means only one suit can have five.
+            flush_suit = flush_bit.bit_length() // 4 - 1
+            suited = {
+                card._rank: card for card in cards if card._card_index & 3 == flush_suit
+            }
+            lane = 0
+            for card in suited.values():
+                lane |= card._rank_bit
+            flush_key = (rank_key << 13) | lane
+            pattern = _FLUSH_PATTERNS.get(flush_key)
+            if pattern is None:
+                ranking = Solver.__evaluate_hand(cards)
+                _FLUSH_PATTERNS[flush_key] = (
+                    ranking.rank,
+                    ranking.tie_breakers,
+                    tuple(card._rank for card in ranking.best_hand),
+                    ranking.key,
+                )
+                return ranking
+
+            hand_rank, tie_breakers, ranks, key = pattern
+            best_hand = tuple(suited[rank] for rank in ranks)
+            return HandRanking(hand_rank, tie_breakers, best_hand, key)
+
+        pattern = _RANK_PATTERNS.get(rank_key)
+        if pattern is None:
+            ranking = Solver.__evaluate_hand(cards)
+            # Without a flush the result only depends on the ranks; record the
+            # best hand as (rank, count) runs so it can be rebuilt from any
+            # cards with the same ranks
+            runs = []
+            for card in ranking.best_hand:
+                if runs and runs[-1][0] == card._rank:
+                    runs[-1][1] += 1
+                else:
+                    runs.append([card._rank, 1])
+            _RANK_PATTERNS[rank_key] = (
+                ranking.rank,
+                ranking.tie_breakers,
+                tuple((rank, count) for rank, count in runs),
+                ranking.key,
+            )
+            return ranking
+
+        hand_rank, tie_breakers, runs, key = pattern
+        best_hand = []
+        for rank, count in runs:
+            best_hand.extend([card for card in cards if card._rank == rank][:count])
+        return HandRanking(hand_rank, tie_breakers, tuple(best_hand), key)
+
+    @staticmethod
+    def __evaluate_hand(cards: list[Card]) -> HandRanking:
+        """Evaluate the best 5-card poker hand from 5-7 cards, hole cards first.
+
+        Full evaluation behind __rank_hand, used for flush-capable hands and
+        the first time each multiset of ranks is seen.
+        """
         # Count occurrences of each rank and group cards by suit in single pass
         rank_groups = {}
         suit_groups = {}
@@ -439,17 +711,13 @@ class Solver:
             tuple([best_hand[0]]),
         )
 
-    def __possible_flops(self) -> Iterator[tuple[list[Card], set[Card]]]:
+    def __possible_flops(self) -> Iterator[tuple[list[Card], int]]:
         """Find all possible flops that maintain the current player rankings.
 
         Yields:
-            tuple: (table, cards_used_in_hands) where cards_used_in_hands
-                  is a set of table cards used in any player's best hand at the flop.
+            tuple: (table, cards_used_in_hands) where cards_used_in_hands is a
+                  bitmask of table cards used in any player's best hand at the flop.
         """
-        hole_cards = {card for hole in self.hole_cards.values() for card in hole}
-        remaining_cards = set(self.current_deck).difference(hole_cards)
-        self.current_deck = list(remaining_cards)
-
         all_flops = combinations(self.current_deck, FLOP_SIZE)
 
         for flop in all_flops:
@@ -463,7 +731,7 @@ class Solver:
             if is_valid:
                 yield (flop_table, cards_used)
 
-    def __evaluate_phase(self, phase_eval: PhaseEvaluation) -> tuple[bool, set[Card]]:
+    def __evaluate_phase(self, phase_eval: PhaseEvaluation) -> tuple[bool, int]:
         """Helper method to evaluate hands for all players at a given phase.
 
         Args:
@@ -472,47 +740,46 @@ class Solver:
 
         Returns:
             tuple: (is_valid, cards_used_accumulated) where is_valid indicates if this table
-                   matches expected rankings, and cards_used_accumulated is the set of all
-                   cards used across phases.
+                   matches expected rankings, and cards_used_accumulated is the bitmask of
+                   all table cards used across phases.
         """
-        # Use cached hole cards set instead of recreating 412K times
-        all_hole_cards = self.__all_hole_cards
-
-        # Rank hands and collect results incrementally with early rejection
-        current_player_ranks = []
-        cards_used_current_phase = set()
-
-        # Track min/max ranks seen so far for early rejection
-        min_rank_seen = float("inf")
-        max_rank_seen = float("-inf")
-
-        for player, hole in self.hole_cards.items():
-            # Compute hand rank for this player
-            player_hand = Solver.__rank_hand(phase_eval.table, hole)
-            rank = player_hand.rank
-            tie_breakers = player_hand.tie_breakers
-
-            current_player_ranks.append(
-                (player, rank, tie_breakers, player_hand.best_hand)
-            )
-
-            # Early rejection: Check if we can already determine there will be ties
-            # If we've seen 2 players and they have identical (rank, tie_breakers), reject immediately
-            if len(current_player_ranks) >= 2:
-                # Check if current player ties with any previous player
-                current_comparator = (rank, tie_breakers)
-                for prev_player in current_player_ranks[:-1]:
-                    if (prev_player[1], prev_player[2]) == current_comparator:
-                        # Found a tie - reject immediately without evaluating remaining players
-                        return False, set()
-
-            # Track rank range for additional early rejection opportunities
-            min_rank_seen = min(min_rank_seen, rank)
-            max_rank_seen = max(max_rank_seen, rank)
+        expected_rankings = phase_eval.expected_rankings
+        # (expected place, HandRanking.key) for each player ranked so far
+        ranked_players = []
+        cards_used_current_phase = 0
+
+        table = phase_eval.table
+        prev_hand_keys = phase_eval.prev_hand_keys
+        new_card = table[-1]
+
+        for player_idx, (player, hole) in enumerate(self.hole_cards.items()):
+            if prev_hand_keys is None:
+                player_hand = Solver.__rank_hand(table, hole)
+            else:
+                # Only the newest table card is missing from the cached keys
+                suit_counts, rank_key = prev_hand_keys[player_idx]
+                player_hand = Solver.__rank_keyed_hand(
+                    hole + table,
+                    suit_counts + new_card._suit_count,
+                    rank_key * new_card._prime,
+                )
+            comparator = player_hand.key
+            place = expected_rankings.index(int(player[1]))
+
+            # Early rejection: as soon as this player ties with, or lands on the
+            # wrong side of, an earlier player the table can't match, so the
+            # remaining players are never ranked
+            for prev_place, prev_comparator in ranked_players:
+                if comparator == prev_comparator or (comparator > prev_comparator) != (
+                    place < prev_place
+                ):
+                    return False, 0
+            ranked_players.append((place, comparator))
 
             # Collect cards used in current phase (exclude flush hands)
-            if rank != HAND_RANK_FLUSH:  # Not a flush
-                cards_used_current_phase.update(set(player_hand.best_hand))
+            if player_hand.rank != HAND_RANK_FLUSH:  # Not a flush
+                for card in player_hand.best_hand:
+                    cards_used_current_phase |= 1 << card._card_index
 
         # Accumulate cards used across all phases
         if phase_eval.prev_cards_used is not None:
@@ -522,31 +789,25 @@ class Solver:
         else:
             cards_used_accumulated = cards_used_current_phase
 
-        cards_used_accumulated.difference_update(all_hole_cards)
+        cards_used_accumulated &= ~self.__hole_mask
 
         # For river, validate that all table cards were used at some point
-        if phase_eval.validate_all_cards_used and cards_used_accumulated != set(
-            phase_eval.table
-        ):
-            return False, cards_used_accumulated
-
-        # Sort by rank and tie breakers
-        current_player_ranks.sort(reverse=True, key=lambda x: (x[1], x[2]))
-
-        # Map player names to their rankings (1=best, 2=second, 3=third)
-        current_player_ranks_comparable = [
-            int(player[0][1]) for player in current_player_ranks
-        ]
+        if phase_eval.validate_all_cards_used:
+            table_mask = 0
+            for card in phase_eval.table:
+                table_mask |= 1 << card._card_index
+            if cards_used_accumulated != table_mask:
+                return False, cards_used_accumulated
 
-        is_valid = current_player_ranks_comparable == phase_eval.expected_rankings
-        return is_valid, cards_used_accumulated
+        # Every pair of players is in its expected order, so the table matches
+        return True, cards_used_accumulated
 
     def __find_valid_next_phase(
         self,
-        prev_phase_results: Iterable[tuple[list[Card], set[Card]]],
+        prev_phase_results: Iterable[tuple[list[Card], int]],
         expected_rankings: list[int],
         validate_all_cards_used: bool = False,
-    ) -> Iterator[tuple[list[Card], set[Card]]]:
+    ) -> Iterator[tuple[list[Card], int]]:
         """Helper method to find valid tables for the next phase (turn or river).
 
         Args:
@@ -558,9 +819,19 @@ class Solver:
             tuple: (table, cards_used_accumulated) for valid combinations.
         """
         for prev_table, prev_cards_used in prev_phase_results:
-            remaining_deck = set(self.current_deck) - set(prev_table)
+            prev_table_mask = 0
+            for card in prev_table:
+                prev_table_mask |= 1 << card._card_index
+            # Every candidate extends the same table, so key each player's
+            # cards once and fold in just the next card per candidate
+            prev_hand_keys = tuple(
+                Solver.__hand_keys(hole + prev_table)
+                for hole in self.hole_cards.values()
+            )
 
-            for next_card in remaining_deck:
+            for next_card in self.current_deck:
+                if (prev_table_mask >> next_card._card_index) & 1:
+                    continue
                 next_table = prev_table + [next_card]
 
                 phase_eval = PhaseEvaluation(
@@ -568,6 +839,7 @@ class Solver:
                     expected_rankings=expected_rankings,
                     prev_cards_used=prev_cards_used,
                     validate_all_cards_used=validate_all_cards_used,
+                    prev_hand_keys=prev_hand_keys,
                 )
                 is_valid, cards_used = self.__evaluate_phase(phase_eval)
 
@@ -575,8 +847,8 @@ class Solver:
                     yield (next_table, cards_used)
 
     def __possible_turns(
-        self, flops: Iterable[tuple[list[Card], set[Card]]]
-    ) -> Iterator[tuple[list[Card], set[Card]]]:
+        self, flops: Iterable[tuple[list[Card], int]]
+    ) -> Iterator[tuple[list[Card], int]]:
         """Find all possible turns that maintain the current player rankings.
 
         Args:
@@ -588,8 +860,8 @@ class Solver:
         return self.__find_valid_next_phase(flops, self.turn_hand_ranks)
 
     def __possible_rivers(
-        self, turns: Iterable[tuple[list[Card], set[Card]]]
-    ) -> Iterator[tuple[list[Card], set[Card]]]:
+        self, turns: Iterable[tuple[list[Card], int]]
+    ) -> Iterator[tuple[list[Card], int]]:
         """Find all possible rivers that maintain the current player rankings.
 
         Args:
@@ -607,6 +879,7 @@ class Solver:
         [(int8[:, :], int8[:, :], int16[:])],  # type signature: 2D inputs, 1D output
         "(n,m),(n,m)->(n)",  # shape signature: batch processing
         nopython=True,
+        cache=True,  # reuse the compiled kernel across interpreter sessions
     )
     def __compare_tables(guess_indices, answer_indices, result):
         """Compare batches of poker tables and return color-coded results.
@@ -670,6 +943,29 @@ class Solver:
 
             result[table_idx] = result_value
 
+    @staticmethod
+    def compare_colors(guess: Sequence[Card], answer: Sequence[Card]) -> np.ndarray:
+        """Get the color feedback a guess would receive against an answer table.
+
+        Args:
+            guess (Sequence[Card]): The guessed table (5 Card objects).
+            answer (Sequence[Card]): The answer table (5 Card objects).
+
+        Returns:
+            np.ndarray: int8 array of 5 color codes indexing VALID_COLORS
+                        (0 = grey, 1 = yellow, 2 = green), which
+                        next_table_guess() accepts directly.
+
+        Examples:
+            >>> Solver.compare_colors(table, table)
+            array([2, 2, 2, 2, 2], dtype=int8)
+        """
+        code = Solver.__compare_tables(  # type: ignore
+            Card.indices(guess).reshape(1, RIVER_SIZE),
+            Card.indices(answer).reshape(1, RIVER_SIZE),
+        )[0]
+        return (int(code) // _COLOR_PLACES % 10).astype(np.int8)
+
     def __organize_flop(self, table: list[Card]) -> list[Card | None]:
         """
         Organize flop cards based on matching priority with the previous table.
@@ -756,6 +1052,9 @@ class Solver:
         Args:
             use_sampling (bool): Force sampling on/off. Defaults to True.
 
+        The result is cached until solve() or next_table_guess() changes the
+        valid tables, so repeated calls only redo the flop ordering.
+
         Returns:
             Sequence[Card | None]: The river with the highest entropy. May contain None values.
         """
@@ -763,89 +1062,68 @@ class Solver:
         if not getattr(self, "_Solver__valid_tables", None):
             raise ValueError("No possible rivers calculated. Please run solve() first.")
 
-        rivers = self.__valid_tables
+        if self.__maxh_sampling != use_sampling:
+            self.__maxh_table = self.__max_entropy_table(use_sampling)
+            self.__maxh_sampling = use_sampling
 
-        rivers_str = [" ".join(str(card) for card in river) for river in rivers]
-        rivers_index = [[card.card_index for card in river] for river in rivers]
+        if self.__used_tables:
+            self.__print_maxh_table = self.__organize_flop(self.__maxh_table)
+        else:
+            self.__print_maxh_table = self.__maxh_table.copy()
 
-        self.__rivers_dict = dict(zip(rivers_str, rivers))
+        return self.__print_maxh_table
 
-        rivers_df = pl.DataFrame(
-            {"rivers_str": rivers_str, "rivers_index": rivers_index},
-            schema={"rivers_str": pl.Utf8, "rivers_index": pl.Array(pl.Int8, 5)},
-        )
-        rivers_lf = rivers_df.lazy()
+    def __max_entropy_table(self, use_sampling: bool) -> list[Card]:
+        """Score every valid table by the entropy of its color outcomes.
 
-        if use_sampling and len(rivers) > 50:
-            sampled_rivers_lf = rivers_df.sample(n=50, with_replacement=False).lazy()
-            self.__compared_tables = sampled_rivers_lf.join(
-                rivers_lf, how="cross", suffix="_answer"
-            )
-        else:
-            self.__compared_tables = rivers_lf.join(
-                rivers_lf, how="cross", suffix="_answer"
-            )
+        Also stores the winning guess's color codes against every valid table,
+        which next_table_guess() filters on.
 
-        # For Array columns, we need to convert to numpy arrays for guvectorize
-        self.__compared_tables = self.__compared_tables.with_columns(
-            pl.struct(["rivers_index", "rivers_index_answer"])
-            .map_batches(
-                lambda batch: pl.Series(
-                    "comparison",
-                    Solver.__compare_tables(  # type: ignore
-                        batch.struct.field("rivers_index")
-                        .to_numpy()
-                        .reshape(-1, 5)
-                        .astype(np.int8),
-                        batch.struct.field("rivers_index_answer")
-                        .to_numpy()
-                        .reshape(-1, 5)
-                        .astype(np.int8),
-                    ),
-                ),
-                return_dtype=pl.Int16,
+        Returns:
+            list[Card]: The valid table with the highest entropy.
+        """
+
+        rivers = self.__valid_tables
+        n_rivers = len(rivers)
+
+        # One contiguous (n, 5) int8 block of card indices for the compare kernel
+        rivers_index = self.valid_boards
+
+        if use_sampling and n_rivers > 50:
+            guess_rows = np.sort(
+                np.random.default_rng().choice(n_rivers, size=50, replace=False)
             )
-            .alias("comparison")
-        )
+        else:
+            guess_rows = np.arange(n_rivers)
 
-        # Groups by guess river string and aggregates comparison results into lists
-        rivers_grouped = self.__compared_tables.group_by("rivers_str").agg(
-            pl.col("comparison").alias("comparison_list")
+        # Cross join in guess-major order: each guess against every answer
+        guess_idx = np.repeat(guess_rows, n_rivers)
+        answer_idx = np.tile(np.arange(n_rivers), len(guess_rows))
+        comparison = Solver.__compare_tables(  # type: ignore
+            rivers_index[guess_idx], rivers_index[answer_idx]
         )
 
-        # Calculate probabilities of each comparison result
-        rivers_grouped = rivers_grouped.with_columns(
-            pl.col("comparison_list")
-            .list.eval(
-                pl.element().value_counts(normalize=True).struct.field("proportion")
-            )
-            .list.eval(
-                pl.element().map_batches(
-                    lambda s: entropy(s, base=2),
-                    returns_scalar=True,
-                    return_dtype=pl.Float64,
-                )
-            )
-            .list.first()
-            .alias("entropy")
+        # Count each (guess, color code) pair; codes are at most 22222, so
+        # they fit in the low 15 bits next to the guess position
+        guess_pos = np.repeat(np.arange(len(guess_rows), dtype=np.int64), n_rivers)
+        outcomes, counts = np.unique(
+            (guess_pos << 15) | comparison, return_counts=True
         )
-        entropy_df = rivers_grouped.select(["rivers_str", "entropy"]).collect()
-        max_entropy_river = (
-            entropy_df.filter(pl.col("entropy") == pl.col("entropy").max())
-            .select("rivers_str")
-            .row(0)[0]
+        # Every guess is compared against all n_rivers answers
+        proportions = counts / n_rivers
+        entropy = -np.bincount(
+            outcomes >> 15,
+            weights=proportions * np.log2(proportions),
+            minlength=len(guess_rows),
         )
 
-        self.__maxh_table = self.__rivers_dict[max_entropy_river]
-
-        if self.__used_tables:
-            self.__print_maxh_table = self.__organize_flop(self.__maxh_table)
-        else:
-            self.__print_maxh_table = self.__maxh_table.copy()
-
-        return self.__print_maxh_table
+        best = int(np.argmax(entropy))
+        self.__maxh_comparison = comparison.reshape(len(guess_rows), n_rivers)[best]
+        return rivers[guess_rows[best]]
 
-    def next_table_guess(self, table_colors: list[str]) -> list[list[Card]]:
+    def next_table_guess(
+        self, table_colors: list[str] | np.ndarray
+    ) -> list[list[Card]]:
         """Filter valid rivers based on color feedback from the current guess.
 
         Updates the internal list of valid rivers to only include those that
@@ -853,9 +1131,10 @@ class Solver:
         used in the interactive guessing loop.
 
         Args:
-            table_colors (list): List of 5 color strings for each card:
-                                'g' = green, 'y' = yellow, 'e' = grey.
-            current_guess (list, optional): The table being guessed (5 cards). Defaults to maxh_table.
+            table_colors (list | np.ndarray): List of 5 color strings for each card:
+                                'g' = green, 'y' = yellow, 'e' = grey. An integer
+                                array of color codes from compare_colors() is
+                                accepted as well.
 
         Returns:
             list: Filtered list of valid rivers matching the color feedback.
@@ -871,6 +1150,18 @@ class Solver:
             >>> len(remaining)
             87
         """
+        if isinstance(table_colors, np.ndarray):
+            # Color codes from compare_colors(); map them to color strings
+            if (
+                table_colors.shape != (RIVER_SIZE,)
+                or not np.issubdtype(table_colors.dtype, np.integer)
+                or not np.isin(table_colors, (0, 1, 2)).all()
+            ):
+                raise ValueError(
+                    f"Color codes must be an array of {RIVER_SIZE} values in 0-2."
+                )
+            table_colors = [VALID_COLORS[code] for code in table_colors.tolist()]
+
         # Validate state
 
         if not self.__maxh_table:
@@ -891,32 +1182,14 @@ class Solver:
                 f"Table colors must be a list of {RIVER_SIZE} colors for each card in the table."
             )
 
-        # Validate internal compared tables before filtering
-        # Use explicit `is None` check to avoid evaluating a LazyFrame in boolean context
-        if getattr(self, "_Solver__compared_tables", None) is None:
+        # Validate the stored comparisons before filtering
+        if self.__maxh_comparison is None or len(self.__maxh_comparison) != len(
+            self.__valid_tables
+        ):
             raise ValueError(
                 "Comparison table not initialized. Call get_maxh_table() before next_table_guess()."
             )
 
-        comp_tables = self.__compared_tables
-        if not isinstance(comp_tables, pl.LazyFrame):
-            raise TypeError("Internal __compared_tables must be a polars LazyFrame.")
-
-        # Safely obtain column names; collecting a LazyFrame is used only as a fallback
-        try:
-            # Use collect_schema().names() to read column names without full collection
-            cols = comp_tables.collect_schema().names()
-        except Exception:
-            # Fallback: collect the frame and read columns (more expensive)
-            cols = list(comp_tables.collect().columns)
-
-        required_cols = {"rivers_str", "comparison", "rivers_str_answer"}
-        missing = required_cols - set(cols)
-        if missing:
-            raise ValueError(
-                f"__compared_tables missing required columns: {sorted(missing)}"
-            )
-
         self.__current_colors = table_colors.copy()
 
         # reorder the colors to match the internal representation
@@ -931,31 +1204,33 @@ class Solver:
             place_multiplier //= 10
             result_value += color_int_dict[color] * place_multiplier
 
-        guess_str = " ".join(str(card) for card in current_guess)
-
-        compared_tables = self.__compared_tables.filter(
-            (pl.col("rivers_str") == guess_str) & (pl.col("comparison") == result_value)
-        )
-        if not compared_tables.limit(1).collect().height == 0:
-            self.__compared_tables = compared_tables
-            valid_tables_df = self.__compared_tables.select(
-                ["rivers_str_answer"]
-            ).collect()
-            valid_tables_str = pl.Series(valid_tables_df).to_list()
-            self.__valid_tables = [self.__rivers_dict[r] for r in valid_tables_str]
-        else:
+        # One vectorized pass over the guess's color code against every table
+        matches = np.flatnonzero(self.__maxh_comparison == result_value)
+        if not len(matches):
+            guess_str = " ".join(str(card) for card in current_guess)
             raise ValueError(
                 f"No rivers match colors={table_colors!r} for guess={guess_str!r}."
             )
+        # Keep the boards and codes aligned with the remaining tables
+        boards = self.valid_boards[matches]
+        self.__valid_tables = [self.__valid_tables[i] for i in matches]
+        self.__valid_boards = (self.__valid_tables, boards)
+        self.__maxh_comparison = self.__maxh_comparison[matches]
+        self.__maxh_sampling = None
         return self.__valid_tables
 
-    def solve(self) -> list[list[Card]]:
+    def solve(self, workers: int = 1) -> list[list[Card]]:
         """Find all possible table runouts that maintain the expected hand rankings.
 
         Searches exhaustively through all possible flop/turn/river combinations
         to find tables that match the expected rankings at each phase. This is
         the primary method to call after initializing the Solver.
 
+        Args:
+            workers (int): Number of processes to split the valid flops across
+                           when searching turns and rivers. Tables come back in the
+                           same order either way. Defaults to 1 (no subprocesses).
+
         Returns:
             list: List of valid tables (list[Card] with 5 cards each).
 
@@ -966,14 +1241,60 @@ class Solver:
             412
         """
         flops = self.__possible_flops()
-        turns = self.__possible_turns(flops)
-        river_results = list(self.__possible_rivers(turns))
+        if workers > 1:
+            river_results = self.__solve_in_processes(list(flops), workers)
+        else:
+            turns = self.__possible_turns(flops)
+            river_results = list(self.__possible_rivers(turns))
 
         # Extract just the tables (drop the cards_used metadata)
         self.__valid_tables = [table for table, _ in river_results]
+        self.__maxh_sampling = None
 
         return self.__valid_tables
 
+    def __solve_in_processes(
+        self, flops: list[tuple[list[Card], int]], workers: int
+    ) -> list[tuple[list[Card], int]]:
+        """Search turns and rivers for contiguous chunks of flops in subprocesses.
+
+        Each flop's runouts are independent of every other flop, so chunks are
+        solved separately and concatenated in flop order.
+        """
+        if not flops:
+            # Nothing to split, and a zero chunk size would break range()
+            return []
+        solver_args = (
+            self.hole_cards["P1"],
+            self.hole_cards["P2"],
+            self.hole_cards["P3"],
+            self.flop_hand_ranks,
+            self.turn_hand_ranks,
+            self.river_hand_ranks,
+        )
+        chunk_size = -(-len(flops) // workers)
+        chunks = [
+            flops[start : start + chunk_size]
+            for start in range(0, len(flops), chunk_size)
+        ]
+        # spawn rather than fork: numba keeps threads that fork can deadlock
+        with ProcessPoolExecutor(
+            max_workers=workers, mp_context=get_context("spawn")
+        ) as executor:
+            chunk_results = executor.map(
+                _solve_flop_chunk,
+                repeat(solver_args),
+                repeat(self.current_deck),
+                chunks,
+            )
+            return [result for results in chunk_results for result in results]
+
+    def _find_runouts(
+        self, flops: Iterable[tuple[list[Card], int]]
+    ) -> list[tuple[list[Card], int]]:
+        """Find valid rivers reachable from the given flops (subprocess entry)."""
+        return list(self.__possible_rivers(self.__possible_turns(flops)))
+
     @staticmethod
     def __player_hand_place(hand_ranks: list[int]) -> list[int]:
         """Convert list of player hands ordered by hand strength to a list of places for each player.
@@ -995,7 +1316,7 @@ class Solver:
         enum_rankings.sort(key=lambda x: x[1])  # Sort by player number
         return [place for place, _ in enum_rankings]
 
-    def print_game(self, table: list[Card]) -> None:
+    def print_game(self, table: list[Card], file: Optional[TextIO] = None) -> None:
         """Print a formatted game state display with hand rankings and table cards.
 
         Shows player hole cards, hand strengths at each phase (flop/turn/river),
@@ -1004,7 +1325,8 @@ class Solver:
 
         Args:
             table (list): The table to display (list of 5 Card objects).
-            is_win (bool, optional): Whether this is the final winning guess. Defaults to False.
+            file (TextIO, optional): Stream to write the display to. Defaults to
+                None, which writes to the current sys.stdout.
 
         Raises:
             ValueError: If solve() hasn't been called, table is invalid, or not in valid_tables.
@@ -1023,107 +1345,34 @@ class Solver:
         if not isinstance(table, list) or len(table) != RIVER_SIZE:
             raise ValueError(f"Table must be a list of {RIVER_SIZE} Card objects.")
 
-        hand_rank_symbols = {
-            HAND_RANK_HIGH_CARD: "HC",
-            HAND_RANK_PAIR: "1P",
-            HAND_RANK_TWO_PAIR: "2P",
-            HAND_RANK_THREE_KIND: "3K",
-            HAND_RANK_STRAIGHT: "St",
-            HAND_RANK_FLUSH: "Fl",
-            HAND_RANK_FULL_HOUSE: "FH",
-            HAND_RANK_FOUR_KIND: "4K",
-            HAND_RANK_STRAIGHT_FLUSH: "SF",
-        }
-
-        # Format hole cards
-        p1_0 = self.hole_cards["P1"][0].pstr().ljust(3)
-        p2_0 = self.hole_cards["P2"][0].pstr().ljust(3)
-        p3_0 = self.hole_cards["P3"][0].pstr().ljust(3)
-        p1_1 = self.hole_cards["P1"][1].pstr().ljust(3)
-        p2_1 = self.hole_cards["P2"][1].pstr().ljust(3)
-        p3_1 = self.hole_cards["P3"][1].pstr().ljust(3)
-
-        # Calculate hand ranks for flop
-        flop_table = table[:FLOP_SIZE]
-        p1_flop = (
-            hand_rank_symbols[
-                Solver.__rank_hand(flop_table, self.hole_cards["P1"]).rank
-            ]
-            + "\033[0m"
-        )
-        p2_flop = (
-            hand_rank_symbols[
-                Solver.__rank_hand(flop_table, self.hole_cards["P2"]).rank
-            ]
-            + "\033[0m"
-        )
-        p3_flop = (
-            hand_rank_symbols[
-                Solver.__rank_hand(flop_table, self.hole_cards["P3"]).rank
-            ]
-            + "\033[0m"
-        )
-
-        # Calculate hand ranks for turn
-        turn_table = table[:TURN_SIZE]
-        p1_turn = (
-            hand_rank_symbols[
-                Solver.__rank_hand(turn_table, self.hole_cards["P1"]).rank
-            ]
-            + "\033[0m"
-        )
-        p2_turn = (
-            hand_rank_symbols[
-                Solver.__rank_hand(turn_table, self.hole_cards["P2"]).rank
-            ]
-            + "\033[0m"
-        )
-        p3_turn = (
-            hand_rank_symbols[
-                Solver.__rank_hand(turn_table, self.hole_cards["P3"]).rank
+        holes = [self.hole_cards[player] for player in ("P1", "P2", "P3")]
+
+        # Build the whole display first and print it in one write
+        lines = [
+            "Pokle Solver Results",
+            "              P1   P2   P3",
+            "             ---  ---  ---",
+            *(
+                "             " + "  ".join(hole[i].pstr().ljust(3) for hole in holes)
+                for i in range(HOLE_CARDS_PER_PLAYER)
+            ),
+            "      ------ ---  ---  ---",
+        ]
+        # One row per phase: each player's hand type on their place's background
+        for phase, size, hand_ranks in (
+            ("flop", FLOP_SIZE, self.flop_hand_ranks),
+            ("turn", TURN_SIZE, self.turn_hand_ranks),
+            ("river", RIVER_SIZE, self.river_hand_ranks),
+        ):
+            places = Solver.__player_hand_place(hand_ranks)
+            phase_table = table[:size]
+            cells = [
+                _PLACE_BG_COLORS[place]
+                + _HAND_RANK_SYMBOLS[Solver.__rank_hand(phase_table, hole).rank]
+                + _RESET_COLOR
+                for hole, place in zip(holes, places)
             ]
-            + "\033[0m"
-        )
-
-        # Calculate hand ranks for river (full table)
-        p1_river = (
-            hand_rank_symbols[Solver.__rank_hand(table, self.hole_cards["P1"]).rank]
-            + "\033[0m"
-        )
-        p2_river = (
-            hand_rank_symbols[Solver.__rank_hand(table, self.hole_cards["P2"]).rank]
-            + "\033[0m"
-        )
-        p3_river = (
-            hand_rank_symbols[Solver.__rank_hand(table, self.hole_cards["P3"]).rank]
-            + "\033[0m"
-        )
-
-        # Format table cards for display
-        flop_places = Solver.__player_hand_place(self.flop_hand_ranks)
-        turn_places = Solver.__player_hand_place(self.turn_hand_ranks)
-        river_places = Solver.__player_hand_place(self.river_hand_ranks)
-        bg_colors = {
-            1: "\033[48;2;255;215;0m",
-            2: "\033[48;2;192;192;192m",
-            3: "\033[48;2;205;127;50m",
-        }
-
-        print("Pokle Solver Results")
-        print("              P1   P2   P3")
-        print("             ---  ---  ---")
-        print(f"             {p1_0}  {p2_0}  {p3_0}")
-        print(f"             {p1_1}  {p2_1}  {p3_1}")
-        print("      ------ ---  ---  ---")
-        print(
-            f"       flop:  {bg_colors[flop_places[0]]}{p1_flop}   {bg_colors[flop_places[1]]}{p2_flop}   {bg_colors[flop_places[2]]}{p3_flop}"
-        )
-        print(
-            f"       turn:  {bg_colors[turn_places[0]]}{p1_turn}   {bg_colors[turn_places[1]]}{p2_turn}   {bg_colors[turn_places[2]]}{p3_turn}"
-        )
-        print(
-            f"      river:  {bg_colors[river_places[0]]}{p1_river}   {bg_colors[river_places[1]]}{p2_river}   {bg_colors[river_places[2]]}{p3_river}"
-        )
+            lines.append(f"{phase + ':':>12}  " + "   ".join(cells))
 
         if self.__used_tables and self.__current_colors:
             self.__used_tables[-1] = [
@@ -1139,12 +1388,22 @@ class Solver:
         else:
             congratulate_user = f"Solved in {len(self.__used_tables)} Guesses! \n"
 
-        print("|-----flop----|-turn|river|")
-        for t in self.__used_tables:
-            c_flop_cards = [card.pstr().ljust(3) for card in t[:FLOP_SIZE]]
-            c_turn_card = t[FLOP_SIZE].pstr().ljust(3)
-            c_river_card = t[TURN_SIZE].pstr().ljust(3)
-            print(
-                f"| {c_flop_cards[0]} {c_flop_cards[1]} {c_flop_cards[2]} | {c_turn_card} | {c_river_card} |"
-            )
-        print(congratulate_user)
+        lines.append("|-----flop----|-turn|river|")
+        lines.extend(
+            _GUESS_ROW.format(*(card.pstr().ljust(3) for card in t))
+            for t in self.__used_tables
+        )
+        lines.append(congratulate_user)
+        print("\n".join(lines), file=file)
+
+
+def _solve_flop_chunk(
+    solver_args: tuple, deck: list[Card], flops: list[tuple[list[Card], int]]
+) -> list[tuple[list[Card], int]]:
+    """Find the valid rivers for a chunk of flops in a worker process.
+
+    Module-level so it can be pickled for ProcessPoolExecutor.
+    """
+    solver = Solver(*solver_args)
+    solver.current_deck = deck
+    return solver._find_runouts(flops)
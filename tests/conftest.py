@@ -1,12 +1,253 @@
 """Pytest configuration for pokle_solver tests.
 
-Adds the src directory to sys.path so tests can import the package
-without requiring installation.
+Provides shared fixtures. The src directory is put on sys.path by the
+``pythonpath`` pytest option in pyproject.toml, so tests can import the
+package without requiring installation.
 """
 
-import sys
+import copy
+import hashlib
+import io
+import os
+from collections import deque
 from pathlib import Path
 
-# Add src directory to Python path for testing without installation
+import numpy as np
+import pytest
+
+from pokle_solver.card import RANK_PRIMES, Card
+from pokle_solver.solver import Solver
+
 src_path = Path(__file__).parent.parent / "src"
-sys.path.insert(0, str(src_path))
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="also run tests marked slow (the large regression scenarios)",
+    )
+
+
+def pytest_configure(config):
+    """Run benchmark bodies once as plain tests unless benchmarks are requested.
+
+    Benchmarks run with --benchmark-enable or --benchmark-only.
+    """
+    if not config.pluginmanager.hasplugin("benchmark"):
+        return
+    if not (config.getoption("benchmark_enable") or config.getoption("benchmark_only")):
+        config.option.benchmark_disable = True
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked slow unless --run-slow was given."""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow regression scenario; use --run-slow")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+# Canned answers for input(); shared by every test that uses cli_inputs.
+_INPUT_QUEUE = deque()
+
+
+def _fake_input(_prompt):
+    return _INPUT_QUEUE.popleft()
+
+
+@pytest.fixture
+def cli_inputs(monkeypatch):
+    """Queue of canned answers for input(), consumed in order.
+
+    Tests extend the returned deque before calling the CLI. The queue is
+    emptied at the start of each test, so leftovers never leak between tests.
+    """
+    _INPUT_QUEUE.clear()
+    monkeypatch.setattr("builtins.input", _fake_input)
+    return _INPUT_QUEUE
+
+
+@pytest.fixture
+def stdout_sink():
+    """StringIO for tests to capture the output of the code under test.
+
+    Pass it as print_game's ``file``, or redirect stdout into it in the test
+    body, since pytest swaps sys.stdout between the setup and call phases.
+    """
+    return io.StringIO()
+
+
+# Rank offset (card index >> 2) -> rank prime, for building rank keys in bulk
+_RANK_PRIME_ARRAY = np.array(RANK_PRIMES, dtype=np.int64)
+
+
+def _batch_rank_keys(boards, hole):
+    """HandRanking.key for one hole against every row of an (n, k) board array.
+
+    Each distinct multiset of ranks without a flush is ranked only once and
+    shared by every board that has it; flush-capable boards are rare and are
+    ranked one at a time.
+    """
+    cards = np.concatenate(
+        [np.broadcast_to(Card.indices(hole), (len(boards), 2)), boards], axis=1
+    ).astype(np.int64)
+    rank_keys = np.prod(_RANK_PRIME_ARRAY[cards >> 2], axis=1)
+    suit_counts = np.stack([(cards & 3) == suit for suit in range(4)]).sum(axis=2)
+    is_flush = (suit_counts >= 5).any(axis=0)
+
+    def hand_key(row):
+        table = list(Card.from_indices(boards[row]))
+        return Solver._Solver__rank_hand(table, hole).key  # type: ignore
+
+    keys = np.empty(len(boards), dtype=np.int64)
+    for row in np.flatnonzero(is_flush):
+        keys[row] = hand_key(row)
+    plain_rows = np.flatnonzero(~is_flush)
+    _, first_rows, inverse = np.unique(
+        rank_keys[plain_rows], return_index=True, return_inverse=True
+    )
+    unique_keys = np.array([hand_key(plain_rows[row]) for row in first_rows])
+    keys[plain_rows] = unique_keys.astype(np.int64)[inverse]
+    return keys
+
+
+@pytest.fixture(scope="session")
+def rank_keys():
+    """Batch hand ranker: ``rank_keys(boards, hole)`` -> (n,) int64 hand keys.
+
+    ``boards`` is an (n, k) int8 array of table card indices, 3 <= k <= 5.
+    """
+    return _batch_rank_keys
+
+
+@pytest.fixture(scope="session")
+def _solve_cache():
+    """Session-wide memo of Solver.solve() results keyed by the solver inputs."""
+    return {}
+
+
+@pytest.fixture
+def cached_solve(monkeypatch, _solve_cache):
+    """Patch Solver.solve to reuse results across tests with identical inputs.
+
+    The first solve for a given set of hole cards and hand ranks runs the real
+    enumeration; later ones restore the same solver state from the cache, so
+    tests only pay for the guess loop they actually exercise.
+    """
+    original_solve = Solver.solve
+
+    def solve(self):
+        key = (
+            tuple(str(card) for hole in self.hole_cards.values() for card in hole),
+            tuple(self.flop_hand_ranks),
+            tuple(self.turn_hand_ranks),
+            tuple(self.river_hand_ranks),
+        )
+        if key not in _solve_cache:
+            tables = [table.copy() for table in original_solve(self)]
+            _solve_cache[key] = (tables, self.current_deck)
+        tables, deck = _solve_cache[key]
+        self.current_deck = deck.copy()
+        self._Solver__valid_tables = [table.copy() for table in tables]
+        self._Solver__maxh_sampling = None
+        return self._Solver__valid_tables
+
+    monkeypatch.setattr(Solver, "solve", solve)
+
+
+# Solved scenario fixtures are saved here as (n, 5) card index arrays
+_SOLVED_TABLES_DIR = Path(__file__).parent / ".cache"
+
+
+def _solved_tables_path(holes, flop_ranks, turn_ranks, river_ranks):
+    """Cache file for a scenario, keyed on its inputs and the package source.
+
+    Hashing the source means any change to the solver invalidates the cache,
+    so the regression counts are always checked against the current code.
+    """
+    digest = hashlib.sha256()
+    for path in sorted((src_path / "pokle_solver").glob("*.py")):
+        digest.update(path.read_bytes())
+    digest.update(repr((holes, flop_ranks, turn_ranks, river_ranks)).encode())
+    return _SOLVED_TABLES_DIR / f"{digest.hexdigest()[:16]}.npy"
+
+
+def _solved(holes, flop_ranks, turn_ranks, river_ranks):
+    """Build a Solver from hole card strings and solve it, reusing saved tables.
+
+    Set POKLE_TEST_NO_CACHE=1 to ignore saved tables and solve from scratch.
+    """
+    p1, p2, p3 = ([Card.from_string(card) for card in hole.split()] for hole in holes)
+    solver = Solver(p1, p2, p3, flop_ranks, turn_ranks, river_ranks)
+
+    path = _solved_tables_path(holes, flop_ranks, turn_ranks, river_ranks)
+    if path.exists() and os.environ.get("POKLE_TEST_NO_CACHE") != "1":
+        boards = np.load(path)
+        solver._Solver__valid_tables = [list(row) for row in Card.from_indices(boards)]
+        return solver
+
+    tables = solver.solve()
+    _SOLVED_TABLES_DIR.mkdir(exist_ok=True)
+    # Write then rename, so pytest-xdist workers solving the same scenario
+    # never load a half-written file
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with open(tmp_path, "wb") as f:
+        np.save(f, np.array(tables, dtype=np.int8).reshape(-1, 5))
+    os.replace(tmp_path, path)
+    return solver
+
+
+@pytest.fixture(scope="session")
+def queens_solver():
+    """Solved Solver for the fast example.py scenario (32 tables).
+
+    Shared by every test in the session, so tests that guess or call
+    get_maxh_table should work on ``copy.deepcopy(queens_solver)``.
+    """
+    return _solved(("QD QC", "10H 2H", "9H KH"), [2, 1, 3], [1, 3, 2], [2, 1, 3])
+
+
+@pytest.fixture
+def fresh_queens_solver(queens_solver):
+    """Private deep copy of queens_solver that a test is free to mutate."""
+    return copy.deepcopy(queens_solver)
+
+
+@pytest.fixture(scope="session")
+def example_12_25_solver():
+    """Solved Solver for the example_12_25 scenario (1,474 tables)."""
+    return _solved(("7C 9D", "KH KS", "8D 4S"), [1, 2, 3], [3, 1, 2], [2, 3, 1])
+
+
+@pytest.fixture(scope="session")
+def slow_output_solver():
+    """Solved Solver for the slow_output scenario (1,323 tables)."""
+    return _solved(("KH 6S", "8C 8H", "4H 9S"), [2, 3, 1], [3, 2, 1], [3, 1, 2])
+
+
+@pytest.fixture(scope="session")
+def very_slow_solver():
+    """Solved Solver for the very_slow scenario (7,606 tables)."""
+    return _solved(("JH 6H", "4H 7S", "5D 8D"), [3, 2, 1], [2, 3, 1], [2, 1, 3])
+
+
+@pytest.fixture(scope="session")
+def weak_leader_solver():
+    """Solved Solver where 2-3 offsuit leads pocket Kings every phase (24,324 tables)."""
+    return _solved(("2H 3D", "KC KH", "2C 5H"), [1, 2, 3], [1, 2, 3], [1, 2, 3])
+
+
+@pytest.fixture(scope="session")
+def mixed_hands_solver():
+    """Solved Solver for the pairs-to-trips mixed hand types scenario (6,992 tables)."""
+    return _solved(("9C 9D", "7H 7S", "5C 3D"), [1, 2, 3], [2, 1, 3], [3, 2, 1])
+
+
+@pytest.fixture(scope="session")
+def broadway_solver():
+    """Solved Solver for the AK suited vs queens vs JT suited scenario."""
+    return _solved(("AS KS", "QH QD", "JC 10C"), [1, 2, 3], [2, 1, 3], [1, 3, 2])
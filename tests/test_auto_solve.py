@@ -7,16 +7,28 @@ Tests the automated Pokle game solving functionality including:
 """
 
 from unittest.mock import Mock, patch
+
+import pytest
+
+from pokle_solver import auto_solve
+from pokle_solver.auto_solve import COLOR_DICT, FACE_CARDS, PLACE_DICT, RANK_STR
 from pokle_solver.card import Card
 
 
 class MockLocator:
     """Mock Playwright locator for testing."""
 
-    def __init__(self, text_content=None, attribute_value=None, count_value=1):
+    def __init__(
+        self,
+        text_content=None,
+        attribute_value=None,
+        count_value=1,
+        evaluate_value=None,
+    ):
         self._text_content = text_content
         self._attribute_value = attribute_value
         self._count_value = count_value
+        self._evaluate_value = evaluate_value
         self._items = []
 
     def text_content(self):
@@ -52,6 +64,9 @@ class MockLocator:
     def wait_for(self, **kwargs):
         pass
 
+    def evaluate_all(self, expression):
+        return self._evaluate_value
+
 
 class TestHoleCardParsing:
     """Test extraction of hole cards from HTML."""
@@ -140,61 +155,46 @@ class TestTrophyParsing:
 
     def test_parse_trophies_for_single_round(self):
         """Test parsing trophy placements for one round (flop/turn/river)."""
-        page = Mock()
-
-        # Mock row locator
         row = Mock()
+        trophy_pics = MockLocator(evaluate_value=["gold", "silver", "bronze"])
+        row.locator.return_value = trophy_pics
 
-        # Create trophy locators with different styles
-        trophy_styles = [
-            'background-image: url("gold.svg")',
-            'background-image: url("silver.svg")',
-            'background-image: url("bronze.svg")',
-        ]
-
-        trophy_locators = [
-            MockLocator(attribute_value=style) for style in trophy_styles
-        ]
+        trophies = auto_solve.parse_round_trophies(row)
 
-        row.locator.return_value.all.return_value = trophy_locators
-        page.locator.return_value = row
+        row.locator.assert_called_once_with(".trophy-pic")
+        assert trophies == ["gold", "silver", "bronze"]
 
-        # Parse trophies
-        trophies = []
-        for trophy in row.locator(".trophy-pic").all():
-            style = trophy.get_attribute("style")
-            trophies.append(style)
+    def test_parse_trophies_skips_unmatched_styles(self):
+        """Test that trophies without a recognizable image are dropped."""
+        row = Mock()
+        row.locator.return_value = MockLocator(evaluate_value=["silver", None, "gold"])
 
-        assert len(trophies) == 3
-        assert "gold" in trophies[0]
-        assert "silver" in trophies[1]
-        assert "bronze" in trophies[2]
+        assert auto_solve.parse_round_trophies(row) == ["silver", "gold"]
 
     def test_convert_trophies_to_positions(self):
         """Test conversion of trophy names to player positions."""
         trophies = ["gold", "silver", "bronze"]
-        place_dict = {"gold": 1, "silver": 2, "bronze": 3}
 
         # Convert to positions (1-indexed player numbers)
         positions = [
             i
             for i, t in sorted(
-                enumerate(trophies, start=1), key=lambda it: place_dict[it[1]]
+                enumerate(trophies, start=1), key=lambda it: PLACE_DICT[it[1]]
             )
         ]
 
         assert positions == [1, 2, 3]
+        assert auto_solve._PERM_CACHE[("gold", "silver", "bronze")] == (1, 2, 3)
 
     def test_convert_trophies_different_order(self):
         """Test trophy conversion when trophies are in different order."""
         # Player 2 has gold, Player 1 has silver, Player 3 has bronze
         trophies = ["silver", "gold", "bronze"]
-        place_dict = {"gold": 1, "silver": 2, "bronze": 3}
 
         positions = [
             i
             for i, t in sorted(
-                enumerate(trophies, start=1), key=lambda it: place_dict[it[1]]
+                enumerate(trophies, start=1), key=lambda it: PLACE_DICT[it[1]]
             )
         ]
 
@@ -203,6 +203,18 @@ class TestTrophyParsing:
         # Position 2 (rank 2 = silver) is player 1
         # Position 3 (rank 3 = bronze) is player 3
         assert positions == [2, 1, 3]
+        assert auto_solve._PERM_CACHE[tuple(trophies)] == (2, 1, 3)
+
+    def test_perm_cache_covers_all_orderings(self):
+        """Test that every ordering of the three trophies has a cached position list."""
+        assert len(auto_solve._PERM_CACHE) == 6
+        for trophies, positions in auto_solve._PERM_CACHE.items():
+            # The player listed first must be the one holding gold, and so on
+            assert [trophies[player - 1] for player in positions] == [
+                "gold",
+                "silver",
+                "bronze",
+            ]
 
 
 class TestColorFeedbackExtraction:
@@ -237,10 +249,9 @@ class TestColorFeedbackExtraction:
 
     def test_convert_colors_to_codes(self):
         """Test converting color names to game codes (g/y/e)."""
-        colors_dict = {"darkgreen": "g", "gold": "y", "grey": "e"}
         raw_colors = ["darkgreen", "gold", "grey", "darkgreen", "gold"]
 
-        converted = [colors_dict.get(c, "e") for c in raw_colors]
+        converted = [COLOR_DICT.get(c, "e") for c in raw_colors]
 
         assert converted == ["g", "y", "e", "g", "y"]
 
@@ -310,15 +321,21 @@ class TestAutoSolveIntegration:
 
     def test_face_card_conversion(self):
         """Test conversion of face card ranks to display strings."""
-        face_cards = {11: "J", 12: "Q", 13: "K", 14: "A"}
-
         # Test face cards
-        assert face_cards.get(11, str(11)) == "J"
-        assert face_cards.get(14, str(14)) == "A"
+        assert RANK_STR[11] == "J"
+        assert RANK_STR[14] == "A"
 
         # Test number cards
-        assert face_cards.get(7, str(7)) == "7"
-        assert face_cards.get(10, str(10)) == "10"
+        assert RANK_STR[7] == "7"
+        assert RANK_STR[10] == "10"
+
+    def test_rank_str_table(self):
+        """Test that the rank label table covers every rank 2-14."""
+        assert len(RANK_STR) == 15
+        assert RANK_STR[11] == "J"
+        assert RANK_STR[10] == "10"
+        assert RANK_STR[2:] == tuple("2 3 4 5 6 7 8 9 10 J Q K A".split())
+        assert all(RANK_STR[rank] == FACE_CARDS[rank] for rank in FACE_CARDS)
 
     def test_game_completion_detection(self):
         """Test detection of game completion (all green)."""
@@ -343,12 +360,11 @@ class TestErrorHandling:
 
     def test_invalid_color_handling(self):
         """Test handling of invalid/unknown color values."""
-        colors_dict = {"darkgreen": "g", "gold": "y", "grey": "e"}
         card_colors = ["e"] * 5
 
         # Unknown color should default to existing value
         unknown_color = "blue"
-        card_colors[0] = colors_dict.get(unknown_color, card_colors[0])
+        card_colors[0] = COLOR_DICT.get(unknown_color, card_colors[0])
 
         assert card_colors[0] == "e"  # Should keep default
 
@@ -364,6 +380,15 @@ class TestErrorHandling:
         # Should return None, which should be handled gracefully
         assert color is None
 
+    def test_missing_card_style_short_circuit(self):
+        """Test that missing or image-less styles are rejected without running the regex."""
+        with patch("pokle_solver.auto_solve.re.search") as mock_search:
+            assert auto_solve.parse_suit(None) is None
+            assert auto_solve.parse_suit("") is None
+            assert auto_solve.parse_suit("color: red") is None
+
+        assert mock_search.call_count == 0
+
     def test_fallback_selector_on_exception(self):
         """Test that fallback selector is used when primary fails."""
         page = Mock()
@@ -419,6 +444,12 @@ class TestRegexParsing:
             assert match is not None
             assert match.group(1) == trophy
 
+    def test_parse_suit_from_style(self):
+        """Test that parse_suit returns the upper-case suit for each card image."""
+        for suit in ["h", "d", "c", "s"]:
+            style = f'background-image: url("{suit}_card.svg")'
+            assert auto_solve.parse_suit(style) == suit.upper()
+
     def test_suit_extraction_handles_uppercase(self):
         """Test that suit extraction works with different cases."""
         import re
@@ -428,3 +459,22 @@ class TestRegexParsing:
 
         assert match is not None
         assert match.group(1).upper() in ["H", "D", "C", "S"]
+
+
+class TestLookupConstants:
+    """Test the module-level lookup tables used while parsing the game page."""
+
+    def test_constants_are_shared_module_objects(self):
+        """Test that the lookup tables are the module's own objects."""
+        assert PLACE_DICT is auto_solve.PLACE_DICT
+        assert COLOR_DICT is auto_solve.COLOR_DICT
+        assert FACE_CARDS is auto_solve.FACE_CARDS
+
+    def test_constants_are_read_only(self):
+        """Test that the lookup tables cannot be mutated."""
+        with pytest.raises(TypeError):
+            PLACE_DICT["platinum"] = 0  # type: ignore[index]
+        with pytest.raises(TypeError):
+            COLOR_DICT["blue"] = "b"  # type: ignore[index]
+        with pytest.raises(TypeError):
+            FACE_CARDS[10] = "T"  # type: ignore[index]
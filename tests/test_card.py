@@ -1,8 +1,18 @@
 """Unit tests for the Card and ColorCard classes."""
 
+import numpy as np
 import pytest
 
-from pokle_solver.card import Card, ColorCard  # type: ignore
+from pokle_solver.card import Card, ColorCard, VALID_COLORS, _CARD_POOL  # type: ignore
+
+
+@pytest.fixture(scope="module")
+def cards():
+    """Shared Card instances keyed by their string form, built once per module."""
+    return {
+        name: Card(int(name[:-1]), name[-1])
+        for name in ["14H", "13S", "12D", "11C", "10D", "10H", "9D", "9H", "7D"]
+    }
 
 
 class TestCardInitialization:
@@ -15,17 +25,17 @@ class TestCardInitialization:
         assert card.suit == "H"
         assert card.card_index is not None
 
-    def test_init_with_all_valid_ranks(self):
+    @pytest.mark.parametrize("rank", range(2, 15))
+    def test_init_with_all_valid_ranks(self, rank):
         """Test that all ranks from 2-14 are valid."""
-        for rank in range(2, 15):
-            card = Card(rank, "H")
-            assert card.rank == rank
+        card = Card(rank, "H")
+        assert card.rank == rank
 
-    def test_init_with_all_valid_suits(self):
+    @pytest.mark.parametrize("suit", ["H", "D", "C", "S"])
+    def test_init_with_all_valid_suits(self, suit):
         """Test that all four suits are valid."""
-        for suit in ["H", "D", "C", "S"]:
-            card = Card(10, suit)
-            assert card.suit == suit
+        card = Card(10, suit)
+        assert card.suit == suit
 
     def test_init_with_invalid_rank_too_low(self):
         """Test that rank < 2 raises ValueError."""
@@ -61,12 +71,13 @@ class TestCardInitialization:
         assert card1.card_index != card2.card_index
         assert card1.card_index != card3.card_index
 
-    def test_card_index_range(self):
+    @pytest.mark.parametrize(
+        "rank,suit", [(rank, suit) for rank in range(2, 15) for suit in "CDHS"]
+    )
+    def test_card_index_range(self, rank, suit):
         """Test that card_index is in valid range 0-51."""
-        for rank in range(2, 15):
-            for suit in ["C", "D", "H", "S"]:
-                card = Card(rank, suit)
-                assert 0 <= card.card_index <= 51  # type: ignore[operator]
+        card = Card(rank, suit)
+        assert 0 <= card.card_index <= 51  # type: ignore[operator]
 
 
 class TestCardFactoryMethods:
@@ -84,15 +95,12 @@ class TestCardFactoryMethods:
         assert card.rank == 10
         assert card.suit == "D"
 
-    def test_from_string_face_cards(self):
+    @pytest.mark.parametrize(
+        "card_string,rank", [("JC", 11), ("QS", 12), ("KH", 13)]
+    )
+    def test_from_string_face_cards(self, card_string, rank):
         """Test creating face cards from strings."""
-        jack = Card.from_string("JC")
-        queen = Card.from_string("QS")
-        king = Card.from_string("KH")
-
-        assert jack.rank == 11
-        assert queen.rank == 12
-        assert king.rank == 13
+        assert Card.from_string(card_string).rank == rank
 
     def test_from_string_lowercase(self):
         """Test that from_string handles lowercase input."""
@@ -118,6 +126,131 @@ class TestCardFactoryMethods:
         with pytest.raises(ValueError):
             Card.from_string("ABCD")  # Too long
 
+    def test_from_string_accepts_t_for_ten(self):
+        """Test that from_string accepts 'T' as well as '10' for tens."""
+        assert Card.from_string("TH") == Card.from_string("10H")
+
+    @pytest.mark.parametrize(
+        "card_string,message",
+        [
+            ("1H", "Rank must be between 2 and 14"),
+            ("15S", "Rank must be between 2 and 14"),
+            ("10", "Rank must be between 2 and 14"),
+            ("XH", "Rank must be an integer or a valid face card"),
+            ("AX", "Suit must be one of"),
+            ("A", "Invalid card string"),
+            ("ABCD", "Invalid card string"),
+        ],
+    )
+    def test_from_string_with_invalid_rank_or_suit(self, card_string, message):
+        """Test that from_string reports what is wrong with a bad card string."""
+        with pytest.raises(ValueError, match=message):
+            Card.from_string(card_string)
+
+    @pytest.mark.parametrize(
+        "card_string,rank", [("14H", 14), ("11H", 11), ("02H", 2), ("13s", 13)]
+    )
+    def test_from_string_numeric_ranks(self, card_string, rank):
+        """Test that numeric spellings of any rank still parse to the pooled Card."""
+        suit = card_string[-1].upper()
+        assert Card.from_string(card_string) is Card.intern(rank, suit)
+
+    def test_from_string_covers_full_deck(self):
+        """Test that every card's string form parses back to the same card."""
+        for rank in range(2, 15):
+            for suit in ["C", "D", "H", "S"]:
+                card = Card(rank, suit)
+                assert Card.from_string(str(card)) == card
+
+    def test_from_string_returns_interned_cards(self):
+        """Test that equivalent strings parse to the same pooled Card."""
+        card = Card.from_string("10H")
+        assert card is Card.from_string(" th ")
+        assert card is Card.from_string("th")
+        assert card is Card.from_string("Th")
+        assert card is Card.intern(10, "H")
+
+    def test_from_indices_returns_interned_cards(self):
+        """Test batch construction of Cards from an index array."""
+        indices = np.array([[0, 1, 2, 3, 51], [48, 49, 50, 51, 0]], dtype=np.int8)
+        cards = Card.from_indices(indices)
+
+        assert cards.shape == (2, 5)
+        assert cards[0, 0] == Card(2, "C")
+        assert cards[1, 2] == Card(14, "H")
+        assert cards[0, 4] is Card.intern(14, "S")
+
+    def test_from_indices_rejects_out_of_range(self):
+        """Test that indices outside 0-51 are rejected."""
+        with pytest.raises(IndexError):
+            Card.from_indices(np.array([52]))
+        with pytest.raises(IndexError):
+            Card.from_indices(np.array([-1]))
+
+    def test_indices_round_trip(self):
+        """Test that Card.indices inverts Card.from_indices."""
+        indices = np.arange(52, dtype=np.int8)
+        assert np.array_equal(Card.indices(Card.from_indices(indices)), indices)
+
+    def test_int_encodes_tables_as_index_arrays(self):
+        """Test that int(card) is the card index, so tables convert to int8 arrays."""
+        tables = [[Card(2, "C"), Card(14, "S")], [Card(10, "H"), Card(2, "D")]]
+        assert int(Card(14, "S")) == 51
+        assert np.array(tables, dtype=np.int8).tolist() == [[0, 51], [34, 1]]
+
+    def test_pack_unpack_round_trip(self):
+        """Test that Card.unpack inverts Card.pack for the whole deck."""
+        for rank in range(2, 15):
+            for suit in ["C", "D", "H", "S"]:
+                card = Card(rank, suit)
+                packed = card.pack()
+                assert 0 <= packed <= 51
+                assert Card.unpack(packed) == card
+                assert Card.unpack(packed) is Card.intern(rank, suit)
+
+    def test_unpack_rejects_out_of_range(self):
+        """Test that packed values outside 0-51 are rejected."""
+        with pytest.raises(IndexError):
+            Card.unpack(52)
+        with pytest.raises(IndexError):
+            Card.unpack(-1)
+
+    def test_hand_bitmasks(self):
+        """Test rank and suit bits OR together into hand masks."""
+        flush = [Card.from_string(s) for s in ["2H", "5H", "9H", "JH", "AH"]]
+        suit_mask = 0
+        rank_mask = 0
+        for card in flush:
+            suit_mask |= card._suit_bit
+            rank_mask |= card._rank_bit
+
+        hearts_lane = ((1 << 13) - 1) << 26
+        assert suit_mask & hearts_lane == suit_mask
+        assert bin(suit_mask).count("1") == 5
+        assert rank_mask == suit_mask >> 26
+
+        pair = Card(10, "C")._rank_bit | Card(10, "S")._rank_bit
+        assert pair == 1 << 8
+
+        # Hearts is suit index 2, so its count lives in bits 8-11
+        suit_counts = sum(card._suit_count for card in flush + [Card(10, "C")])
+        assert suit_counts == (5 << 8) | 1
+
+    def test_rank_prime_products_identify_rank_multisets(self):
+        """Test that products of rank primes ignore order and suit."""
+        hand_a = [Card(14, "H"), Card(2, "C"), Card(2, "D")]
+        hand_b = [Card(2, "S"), Card(14, "C"), Card(2, "H")]
+        hand_c = [Card(14, "H"), Card(14, "C"), Card(2, "D")]
+
+        def product(hand):
+            result = 1
+            for card in hand:
+                result *= card._prime
+            return result
+
+        assert product(hand_a) == product(hand_b)
+        assert product(hand_a) != product(hand_c)
+
     def test_from_tuple_with_int_rank(self):
         """Test creating card from tuple with integer rank."""
         card = Card.from_tuple((14, "H"))
@@ -148,6 +281,23 @@ class TestCardFactoryMethods:
         with pytest.raises(ValueError):
             Card.rank_from_string("X")
 
+    def test_rank_from_string_out_of_range(self):
+        """Test rank_from_string rejects numeric strings outside 2-14."""
+        for rank_str in ["0", "1", "15"]:
+            with pytest.raises(ValueError, match="Rank must be between 2 and 14"):
+                Card.rank_from_string(rank_str)
+
+    def test_rank_from_string_numeric_face_ranks(self):
+        """Test rank_from_string accepts the numeric spellings of face ranks."""
+        assert Card.rank_from_string("11") == 11
+        assert Card.rank_from_string("14") == 14
+        assert Card.rank_from_string("02") == 2
+        assert Card.from_tuple(("14", "H")) == Card(14, "H")
+
+    def test_rank_from_string_lowercase_face(self):
+        """Test rank_from_string accepts lowercase face card letters."""
+        assert Card.rank_from_string("q") == 12
+
 
 class TestCardProperties:
     """Test Card property accessors."""
@@ -168,7 +318,7 @@ class TestCardProperties:
         assert card.card_index == 0  # First card in deck
 
     def test_card_index_calculation(self):
-        """Test card_index calculation formula: (rank-2)*4 + suit_index."""
+        """Test card_index calculation formula: ((rank-2) << 2) | suit_index."""
         # 2C should be 0, 2D should be 1, 2H should be 2, 2S should be 3
         assert Card(2, "C").card_index == 0
         assert Card(2, "D").card_index == 1
@@ -181,6 +331,14 @@ class TestCardProperties:
         assert Card(14, "H").card_index == 50
         assert Card(14, "S").card_index == 51
 
+    @pytest.mark.parametrize("rank", range(2, 15))
+    @pytest.mark.parametrize("suit_index,suit", list(enumerate("CDHS")))
+    def test_card_index_bitfields_round_trip(self, rank, suit_index, suit):
+        """Test that rank and suit can be recovered from the card_index bitfields."""
+        index = Card(rank, suit).card_index
+        assert index >> 2 == rank - 2
+        assert index & 3 == suit_index
+
 
 class TestCardComparison:
     """Test Card comparison operators and hash consistency."""
@@ -191,58 +349,69 @@ class TestCardComparison:
         card2 = Card(10, "H")
         assert card1 == card2
 
-    def test_equality_different_rank(self):
+    def test_equality_different_rank(self, cards):
         """Test that cards with different ranks are not equal."""
-        card1 = Card(10, "H")
-        card2 = Card(9, "H")
+        card1 = cards["10H"]
+        card2 = cards["9H"]
         assert card1 != card2
 
-    def test_equality_different_suit(self):
+    def test_equality_different_suit(self, cards):
         """Test that cards with different suits are not equal."""
-        card1 = Card(10, "H")
-        card2 = Card(10, "D")
+        card1 = cards["10H"]
+        card2 = cards["10D"]
         assert card1 != card2
 
-    def test_less_than_by_rank(self):
+    def test_less_than_by_rank(self, cards):
         """Test less than comparison based on rank."""
-        card1 = Card(9, "H")
-        card2 = Card(10, "H")
+        card1 = cards["9H"]
+        card2 = cards["10H"]
         assert card1 < card2
 
-    def test_less_than_or_equal(self):
+    def test_less_than_or_equal(self, cards):
         """Test less than or equal comparison."""
-        card1 = Card(9, "H")
-        card2 = Card(10, "H")
-        card3 = Card(9, "D")
+        card1 = cards["9H"]
+        card2 = cards["10H"]
+        card3 = cards["9D"]
         assert card1 <= card2
         assert card1 <= card3
 
-    def test_greater_than_by_rank(self):
+    def test_greater_than_by_rank(self, cards):
         """Test greater than comparison based on rank."""
-        card1 = Card(10, "H")
-        card2 = Card(9, "H")
+        card1 = cards["10H"]
+        card2 = cards["9H"]
         assert card1 > card2
 
-    def test_greater_than_or_equal(self):
+    def test_greater_than_or_equal(self, cards):
         """Test greater than or equal comparison."""
-        card1 = Card(10, "H")
-        card2 = Card(9, "H")
-        card3 = Card(10, "D")
+        card1 = cards["10H"]
+        card2 = cards["9H"]
+        card3 = cards["10D"]
         assert card1 >= card2
         assert card1 >= card3
 
-    def test_comparison_ignores_suit(self):
+    def test_comparison_ignores_suit(self, cards):
         """Test that comparison operators only consider rank, not suit."""
-        card1 = Card(10, "H")
-        card2 = Card(10, "D")
+        card1 = cards["10H"]
+        card2 = cards["10D"]
         assert not (card1 < card2)
         assert not (card1 > card2)
         assert card1 <= card2
         assert card1 >= card2
 
-    def test_comparison_with_none_ranks(self):
+    def test_all_comparators_defined_directly(self):
+        """Test that Card implements all six comparison operators itself."""
+        for name in ["__eq__", "__ne__", "__lt__", "__le__", "__gt__", "__ge__"]:
+            assert name in vars(Card)
+
+    def test_comparators_return_not_implemented_for_non_card(self, cards):
+        """Test that every ordering comparator defers for non-Card operands."""
+        card = cards["10H"]
+        for name in ["__lt__", "__le__", "__gt__", "__ge__", "__ne__"]:
+            assert getattr(card, name)(42) is NotImplemented
+
+    def test_comparison_with_none_ranks(self, cards):
         """Test that comparison with incompatible types raises TypeError."""
-        card = Card(10, "H")
+        card = cards["10H"]
         with pytest.raises(TypeError):
             _ = card < "not a card"  # type: ignore[operator]
 
@@ -253,10 +422,16 @@ class TestCardComparison:
         assert card1 == card2
         assert hash(card1) == hash(card2)
 
-    def test_hash_different_for_different_cards(self):
+    def test_hash_is_precomputed_card_index(self):
+        """Test that a Card's hash is its unique card_index."""
+        for suit in ["C", "D", "H", "S"]:
+            card = Card(10, suit)
+            assert hash(card) == card.card_index
+
+    def test_hash_different_for_different_cards(self, cards):
         """Test that different cards have different hashes."""
-        card1 = Card(10, "H")
-        card2 = Card(10, "D")
+        card1 = cards["10H"]
+        card2 = cards["10D"]
         assert card1 != card2
         assert hash(card1) != hash(card2)
 
@@ -282,42 +457,42 @@ class TestCardComparison:
 class TestCardHelperMethods:
     """Test Card helper methods."""
 
-    def test_is_same_suit_true(self):
+    def test_is_same_suit_true(self, cards):
         """Test is_same_suit returns True for same suit."""
-        card1 = Card(10, "H")
-        card2 = Card(14, "H")
+        card1 = cards["10H"]
+        card2 = cards["14H"]
         assert card1.is_same_suit(card2) is True
 
-    def test_is_same_suit_false(self):
+    def test_is_same_suit_false(self, cards):
         """Test is_same_suit returns False for different suits."""
-        card1 = Card(10, "H")
-        card2 = Card(10, "D")
+        card1 = cards["10H"]
+        card2 = cards["10D"]
         assert card1.is_same_suit(card2) is False
 
-    def test_is_same_rank_true(self):
+    def test_is_same_rank_true(self, cards):
         """Test is_same_rank returns True for same rank."""
-        card1 = Card(10, "H")
-        card2 = Card(10, "D")
+        card1 = cards["10H"]
+        card2 = cards["10D"]
         assert card1.is_same_rank(card2) is True
 
-    def test_is_same_rank_false(self):
+    def test_is_same_rank_false(self, cards):
         """Test is_same_rank returns False for different ranks."""
-        card1 = Card(10, "H")
-        card2 = Card(14, "H")
+        card1 = cards["10H"]
+        card2 = cards["14H"]
         assert card1.is_same_rank(card2) is False
 
-    def test_to_color_creates_color_card(self):
+    def test_to_color_creates_color_card(self, cards):
         """Test to_color creates a ColorCard instance."""
-        card = Card(10, "H")
+        card = cards["10H"]
         color_card = card.to_color("g")
         assert isinstance(color_card, ColorCard)
         assert color_card.rank == 10
         assert color_card.suit == "H"
         assert color_card.color == "g"
 
-    def test_to_color_all_colors(self):
+    def test_to_color_all_colors(self, cards):
         """Test to_color with all valid color values."""
-        card = Card(10, "H")
+        card = cards["10H"]
         green = card.to_color("g")
         yellow = card.to_color("y")
         grey = card.to_color("e")
@@ -326,15 +501,15 @@ class TestCardHelperMethods:
         assert yellow.color == "y"
         assert grey.color == "e"
 
-    def test_to_color_default_is_grey(self):
+    def test_to_color_default_is_grey(self, cards):
         """Test to_color defaults to grey."""
-        card = Card(10, "H")
+        card = cards["10H"]
         color_card = card.to_color()
         assert color_card.color == "e"
 
-    def test_to_color_invalid_color(self):
+    def test_to_color_invalid_color(self, cards):
         """Test to_color raises ValueError with invalid color."""
-        card = Card(10, "H")
+        card = cards["10H"]
         with pytest.raises(ValueError, match="Color must be one of"):
             card.to_color("x")  # type: ignore[arg-type]
 
@@ -342,44 +517,49 @@ class TestCardHelperMethods:
 class TestCardStringRepresentation:
     """Test Card string representation methods."""
 
-    def test_str_ace(self):
+    def test_str_ace(self, cards):
         """Test string representation of Ace."""
-        card = Card(14, "H")
+        card = cards["14H"]
         assert str(card) == "AH"
 
-    def test_str_king(self):
+    def test_str_king(self, cards):
         """Test string representation of King."""
-        card = Card(13, "S")
+        card = cards["13S"]
         assert str(card) == "KS"
 
-    def test_str_queen(self):
+    def test_str_queen(self, cards):
         """Test string representation of Queen."""
-        card = Card(12, "D")
+        card = cards["12D"]
         assert str(card) == "QD"
 
-    def test_str_jack(self):
+    def test_str_jack(self, cards):
         """Test string representation of Jack."""
-        card = Card(11, "C")
+        card = cards["11C"]
         assert str(card) == "JC"
 
-    def test_str_ten(self):
+    def test_str_ten(self, cards):
         """Test string representation of 10."""
-        card = Card(10, "H")
+        card = cards["10H"]
         assert str(card) == "10H"
 
-    def test_str_numeric_card(self):
+    def test_str_numeric_card(self, cards):
         """Test string representation of numeric cards."""
-        card = Card(7, "D")
+        card = cards["7D"]
         assert str(card) == "7D"
 
-    def test_repr(self):
+    def test_str_is_cached(self, cards):
+        """Test that str() returns the same precomputed string object each call."""
+        card = cards["12D"]
+        assert str(card) is str(card)
+
+    def test_repr(self, cards):
         """Test repr representation."""
-        card = Card(10, "H")
+        card = cards["10H"]
         assert repr(card) == "Card(rank=10, suit='H')"
 
-    def test_pstr_contains_ansi_codes(self):
+    def test_pstr_contains_ansi_codes(self, cards):
         """Test pstr returns string with ANSI color codes."""
-        card = Card(14, "H")
+        card = cards["14H"]
         pstr = card.pstr()
         assert "\033[" in pstr  # Contains ANSI escape codes
         assert "A♥" in pstr or "A" in pstr  # Contains card representation
@@ -422,6 +602,20 @@ class TestColorCard:
         assert yellow.color == "y"
         assert grey.color == "e"
 
+    def test_colorcard_from_string_defaults_to_grey(self):
+        """Test ColorCard.from_string without a color suffix yields a grey card."""
+        card = ColorCard.from_string("KS")
+        assert (card.rank, card.suit, card.color) == (13, "S", "e")
+
+    def test_colorcard_from_string_invalid(self):
+        """Test ColorCard.from_string rejects malformed strings."""
+        with pytest.raises(ValueError, match="Invalid card string"):
+            ColorCard.from_string("AH_g_y")
+        with pytest.raises(ValueError, match="Color must be one of"):
+            ColorCard.from_string("AH_x")
+        with pytest.raises(ValueError):
+            ColorCard.from_string(None)  # type: ignore[arg-type]
+
     def test_colorcard_from_tuple(self):
         """Test creating ColorCard from tuple."""
         card = ColorCard.from_tuple((14, "H", "g"))
@@ -440,6 +634,11 @@ class TestColorCard:
         card.color = "y"
         assert card.color == "y"
 
+    def test_valid_colors_is_frozen(self):
+        """Test that the valid color set is immutable."""
+        assert isinstance(VALID_COLORS, frozenset)
+        assert VALID_COLORS == {"g", "y", "e"}
+
     def test_colorcard_color_setter_invalid(self):
         """Test ColorCard color setter raises ValueError with invalid color."""
         card = ColorCard(10, "H", "g")
@@ -456,6 +655,12 @@ class TestColorCard:
         card = ColorCard(10, "H", "g")
         assert repr(card) == "ColorCard(rank=10, suit='H', color='g')"
 
+    def test_colorcard_repr_tracks_color_setter(self):
+        """Test ColorCard repr reflects a color change."""
+        card = ColorCard(10, "H", "g")
+        card.color = "y"
+        assert repr(card) == "ColorCard(rank=10, suit='H', color='y')"
+
     def test_colorcard_equality_requires_same_color(self):
         """Test ColorCard equality requires same color."""
         card1 = ColorCard(10, "H", "g")
@@ -465,12 +670,28 @@ class TestColorCard:
         assert card1 == card2
         assert card1 != card3
 
+    def test_colorcard_equality_follows_color_setter(self):
+        """Test ColorCard equality tracks color changes and compares to plain Cards."""
+        card = ColorCard(10, "H", "g")
+        card.color = "y"
+        assert card == ColorCard(10, "H", "y")
+        assert card != ColorCard(10, "H", "g")
+        assert card == Card(10, "H")
+        assert Card(10, "H") == card
+        assert card != ColorCard(10, "D", "y")
+
     def test_colorcard_hash_includes_color(self):
         """Test ColorCard hash includes color."""
         card1 = ColorCard(10, "H", "g")
         card2 = ColorCard(10, "H", "y")
         assert hash(card1) != hash(card2)
 
+    def test_colorcard_hash_follows_color_setter(self):
+        """Test that changing a ColorCard's color keeps hash consistent with equality."""
+        card = ColorCard(10, "H", "g")
+        card.color = "y"
+        assert hash(card) == hash(ColorCard(10, "H", "y"))
+
     def test_colorcard_is_same_color(self):
         """Test is_same_color method."""
         card1 = ColorCard(10, "H", "g")
@@ -495,6 +716,20 @@ class TestColorCard:
         assert green.pstr() != yellow.pstr()
         assert yellow.pstr() != grey.pstr()
 
+    def test_pstr_exact_output(self):
+        """Test the exact ANSI bytes produced for a Card and its ColorCard variants."""
+        assert Card(14, "H").pstr() == "\033[47m\033[38;2;255;0;0m A♥\033[0m"
+        assert ColorCard(10, "S", "g").pstr() == "\033[42m\033[30m10♠\033[0m"
+        assert ColorCard(2, "D", "e").pstr() == (
+            "\033[48;2;160;160;160m\033[38;2;255;0;0m 2♦\033[0m"
+        )
+
+    def test_colorcard_pstr_follows_color_setter(self):
+        """Test that pstr reflects a color changed after construction."""
+        card = ColorCard(10, "H", "g")
+        card.color = "y"
+        assert card.pstr() == ColorCard(10, "H", "y").pstr()
+
     def test_colorcard_inherits_from_card(self):
         """Test that ColorCard is a subclass of Card."""
         card = ColorCard(10, "H", "g")
@@ -528,21 +763,72 @@ class TestCardEdgeCases:
         result = card.is_same_rank(42)  # type: ignore[arg-type]
         assert result is NotImplemented
 
+    def test_is_same_helpers_accept_color_cards(self):
+        """Test is_same_suit/is_same_rank work across Card and ColorCard."""
+        card = Card(10, "H")
+        color_card = ColorCard(10, "H", "g")
+        assert card.is_same_suit(color_card) is True
+        assert card.is_same_rank(color_card) is True
+        assert color_card.is_same_suit(card) is True
+        assert color_card.is_same_rank(Card(9, "H")) is False
+
+    def test_is_same_color_with_plain_card(self):
+        """Test is_same_color with a plain Card returns NotImplemented."""
+        color_card = ColorCard(10, "H", "g")
+        assert color_card.is_same_color(Card(10, "H")) is NotImplemented
+
     def test_multiple_cards_same_values(self):
         """Test creating multiple cards with same values maintains independence."""
         cards = [Card(10, "H") for _ in range(5)]
         assert len(set(id(c) for c in cards)) == 5  # All different objects
         assert len(set(cards)) == 1  # But all equal
 
-    def test_card_index_cache_population(self):
-        """Test that card_index_cache gets populated correctly."""
-        # Clear any existing cache state by creating new cards
+    def test_intern_returns_canonical_instance(self):
+        """Test that Card.intern returns one shared object per rank and suit."""
+        card1 = Card.intern(10, "H")
+        card2 = Card.intern(10, "H")
+
+        assert card1 is card2
+        assert card1 == Card(10, "H")
+        assert Card.intern(10, "D") is not card1
+
+    def test_intern_pool_is_preseeded(self):
+        """Test that every card is already pooled in card_index order."""
+        assert len(_CARD_POOL) == 52
+        for index, card in enumerate(_CARD_POOL):
+            assert card.card_index == index
+            assert Card.intern(card.rank, card.suit) is card
+
+    def test_intern_validates_rank_and_suit(self):
+        """Test that Card.intern rejects invalid ranks and suits."""
+        with pytest.raises(ValueError, match="Rank must be between"):
+            Card.intern(1, "H")
+        with pytest.raises(ValueError, match="Rank must be between"):
+            Card.intern(15, "H")
+        with pytest.raises(ValueError):
+            Card.intern(10, "X")
+
+    def test_cards_use_slots_without_instance_dict(self):
+        """Test that Card and ColorCard instances have no per-instance __dict__."""
+        card = Card(10, "H")
+        color_card = ColorCard(10, "H", "g")
+
+        assert not hasattr(card, "__dict__")
+        assert not hasattr(color_card, "__dict__")
+        with pytest.raises(AttributeError):
+            card.extra = 1  # type: ignore[attr-defined]
+
+        # The color setter writes to the _color slot
+        color_card.color = "y"
+        assert color_card._color == "y"
+
+    def test_card_index_computed_without_cache(self):
+        """Test that card_index is derived directly from rank and suit."""
         card1 = Card(7, "S")
         card2 = Card(7, "S")
 
-        # Both should have the same cached index
-        assert card1.card_index == card2.card_index
+        # Both should have the same index: (7 - 2) * 4 + 3
+        assert card1.card_index == card2.card_index == 23
 
-        # Check it's in the cache
-        cache_key = (7, "S")
-        assert cache_key in Card._card_index_cache
+        # No per-class cache is populated as a side effect
+        assert not hasattr(Card, "_card_index_cache")
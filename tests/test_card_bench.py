@@ -0,0 +1,37 @@
+"""Micro-benchmarks for the Card hot paths.
+
+Requires the pytest-benchmark plugin from the dev dependency group; the
+module is skipped without it. A plain test run executes each body once
+(see conftest.py). Run only the benchmarks with:
+
+    pytest tests/test_card_bench.py --benchmark-only
+
+or pass ``--benchmark-enable`` to time them alongside the other tests.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from pokle_solver.card import Card, SUITS, _CARD_POOL  # type: ignore  # noqa: E402
+
+ALL_CARD_ARGS = [(rank, suit) for rank in range(2, 15) for suit in SUITS]
+ALL_CARD_STRS = [str(card) for card in _CARD_POOL]
+
+
+def test_bench_card_construction(benchmark):
+    """Benchmark constructing a full deck of Cards."""
+    cards = benchmark(lambda: [Card(rank, suit) for rank, suit in ALL_CARD_ARGS])
+    assert len(cards) == 52
+
+
+def test_bench_card_from_string(benchmark):
+    """Benchmark parsing every card string."""
+    cards = benchmark(lambda: [Card.from_string(s) for s in ALL_CARD_STRS])
+    assert cards == list(_CARD_POOL)
+
+
+def test_bench_card_hashing(benchmark):
+    """Benchmark building a dict keyed by every card."""
+    index = benchmark(lambda: {card: i for i, card in enumerate(_CARD_POOL)})
+    assert len(index) == 52
@@ -1,476 +1,221 @@
 """Tests for the CLI interface."""
 
-from unittest.mock import patch
+import re
+from collections import Counter
+from contextlib import redirect_stdout
+from functools import lru_cache
 
-from pokle_solver.cli import cli  # type: ignore
+import pytest
+
+from pokle_solver.card import Card  # type: ignore
+from pokle_solver.cli import cli, parse_cards, parse_colors, parse_ranks  # type: ignore
+
+# Every test drives the same few solver inputs; solve each combination once.
+pytestmark = pytest.mark.usefixtures("cached_solve")
+
+# Shared input sequences; tests build their input by concatenating these.
+VALID_HANDS = ("QD QC", "10H 2H", "9H KH")  # P1-P3 hole cards
+VALID_RANKS = ("2 1 3", "1 3 2", "2 1 3")  # Flop, turn and river ranks
+VALID_PREAMBLE = VALID_HANDS + VALID_RANKS
+GREEN = ("g g g g g",)
+
+
+@pytest.fixture
+def run_cli(cli_inputs, stdout_sink):
+    """Run cli() on canned inputs with stdout buffered in memory.
+
+    Returns a function taking the input sequence and returning the sink. The
+    buffered output is echoed once afterwards so pytest still reports it on
+    failure.
+    """
+
+    def run(inputs):
+        cli_inputs.extend(inputs)
+        with redirect_stdout(stdout_sink):
+            cli()
+        print(stdout_sink.getvalue())
+        return stdout_sink
+
+    return run
+
+
+@lru_cache(maxsize=None)
+def _needle_pattern(needles):
+    """Compile one regex that finds every needle, including overlapping ones.
+
+    The lookahead makes each match zero-width so scanning resumes at the next
+    character; longest-first alternation means the needles matching at a
+    position are exactly the prefixes of the matched text.
+    """
+    alternation = "|".join(
+        re.escape(needle) for needle in sorted(needles, key=len, reverse=True)
+    )
+    return re.compile(f"(?=({alternation}))")
+
+
+def assert_output(sink, contains=(), min_counts=None, counts=None):
+    """Check captured CLI output, scanning it once for all needles.
+
+    Args:
+        sink: StringIO that stdout was redirected into.
+        contains: Substrings that must appear in the output.
+        min_counts: Mapping of substring to the minimum number of occurrences.
+        counts: Mapping of substring to the exact number of occurrences.
+    """
+    min_counts = min_counts or {}
+    counts = counts or {}
+    needles = tuple(sorted({*contains, *min_counts, *counts}))
+    found = Counter()
+    for match in _needle_pattern(needles).finditer(sink.getvalue()):
+        hit = match.group(1)
+        found.update(needle for needle in needles if hit.startswith(needle))
+
+    for needle in contains:
+        assert found[needle], f"{needle!r} not in output"
+    for needle, minimum in min_counts.items():
+        assert found[needle] >= minimum, f"{needle!r}: {found[needle]} < {minimum}"
+    for needle, expected in counts.items():
+        assert found[needle] == expected, f"{needle!r}: {found[needle]} != {expected}"
 
 
 class TestCLIValidWorkflow:
     """Test valid CLI workflows."""
 
-    def test_cli_complete_workflow_immediate_solve(self, monkeypatch, capsys):
-        """Test complete CLI workflow where user guesses correctly on first try."""
-        inputs = [
-            "QD QC",  # Player 1 hole cards
-            "10H 2H",  # Player 2 hole cards
-            "9H KH",  # Player 3 hole cards
-            "2 1 3",  # Flop ranks
-            "1 3 2",  # Turn ranks
-            "2 1 3",  # River ranks
-            "g g g g g",  # All green - correct guess
-        ]
-        input_iter = iter(inputs)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
-
-        cli()
-
-        captured = capsys.readouterr()
-        assert "Possible tables found:" in captured.out
-        assert "Possible tables remaining: 1" in captured.out
-
-    def test_cli_workflow_with_multiple_guesses(self, monkeypatch, capsys):
-        """Test CLI workflow with multiple guesses before solving."""
-        inputs = [
-            "QD QC",  # Player 1 hole cards
-            "10H 2H",  # Player 2 hole cards
-            "9H KH",  # Player 3 hole cards
-            "2 1 3",  # Flop ranks
-            "1 3 2",  # Turn ranks
-            "2 1 3",  # River ranks
-            "e e e e e",  # All grey - will cause error (no matches)
-            "y y y y y",  # All yellow - will cause error (no matches)
-            "g g g g g",  # All green - correct guess
-        ]
-        input_iter = iter(inputs)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
-
-        cli()
-
-        captured = capsys.readouterr()
-        assert "Possible tables found:" in captured.out
-        # Only prints "Possible tables remaining" on successful guesses, not on errors
-        assert captured.out.count("Error: No rivers match") >= 2
-
-    def test_cli_accepts_lowercase_cards(self, monkeypatch, capsys):
+    @pytest.mark.parametrize(
+        "extra_guesses",
+        [
+            pytest.param((), id="immediate"),
+            pytest.param(("e e e e e",), id="one_miss"),
+        ],
+    )
+    def test_cli_guess_loop_until_all_green(self, run_cli, extra_guesses):
+        """Test the guess loop retries on unmatched feedback and exits on all green."""
+        # Each extra guess matches no river, so it prints an error instead of
+        # "Possible tables remaining"; only the final all-green guess succeeds.
+        output = run_cli(VALID_PREAMBLE + extra_guesses + GREEN)
+
+        assert_output(
+            output,
+            contains=["Possible tables found:"],
+            counts={
+                "Possible tables remaining: 1": 1,
+                "Possible tables remaining:": 1,
+                "Error: No rivers match": len(extra_guesses),
+            },
+        )
+
+    def test_cli_accepts_lowercase_cards(self, run_cli):
         """Test that CLI accepts lowercase card input."""
-        inputs = [
-            "qd qc",  # Lowercase input
-            "10h 2h",
-            "9h kh",
-            "2 1 3",
-            "1 3 2",
-            "2 1 3",
-            "g g g g g",
-        ]
-        input_iter = iter(inputs)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
-
-        cli()
-
-        captured = capsys.readouterr()
-        assert "Possible tables found:" in captured.out
-
-
-class TestCLICardInputValidation:
-    """Test CLI validation of hole card input."""
-
-    def test_cli_rejects_wrong_card_count_then_accepts(self, monkeypatch, capsys):
-        """Test that CLI rejects wrong number of cards and allows retry."""
-        inputs = [
-            "QD",  # Only 1 card - should fail
-            "QD QC QH",  # 3 cards - should fail
-            "QD QC",  # Correct - 2 cards
-            "10H 2H",
-            "9H KH",
-            "2 1 3",
-            "1 3 2",
-            "2 1 3",
-            "g g g g g",
-        ]
-        input_iter = iter(inputs)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
-
-        cli()
-
-        captured = capsys.readouterr()
-        assert captured.out.count("Error:") >= 2
-        assert "exactly two cards" in captured.out
-
-    def test_cli_rejects_invalid_card_format(self, monkeypatch, capsys):
-        """Test that CLI rejects invalid card format."""
-        inputs = [
-            "XX YY",  # Invalid card format
-            "QD QC",  # Valid
-            "10H 2H",
-            "9H KH",
-            "2 1 3",
-            "1 3 2",
-            "2 1 3",
-            "g g g g g",
-        ]
-        input_iter = iter(inputs)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
-
-        cli()
-
-        captured = capsys.readouterr()
-        assert "Error:" in captured.out
-
-    def test_cli_handles_extra_whitespace_in_cards(self, monkeypatch, capsys):
-        """Test that CLI handles extra whitespace in card input."""
-        inputs = [
-            "  QD   QC  ",  # Extra whitespace
-            "10H 2H",
-            "9H KH",
-            "2 1 3",
-            "1 3 2",
-            "2 1 3",
-            "g g g g g",
-        ]
-        input_iter = iter(inputs)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
-
-        cli()
-
-        captured = capsys.readouterr()
-        assert "Possible tables found:" in captured.out
-
-
-class TestCLIRankInputValidation:
-    """Test CLI validation of hand rank input."""
-
-    def test_cli_rejects_invalid_rank_values(self, monkeypatch, capsys):
-        """Test that CLI rejects invalid rank values."""
-        inputs = [
-            "QD QC",
-            "10H 2H",
-            "9H KH",
-            "1 2 4",  # Invalid - 4 is not a valid rank
-            "1 1 3",  # Invalid - duplicate ranks
-            "2 1 3",  # Valid
-            "1 3 2",
-            "2 1 3",
-            "g g g g g",
-        ]
-        input_iter = iter(inputs)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
-
-        cli()
-
-        captured = capsys.readouterr()
-        assert captured.out.count("Error:") >= 2
-        assert "valid ranks" in captured.out
-
-    def test_cli_rejects_wrong_rank_count(self, monkeypatch, capsys):
-        """Test that CLI rejects wrong number of ranks."""
-        inputs = [
-            "QD QC",
-            "10H 2H",
-            "9H KH",
-            "1 2",  # Only 2 ranks
-            "2 1 3",  # Valid
-            "1 3 2",
-            "2 1 3",
-            "g g g g g",
-        ]
-        input_iter = iter(inputs)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
-
-        cli()
-
-        captured = capsys.readouterr()
-        assert "Error:" in captured.out
-
-    def test_cli_accepts_all_rank_permutations(self, monkeypatch, capsys):
-        """Test that CLI accepts different rank permutations."""
-        inputs = [
-            "QD QC",
-            "10H 2H",
-            "9H KH",
-            "1 2 3",  # Different permutation
-            "3 2 1",  # Different permutation
-            "1 3 2",  # Different permutation
-            "g g g g g",
-        ]
-        input_iter = iter(inputs)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
-
-        cli()
-
-        captured = capsys.readouterr()
-        assert "Possible tables found:" in captured.out
-
-
-class TestCLIColorFeedbackValidation:
-    """Test CLI validation of color feedback input."""
-
-    def test_cli_rejects_wrong_color_count(self, monkeypatch, capsys):
-        """Test that CLI rejects wrong number of colors."""
-        inputs = [
-            "QD QC",
-            "10H 2H",
-            "9H KH",
-            "2 1 3",
-            "1 3 2",
-            "2 1 3",
-            "g g g",  # Only 3 colors - should fail
-            "g g g g",  # Only 4 colors - should fail
-            "g g g g g",  # Valid - 5 colors
-        ]
-        input_iter = iter(inputs)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
-
-        cli()
-
-        captured = capsys.readouterr()
-        assert captured.out.count("Error:") >= 2
-        assert "exactly 5 colors" in captured.out
-
-    def test_cli_rejects_invalid_color_values(self, monkeypatch, capsys):
-        """Test that CLI rejects invalid color values."""
-        inputs = [
-            "QD QC",
-            "10H 2H",
-            "9H KH",
-            "2 1 3",
-            "1 3 2",
-            "2 1 3",
-            "r b g y e",  # Invalid colors 'r' and 'b'
-            "g g g g g",  # Valid
-        ]
-        input_iter = iter(inputs)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
-
-        cli()
-
-        captured = capsys.readouterr()
-        assert "Error:" in captured.out
-
-    def test_cli_accepts_mixed_case_colors(self, monkeypatch, capsys):
-        """Test that CLI accepts mixed case color input (converts to lowercase)."""
-        inputs = [
-            "QD QC",
-            "10H 2H",
-            "9H KH",
-            "2 1 3",
-            "1 3 2",
-            "2 1 3",
-            "G Y E E G",  # Uppercase - should be converted but may cause error if no match
-            "G G G G G",  # All green to exit
-        ]
-        input_iter = iter(inputs)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
-
-        cli()
-
-        captured = capsys.readouterr()
-        # Should work - no validation error for valid colors in uppercase
-        assert "Possible tables remaining:" in captured.out
-
-    def test_cli_handles_extra_whitespace_in_colors(self, monkeypatch, capsys):
-        """Test that CLI handles extra whitespace in color input."""
-        inputs = [
-            "QD QC",
-            "10H 2H",
-            "9H KH",
-            "2 1 3",
-            "1 3 2",
-            "2 1 3",
-            "  g   g   g   g   g  ",  # Extra whitespace
-        ]
-        input_iter = iter(inputs)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
-
-        cli()
-
-        captured = capsys.readouterr()
-        assert "Possible tables remaining:" in captured.out
-
-
-class TestCLILoopBehavior:
-    """Test CLI looping behavior until solution found."""
-
-    def test_cli_continues_until_all_green(self, monkeypatch, capsys):
-        """Test that CLI continues asking for guesses until all green."""
-        inputs = [
-            "QD QC",
-            "10H 2H",
-            "9H KH",
-            "2 1 3",
-            "1 3 2",
-            "2 1 3",
-            "e e e e e",  # Not all green - will cause error (no matches)
-            "y y y y y",  # Not all green - will cause error (no matches)
-            "g y e e g",  # Not all green - will cause error (no matches)
-            "g g g g g",  # All green - should exit
-        ]
-        input_iter = iter(inputs)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
-
-        cli()
-
-        captured = capsys.readouterr()
-        # Only successful guesses print "Possible tables remaining"
-        # Errors just print error messages
-        assert captured.out.count("Error: No rivers match") >= 3
-        assert "Possible tables remaining:" in captured.out
-
-    def test_cli_exits_on_first_all_green(self, monkeypatch, capsys):
-        """Test that CLI exits immediately when all green is entered."""
-        inputs = [
-            "QD QC",
-            "10H 2H",
-            "9H KH",
-            "2 1 3",
-            "1 3 2",
-            "2 1 3",
-            "g g g g g",  # All green on first try - should exit
-        ]
-        input_iter = iter(inputs)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
-
-        cli()
-
-        captured = capsys.readouterr()
-        # Should have exactly 1 "Possible tables remaining" message
-        assert captured.out.count("Possible tables remaining:") == 1
+        output = run_cli(("qd qc", "10h 2h", "9h kh") + VALID_RANKS + GREEN)
+
+        assert_output(output, contains=["Possible tables found:"])
 
 
 class TestCLIErrorRecovery:
     """Test CLI error recovery and retry logic."""
 
-    def test_cli_recovers_from_multiple_card_errors(self, monkeypatch, capsys):
-        """Test that CLI can recover from multiple consecutive card errors."""
-        inputs = [
-            "QD",  # Error: only 1 card
-            "XX YY",  # Error: invalid format
-            "QD QC QH",  # Error: 3 cards
-            "QD QC",  # Success
-            "10H 2H",
-            "9H KH",
-            "2 1 3",
-            "1 3 2",
-            "2 1 3",
-            "g g g g g",
-        ]
-        input_iter = iter(inputs)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
-
-        cli()
-
-        captured = capsys.readouterr()
-        assert captured.out.count("Error:") >= 3
-        assert "Possible tables found:" in captured.out
-
-    def test_cli_recovers_from_multiple_rank_errors(self, monkeypatch, capsys):
-        """Test that CLI can recover from multiple consecutive rank errors."""
-        inputs = [
-            "QD QC",
-            "10H 2H",
-            "9H KH",
-            "1 2",  # Error: only 2 ranks
-            "1 2 4",  # Error: invalid rank
-            "1 1 1",  # Error: duplicates
-            "2 1 3",  # Success
-            "1 3 2",
-            "2 1 3",
-            "g g g g g",
-        ]
-        input_iter = iter(inputs)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
-
-        cli()
-
-        captured = capsys.readouterr()
-        assert captured.out.count("Error:") >= 3
-
-    def test_cli_recovers_from_multiple_color_errors(self, monkeypatch, capsys):
-        """Test that CLI can recover from multiple consecutive color errors."""
-        inputs = [
-            "QD QC",
-            "10H 2H",
-            "9H KH",
-            "2 1 3",
-            "1 3 2",
-            "2 1 3",
-            "g g g",  # Error: only 3 colors
-            "r b g y e",  # Error: invalid colors
-            "g g g g g g",  # Error: 6 colors
-            "g g g g g",  # Success
-        ]
-        input_iter = iter(inputs)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
-
-        cli()
-
-        captured = capsys.readouterr()
-        assert captured.out.count("Error:") >= 3
-
-
-class TestCLIOutputMessages:
-    """Test CLI output messages and formatting."""
-
-    def test_cli_displays_player_prompts(self, monkeypatch, capsys):
-        """Test that CLI displays prompts for all players."""
-        inputs = [
-            "QD QC",
-            "10H 2H",
-            "9H KH",
-            "2 1 3",
-            "1 3 2",
-            "2 1 3",
-            "g g g g g",
-        ]
-        input_iter = iter(inputs)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
-
-        # Capture stderr to get prompts
-        with patch("builtins.input", side_effect=inputs):
-            cli()
-
-        captured = capsys.readouterr()
-        # Check that solver ran successfully
-        assert "Possible tables found:" in captured.out
-
-    def test_cli_displays_phase_prompts(self, monkeypatch, capsys):
-        """Test that CLI displays prompts for all game phases."""
-        inputs = [
-            "QD QC",
-            "10H 2H",
-            "9H KH",
-            "2 1 3",
-            "1 3 2",
-            "2 1 3",
-            "g g g g g",
-        ]
-        input_iter = iter(inputs)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
-
-        cli()
-
-        captured = capsys.readouterr()
-        # Verify solver completed
-        assert "Possible tables found:" in captured.out
-        assert "Possible tables remaining:" in captured.out
-
-    def test_cli_displays_table_count_updates(self, monkeypatch, capsys):
-        """Test that CLI displays table count after successful guesses."""
-        inputs = [
-            "QD QC",
-            "10H 2H",
-            "9H KH",
-            "2 1 3",
-            "1 3 2",
-            "2 1 3",
-            "e e e e e",  # Will cause error
-            "g g g g g",  # Successful guess
-        ]
-        input_iter = iter(inputs)
-        monkeypatch.setattr("builtins.input", lambda _: next(input_iter))
-
-        cli()
-
-        captured = capsys.readouterr()
-        # Only successful guess prints "Possible tables remaining"
-        assert "Possible tables remaining:" in captured.out
-        assert "Error: No rivers match" in captured.out
+    def test_cli_recovers_from_errors_in_every_step(self, run_cli):
+        """Test that one CLI run survives every kind of bad input and missed guess."""
+        bad_hands = ("QD", "XX YY", "QD QC QH")
+        bad_ranks = ("1 2", "1 2 4", "1 1 1")
+        bad_colors = ("g g g", "r b g y e", "g g g g g g")
+        unmatched_guesses = ("e e e e e", "y y y y y", "g y e e g")
+        output = run_cli(
+            bad_hands
+            + VALID_HANDS
+            + bad_ranks
+            + VALID_RANKS
+            + bad_colors
+            + unmatched_guesses
+            + GREEN
+        )
+
+        assert_output(
+            output,
+            counts={
+                "exactly two cards": 2,
+                "valid face card": 1,
+                "valid ranks": 3,
+                "exactly 5 colors": 3,
+                "Error: No rivers match": 3,
+                "Error:": 12,
+                "Possible tables found:": 1,
+                "Possible tables remaining: 1": 1,
+                "Possible tables remaining:": 1,
+            },
+        )
+
+
+class TestParseCards:
+    """Test hole card parsing and validation."""
+
+    def test_parse_cards_valid(self):
+        """Test that two valid cards are parsed in order."""
+        assert parse_cards("QD QC", 1) == [Card(12, "D"), Card(12, "C")]
+
+    def test_parse_cards_lowercase(self):
+        """Test that lowercase card strings are accepted."""
+        assert parse_cards("10h 2h", 2) == [Card(10, "H"), Card(2, "H")]
+
+    def test_parse_cards_extra_whitespace(self):
+        """Test that extra whitespace between cards is ignored."""
+        assert parse_cards("  QD   QC  ", 1) == [Card(12, "D"), Card(12, "C")]
+
+    @pytest.mark.parametrize("hole_str", ["QD", "QD QC QH", ""])
+    def test_parse_cards_wrong_count(self, hole_str):
+        """Test that anything other than two cards is rejected."""
+        with pytest.raises(ValueError, match="exactly two cards for Player 3"):
+            parse_cards(hole_str, 3)
+
+    def test_parse_cards_invalid_format(self):
+        """Test that invalid card strings are rejected."""
+        with pytest.raises(ValueError, match="valid face card"):
+            parse_cards("XX YY", 1)
+
+
+class TestParseRanks:
+    """Test hand rank parsing and validation."""
+
+    @pytest.mark.parametrize(
+        "ranks_str, expected",
+        [
+            ("2 1 3", [2, 1, 3]),
+            ("1 3 2", [1, 3, 2]),
+            ("1 2 3", [1, 2, 3]),
+            ("3 2 1", [3, 2, 1]),
+            ("3 1 2", [2, 3, 1]),
+        ],
+    )
+    def test_parse_ranks_orders_players_by_rank(self, ranks_str, expected):
+        """Test that ranks are converted to players ordered best to worst."""
+        assert parse_ranks(ranks_str) == expected
+
+    @pytest.mark.parametrize("ranks_str", ["1 2 4", "1 1 3", "1 2", "1 1 1", "a b c"])
+    def test_parse_ranks_invalid(self, ranks_str):
+        """Test that non-permutations of 1, 2, 3 are rejected."""
+        with pytest.raises(ValueError, match="valid ranks"):
+            parse_ranks(ranks_str)
+
+
+class TestParseColors:
+    """Test color feedback parsing and validation."""
+
+    def test_parse_colors_valid(self):
+        """Test that five valid colors are parsed in order."""
+        assert parse_colors("g y e e g") == ["g", "y", "e", "e", "g"]
+
+    def test_parse_colors_mixed_case(self):
+        """Test that uppercase colors are converted to lowercase."""
+        assert parse_colors("G Y E e g") == ["g", "y", "e", "e", "g"]
+
+    def test_parse_colors_extra_whitespace(self):
+        """Test that extra whitespace between colors is ignored."""
+        assert parse_colors("  g   g   g   g   g  ") == ["g"] * 5
+
+    @pytest.mark.parametrize(
+        "color_str", ["g g g", "g g g g", "g g g g g g", "r b g y e", ""]
+    )
+    def test_parse_colors_invalid(self, color_str):
+        """Test that wrong counts or unknown colors are rejected."""
+        with pytest.raises(ValueError, match="exactly 5 colors"):
+            parse_colors(color_str)
@@ -1,88 +1,87 @@
 """Integration tests for the Solver class."""
 
+import copy
+import io
+
+import numpy as np
+import pytest
+
 from pokle_solver.card import Card  # type: ignore
 from pokle_solver.solver import Solver  # type: ignore
 
+# Hole cards of the fast example.py scenario, parsed once for the module
+QD, QC, TEN_H, TWO_H, NINE_H, KING_H = map(
+    Card.from_string, ("QD", "QC", "10H", "2H", "9H", "KH")
+)
 
-class TestSolverIntegrationBasic:
-    """Basic integration tests for the Solver workflow."""
 
-    def test_full_solve_workflow(self):
-        """Test complete solving workflow from initialization to solution."""
-        # Setup
-        p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
-        p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
-        p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
+@pytest.fixture(scope="module")
+def queens_scenario():
+    """The example.py scenario as Solver.from_arrays arguments, built once."""
+    holes = Card.indices([QD, QC, TEN_H, TWO_H, NINE_H, KING_H]).astype(np.int32)
+    return (
+        holes,
+        np.array([2, 1, 3], np.int8),
+        np.array([1, 3, 2], np.int8),
+        np.array([2, 1, 3], np.int8),
+    )
 
-        solver = Solver(
-            p1_hole,
-            p2_hole,
-            p3_hole,
-            flop_hand_ranks=[2, 1, 3],
-            turn_hand_ranks=[1, 3, 2],
-            river_hand_ranks=[2, 1, 3],
-        )
 
-        # Solve
-        possible_tables = solver.solve()
+def assert_tables_well_formed(tables):
+    """Check that there are tables and each is a list of 5 Cards, in one pass."""
+    assert len(tables) > 0
+    assert all(
+        isinstance(table, list)
+        and len(table) == 5
+        and all(isinstance(card, Card) for card in table)
+        for table in tables
+    )
 
-        # Verify results
-        assert len(possible_tables) > 0
-        assert all(isinstance(table, list) for table in possible_tables)
-        assert all(len(table) == 5 for table in possible_tables)
-        assert all(
-            all(isinstance(card, Card) for card in table) for table in possible_tables
-        )
 
-    def test_solve_and_get_maxh_table_workflow(self):
-        """Test solving and getting the maximum entropy table."""
-        p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
-        p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
-        p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
+def assert_boards_use_unique_cards(solver, boards):
+    """Check an (n, 5) card index array against itself and the hole cards.
 
-        solver = Solver(p1_hole, p2_hole, p3_hole, [2, 1, 3], [1, 3, 2], [2, 1, 3])
-
-        # Solve and get maxh table
-        possible_tables = solver.solve()
-        maxh_table = solver.get_maxh_table()
+    Each board becomes a 52-bit card mask, like the solver's own masks: five
+    distinct cards set five bits, and none may overlap the hole card mask.
+    """
+    hole_mask = 0
+    for hole in solver.hole_cards.values():
+        for card in hole:
+            hole_mask |= 1 << int(card)
+    board_masks = np.bitwise_or.reduce(
+        np.left_shift(np.uint64(1), boards.astype(np.uint64)), axis=1
+    )
+    assert not (board_masks & np.uint64(hole_mask)).any()
+    assert (np.bitwise_count(board_masks) == 5).all()
 
-        # Verify
-        assert maxh_table in possible_tables
-        assert isinstance(maxh_table, list)
-        assert len(maxh_table) == 5
 
-    def test_solve_get_maxh_and_filter_workflow(self):
-        """Test complete workflow: solve, get maxh, and filter with guess."""
-        p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
-        p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
-        p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
+class TestSolverIntegrationBasic:
+    """Basic integration tests for the Solver workflow."""
 
-        solver = Solver(p1_hole, p2_hole, p3_hole, [2, 1, 3], [1, 3, 2], [2, 1, 3])
+    def test_full_solve_workflow(self, queens_solver):
+        """Test complete solving workflow from initialization to solution."""
+        assert_tables_well_formed(queens_solver.valid_tables)
 
-        # Solve
-        solver.solve()
+    def test_solve_and_get_maxh_table_workflow(self, fresh_queens_solver):
+        """Test solving and getting the maximum entropy table."""
+        solver = fresh_queens_solver
 
         # Get maxh table
+        possible_tables = solver.valid_tables
         maxh_table = solver.get_maxh_table()
 
-        # Use all-green colors for a simple test (exact match)
-        colors = ["g", "g", "g", "g", "g"]
-
-        # Filter
-        solver.next_table_guess(colors)
-
-        # Verify - after all-green, should have exactly 1 table
-        assert len(solver.valid_tables) == 1
-        assert solver.valid_tables[0] == maxh_table
+        # Verify
+        assert solver.is_valid_table(maxh_table)
+        assert maxh_table in possible_tables
+        assert isinstance(maxh_table, list)
+        assert len(maxh_table) == 5
 
-    def test_solve_with_all_green_guess(self):
-        """Test that all green colors returns exactly one table (the correct answer)."""
-        p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
-        p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
-        p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
+    def test_solve_with_all_green_guess(self, fresh_queens_solver):
+        """Test that all green colors returns exactly one table (the correct answer).
 
-        solver = Solver(p1_hole, p2_hole, p3_hole, [2, 1, 3], [1, 3, 2], [2, 1, 3])
-        solver.solve()
+        This also covers the solve, get maxh and filter workflow.
+        """
+        solver = fresh_queens_solver
 
         maxh_table = solver.get_maxh_table()
 
@@ -95,23 +94,20 @@ class TestSolverIntegrationBasic:
         assert len(solver.valid_tables) == 1
         assert solver.valid_tables[0] == maxh_table
 
-    def test_multiple_guess_iterations(self):
-        """Test making multiple sequential guesses."""
-        p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
-        p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
-        p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
-
-        solver = Solver(p1_hole, p2_hole, p3_hole, [2, 1, 3], [1, 3, 2], [2, 1, 3])
-
-        solver.solve()
+    def test_guess_loop_with_computed_colors_finds_answer(self, fresh_queens_solver):
+        """Test that feeding back compare_colors() codes narrows down to the answer."""
+        solver = fresh_queens_solver
+        answer = solver.valid_tables[-1]
 
-        # First guess - use all green for predictable outcome
-        solver.get_maxh_table()
-        colors1 = ["g", "g", "g", "g", "g"]
-        solver.next_table_guess(colors1)
-        count_after_first = len(solver.valid_tables)
+        for _ in range(len(solver.valid_tables)):
+            guess = solver.get_maxh_table()
+            colors = Solver.compare_colors(guess, answer)
+            solver.next_table_guess(colors)
+            assert answer in solver.valid_tables
+            if (colors == 2).all():
+                break
 
-        assert count_after_first == 1  # All green should leave exactly one
+        assert solver.valid_tables == [answer]
 
 
 class TestSolverIntegrationKnownScenarios:
@@ -138,32 +134,15 @@ class TestSolverIntegrationKnownScenarios:
             river_hand_ranks=[1, 3, 2],
         )
 
-        possible_tables = solver.solve()
-
-        assert len(possible_tables) > 0
-
-        # Verify at least one solution exists and is properly formed
-        for table in possible_tables[:1]:
-            assert isinstance(table, list)
-            assert len(table) == 5
-            assert all(isinstance(card, Card) for card in table)
+        assert_tables_well_formed(solver.solve())
 
-    def test_scenario_queens_vs_tens_vs_nines(self):
+    def test_scenario_queens_vs_tens_vs_nines(self, queens_solver):
         """Test the fast example scenario from example.py."""
-        p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
-        p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
-        p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
-
-        solver = Solver(
-            p1_hole,
-            p2_hole,
-            p3_hole,
-            flop_hand_ranks=[2, 1, 3],
-            turn_hand_ranks=[1, 3, 2],
-            river_hand_ranks=[2, 1, 3],
-        )
+        p1_hole = queens_solver.hole_cards["P1"]
+        p2_hole = queens_solver.hole_cards["P2"]
+        p3_hole = queens_solver.hole_cards["P3"]
 
-        possible_tables = solver.solve()
+        possible_tables = queens_solver.valid_tables
 
         # This scenario should have exactly 32 solutions
         assert len(possible_tables) == 32
@@ -174,185 +153,135 @@ class TestSolverIntegrationKnownScenarios:
             assert isinstance(table, list)
             assert len(table) == 5
 
-            # Verify rankings using Solver._Solver__rank_hand
+            # Verify rankings using the packed HandRanking keys
             flop = table[:3]
-            p1_flop = Solver._Solver__rank_hand(flop, p1_hole)  # type: ignore
-            p2_flop = Solver._Solver__rank_hand(flop, p2_hole)  # type: ignore
-            p3_flop = Solver._Solver__rank_hand(flop, p3_hole)  # type: ignore
-
-            # Create rankings and verify order
-            hands = [
-                (1, p1_flop.rank, p1_flop.tie_breakers),
-                (2, p2_flop.rank, p2_flop.tie_breakers),
-                (3, p3_flop.rank, p3_flop.tie_breakers),
-            ]
-            hands.sort(key=lambda x: (x[1], x[2]), reverse=True)
-            flop_order = [h[0] for h in hands]
-            assert flop_order == [2, 1, 3]
-
-    def test_scenario_no_valid_rivers(self):
-        """Test scenario where no valid rivers exist (conflicting requirements)."""
-        # Create a scenario that might have no solutions
-        p1_hole = [Card.from_string("2H"), Card.from_string("3D")]
-        p2_hole = [Card.from_string("KC"), Card.from_string("KH")]
-        p3_hole = [Card.from_string("2C"), Card.from_string("5H")]
-
-        # Impossible: P1 best on flop with 2-3 vs pair of Kings
-        solver = Solver(
-            p1_hole,
-            p2_hole,
-            p3_hole,
-            flop_hand_ranks=[1, 2, 3],
-            turn_hand_ranks=[1, 2, 3],
-            river_hand_ranks=[1, 2, 3],
+            keys = np.array(
+                [
+                    Solver._Solver__rank_hand(flop, hole).key  # type: ignore
+                    for hole in (p1_hole, p2_hole, p3_hole)
+                ],
+                dtype=np.int64,
+            )
+            assert (np.argsort(-keys) + 1).tolist() == [2, 1, 3]
+
+    @pytest.mark.slow
+    def test_weak_leader_scenario_table_count(self, weak_leader_solver, rank_keys):
+        """Test a scenario that looks impossible: 2-3 offsuit leading pocket Kings.
+
+        P1 can still lead every phase by pairing or tripling a low card or
+        running out a wheel, so the solver must find those tables rather
+        than rejecting the scenario.
+        """
+        possible_tables = weak_leader_solver.valid_tables
+
+        assert len(possible_tables) == 24324
+
+        # P1 beats P2 beats P3 on the river, checked on every table in one batch
+        keys = np.stack(
+            [
+                rank_keys(weak_leader_solver.valid_boards, hole)
+                for hole in weak_leader_solver.hole_cards.values()
+            ],
+            axis=1,
         )
+        assert (keys[:, 0] > keys[:, 1]).all() and (keys[:, 1] > keys[:, 2]).all()
+
 
-        possible_tables = solver.solve()
+@pytest.fixture(scope="module")
+def queens_boards(queens_solver):
+    """The queens scenario's valid tables as one (n, 5) card index array.
 
-        # This scenario should have 0 solutions (or very few edge cases)
-        assert len(possible_tables) >= 0  # Could be 0 or small number
+    Built in a single pass over the tables and shared by the validation
+    tests; ragged tables can't form a 2D array, so a bad table fails here.
+    """
+    return np.array(queens_solver.valid_tables, dtype=np.int8)
 
 
 class TestSolverIntegrationValidation:
     """Integration tests for validation throughout the workflow."""
 
-    def test_all_solutions_have_complete_tables(self):
+    def test_all_solutions_have_complete_tables(self, queens_solver, queens_boards):
         """Test that all solutions have 5 cards (flop + turn + river)."""
-        p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
-        p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
-        p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
-
-        solver = Solver(p1_hole, p2_hole, p3_hole, [2, 1, 3], [1, 3, 2], [2, 1, 3])
-        possible_tables = solver.solve()
+        tables = queens_solver.valid_tables
+        assert_tables_well_formed(tables)
+        assert queens_boards.shape == (len(tables), 5)
 
-        for table in possible_tables:
-            assert len(table) == 5
-            # Flop is first 3 cards
-            flop = table[:3]
-            assert len(flop) == 3
-            # Turn is 4th card
-            turn = table[3]
-            assert isinstance(turn, Card)
-            # River is 5th card
-            river = table[4]
-            assert isinstance(river, Card)
-
-    def test_all_solutions_use_unique_cards(self):
+    def test_all_solutions_use_unique_cards(self, queens_solver, queens_boards):
         """Test that all solution tables don't reuse cards from hole cards."""
-        p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
-        p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
-        p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
-
-        solver = Solver(p1_hole, p2_hole, p3_hole, [2, 1, 3], [1, 3, 2], [2, 1, 3])
-        possible_tables = solver.solve()
-
-        all_hole_cards = set(p1_hole + p2_hole + p3_hole)
+        assert_boards_use_unique_cards(queens_solver, queens_boards)
 
-        for table in possible_tables:
-            board_cards = set(table)
-            # No overlap between hole cards and board cards
-            assert len(board_cards & all_hole_cards) == 0
-
-    def test_all_solutions_satisfy_hand_rankings(self):
+    def test_all_solutions_satisfy_hand_rankings(
+        self, queens_solver, queens_boards, rank_keys
+    ):
         """Test that all solutions satisfy the specified hand rankings."""
-        p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
-        p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
-        p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
+        holes = list(queens_solver.hole_cards.values())
 
         flop_ranks = [2, 1, 3]
         turn_ranks = [1, 3, 2]
         river_ranks = [2, 1, 3]
 
-        solver = Solver(p1_hole, p2_hole, p3_hole, flop_ranks, turn_ranks, river_ranks)
-        possible_tables = solver.solve()
-
-        for table in possible_tables:
-            # Check flop rankings
-            flop = table[:3]
-            flop_hands = [
-                (1, Solver._Solver__rank_hand(flop, p1_hole)),  # type: ignore
-                (2, Solver._Solver__rank_hand(flop, p2_hole)),  # type: ignore
-                (3, Solver._Solver__rank_hand(flop, p3_hole)),  # type: ignore
-            ]
-            flop_hands.sort(key=lambda x: (x[1].rank, x[1].tie_breakers), reverse=True)
-            flop_order = [h[0] for h in flop_hands]
-            assert flop_order == flop_ranks
-
-            # Check turn rankings
-            turn_table = table[:4]
-            turn_hands = [
-                (1, Solver._Solver__rank_hand(turn_table, p1_hole)),  # type: ignore
-                (2, Solver._Solver__rank_hand(turn_table, p2_hole)),  # type: ignore
-                (3, Solver._Solver__rank_hand(turn_table, p3_hole)),  # type: ignore
-            ]
-            turn_hands.sort(key=lambda x: (x[1].rank, x[1].tie_breakers), reverse=True)
-            turn_order = [h[0] for h in turn_hands]
-            assert turn_order == turn_ranks
-
-            # Check river rankings
-            river_hands = [
-                (1, Solver._Solver__rank_hand(table, p1_hole)),  # type: ignore
-                (2, Solver._Solver__rank_hand(table, p2_hole)),  # type: ignore
-                (3, Solver._Solver__rank_hand(table, p3_hole)),  # type: ignore
-            ]
-            river_hands.sort(key=lambda x: (x[1].rank, x[1].tie_breakers), reverse=True)
-            river_order = [h[0] for h in river_hands]
-            assert river_order == river_ranks
-
-    def test_maxh_table_has_highest_entropy(self):
+        for size, expected in ((3, flop_ranks), (4, turn_ranks), (5, river_ranks)):
+            # Rank every table's first `size` cards for each player in one batch
+            keys = np.stack(
+                [
+                    rank_keys(queens_boards[:, :size], hole)
+                    for hole in holes
+                ],
+                axis=1,
+            )
+            # Player numbers from best to worst hand, for every table at once
+            orders = np.argsort(-keys, axis=1, kind="stable") + 1
+            assert (orders == np.array(expected)).all()
+
+    def test_maxh_table_has_highest_entropy(self, fresh_queens_solver):
         """Test that the maxh table is actually the one with highest entropy."""
-        p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
-        p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
-        p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
-
-        solver = Solver(p1_hole, p2_hole, p3_hole, [2, 1, 3], [1, 3, 2], [2, 1, 3])
-        solver.solve()
+        solver = fresh_queens_solver
 
         maxh_table = solver.get_maxh_table()
 
         # The maxh_table should be in the valid_tables
-        assert maxh_table in solver.valid_tables
+        assert solver.is_valid_table(maxh_table)
 
         # Verify it's a valid table structure
         assert isinstance(maxh_table, list)
         assert len(maxh_table) == 5
 
 
-class TestSolverIntegrationPrintGame:
-    """Integration tests for print_game functionality."""
-
-    def test_print_game_displays_all_phases(self, capsys):
-        """Test that print_game displays all game phases."""
-        p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
-        p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
-        p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
-
-        solver = Solver(p1_hole, p2_hole, p3_hole, [2, 1, 3], [1, 3, 2], [2, 1, 3])
-        solver.solve()
+@pytest.fixture(scope="module")
+def queens_game_output(queens_solver):
+    """print_game output for the queens scenario's maxh table, captured once."""
+    solver = copy.deepcopy(queens_solver)
+    maxh_table = solver.get_maxh_table()
+    sink = io.StringIO()
+    solver.print_game(maxh_table, file=sink)
+    return sink.getvalue()
 
-        maxh_table = solver.get_maxh_table()
-        solver.print_game(maxh_table)
 
-        captured = capsys.readouterr()
-
-        # Check all phases are displayed
-        assert "flop:" in captured.out
-        assert "turn:" in captured.out
-        assert "river:" in captured.out
-
-        # Check player headers
-        assert "P1" in captured.out
-        assert "P2" in captured.out
-        assert "P3" in captured.out
+class TestSolverIntegrationPrintGame:
+    """Integration tests for print_game functionality."""
 
-    def test_print_game_after_guess(self, capsys):
+    @pytest.mark.parametrize(
+        "expected",
+        [
+            # Every game phase
+            "flop:",
+            "turn:",
+            "river:",
+            # Every player header
+            "P1",
+            "P2",
+            "P3",
+            # The results header
+            "Pokle Solver Results",
+        ],
+    )
+    def test_print_game_displays(self, queens_game_output, expected):
+        """Test that print_game displays the phases, players and header."""
+        assert expected in queens_game_output
+
+    def test_print_game_after_guess(self, stdout_sink, fresh_queens_solver):
         """Test that print_game shows guess history after a guess."""
-        p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
-        p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
-        p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
-
-        solver = Solver(p1_hole, p2_hole, p3_hole, [2, 1, 3], [1, 3, 2], [2, 1, 3])
-        solver.solve()
+        solver = fresh_queens_solver
 
         # Make first guess with all green
         maxh1 = solver.get_maxh_table()
@@ -360,41 +289,21 @@ class TestSolverIntegrationPrintGame:
         solver.next_table_guess(colors1)
 
         # Print game
-        solver.print_game(maxh1)
-
-        captured = capsys.readouterr()
+        solver.print_game(maxh1, file=stdout_sink)
+        output = stdout_sink.getvalue()
 
         # Output should contain game table
-        assert "flop" in captured.out.lower()
-        assert "|" in captured.out  # Table borders
-
-    def test_print_game_header(self, capsys):
-        """Test that print_game shows the Pokle Solver Results header."""
-        p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
-        p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
-        p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
-
-        solver = Solver(p1_hole, p2_hole, p3_hole, [2, 1, 3], [1, 3, 2], [2, 1, 3])
-        solver.solve()
-
-        maxh_table = solver.get_maxh_table()
-        solver.print_game(maxh_table)
-
-        captured = capsys.readouterr()
-
-        # Should have the header
-        assert "Pokle Solver Results" in captured.out
+        assert "flop" in output.lower()
+        assert "|" in output  # Table borders
 
 
 class TestSolverIntegrationEdgeCases:
     """Integration tests for edge cases."""
 
-    def test_solver_with_different_rank_permutations(self):
+    def test_solver_with_different_rank_permutations(self, queens_scenario):
         """Test solver with different permutations of hand ranks using constrained scenarios."""
         # Use the same fast scenario from example.py but with different rank permutations
-        p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
-        p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
-        p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
+        holes = queens_scenario[0]
 
         # Try a couple different permutations that should have reasonable solution counts
         permutations = [
@@ -405,7 +314,7 @@ class TestSolverIntegrationEdgeCases:
         ]
 
         for flop, turn, river in permutations:
-            solver = Solver(p1_hole, p2_hole, p3_hole, flop, turn, river)
+            solver = Solver.from_arrays(holes, flop, turn, river)
             possible_tables = solver.solve()
 
             # Should get some results for each permutation
@@ -413,25 +322,38 @@ class TestSolverIntegrationEdgeCases:
             # May or may not have solutions depending on permutation
             assert len(possible_tables) >= 0
 
-    def test_solver_deterministic_results(self):
+    def test_solver_deterministic_results(self, queens_solver, queens_scenario):
         """Test that solving the same scenario twice gives the same results."""
-        p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
-        p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
-        p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
+        result1 = queens_solver.valid_tables
 
-        solver1 = Solver(p1_hole, p2_hole, p3_hole, [2, 1, 3], [1, 3, 2], [2, 1, 3])
-        result1 = solver1.solve()
-
-        solver2 = Solver(p1_hole, p2_hole, p3_hole, [2, 1, 3], [1, 3, 2], [2, 1, 3])
+        solver2 = Solver.from_arrays(*queens_scenario)
         result2 = solver2.solve()
 
         # Should have same number of solutions
         assert len(result1) == len(result2)
 
-        # Solutions should be the same (comparing as strings for set operations)
-        result1_strings = {" ".join(str(card) for card in table) for table in result1}
-        result2_strings = {" ".join(str(card) for card in table) for table in result2}
-        assert result1_strings == result2_strings
+        # Solutions should be the same; Cards hash, so compare the tables directly
+        assert {tuple(table) for table in result1} == {tuple(table) for table in result2}
+
+    def test_solve_with_workers_matches_serial_order(
+        self, queens_solver, queens_scenario
+    ):
+        """Test that splitting flops across processes returns the serial tables in order."""
+        parallel = Solver.from_arrays(*queens_scenario)
+
+        assert parallel.solve(workers=2) == queens_solver.valid_tables
+
+    def test_solve_with_workers_no_valid_flops(self):
+        """Test that the process path returns no tables when no flop is valid."""
+        # P3's kings can never beat both pairs of aces
+        p1_hole = [Card.from_string("AH"), Card.from_string("AD")]
+        p2_hole = [Card.from_string("AC"), Card.from_string("AS")]
+        p3_hole = [Card.from_string("KH"), Card.from_string("KD")]
+
+        solver = Solver(p1_hole, p2_hole, p3_hole, [3, 1, 2], [3, 1, 2], [3, 1, 2])
+
+        assert solver.solve(workers=2) == []
+        assert solver.valid_tables == []
 
 
 class TestSolverKickerBugRegression:
@@ -443,68 +365,53 @@ class TestSolverKickerBugRegression:
     table counts.
     """
 
-    def test_slow_output_integration(self):
+    @pytest.mark.slow
+    def test_slow_output_integration(self, slow_output_solver):
         """Integration test for slow_output scenario.
 
         This scenario involves pairs and two pairs across multiple phases,
         which exposed the kicker selection bug.
         """
-        p1 = [Card.from_string("KH"), Card.from_string("6S")]
-        p2 = [Card.from_string("8C"), Card.from_string("8H")]
-        p3 = [Card.from_string("4H"), Card.from_string("9S")]
-
-        solver = Solver(p1, p2, p3, [2, 3, 1], [3, 2, 1], [3, 1, 2])
-        tables = solver.solve()
+        tables = slow_output_solver.valid_tables
 
         # Verify count
         assert len(tables) == 1323
 
         # Verify all tables are valid and complete
-        assert all(len(table) == 5 for table in tables)
+        boards = np.array(tables, dtype=np.int8)
+        assert boards.shape == (1323, 5)
         assert all(isinstance(card, Card) for table in tables for card in table)
 
         # Verify all solutions use unique cards
-        for table in tables:
-            all_cards = p1 + p2 + p3 + table
-            assert len(all_cards) == len(set(all_cards))
+        assert_boards_use_unique_cards(slow_output_solver, boards)
 
-    def test_very_slow_integration(self):
+    @pytest.mark.slow
+    def test_very_slow_integration(self, very_slow_solver):
         """Integration test for very_slow scenario.
 
         This scenario involves complex hand interactions across phases
         that required careful kicker tracking.
         """
-        p1 = [Card.from_string("JH"), Card.from_string("6H")]
-        p2 = [Card.from_string("4H"), Card.from_string("7S")]
-        p3 = [Card.from_string("5D"), Card.from_string("8D")]
-
-        solver = Solver(p1, p2, p3, [3, 2, 1], [2, 3, 1], [2, 1, 3])
-        tables = solver.solve()
+        tables = very_slow_solver.valid_tables
 
         # Verify count
         assert len(tables) == 7606
 
         # Verify all tables are complete
-        assert all(len(table) == 5 for table in tables)
+        boards = np.array(tables, dtype=np.int8)
+        assert boards.shape == (7606, 5)
 
-        # Sample validation: check first few tables are valid
-        for table in tables[:10]:
-            all_cards = p1 + p2 + p3 + table
-            assert len(all_cards) == len(set(all_cards))
+        # Checking every table costs one array scan, so no need to sample
+        assert_boards_use_unique_cards(very_slow_solver, boards)
 
-    def test_scenario_with_three_of_a_kind_phases(self):
+    def test_scenario_with_three_of_a_kind_phases(self, example_12_25_solver):
         """Test scenario where hand types evolve across phases.
 
         This tests that kicker selection works correctly when hand rankings
         change across different game phases.
         """
-        p1 = [Card.from_string("7C"), Card.from_string("9D")]
-        p2 = [Card.from_string("KH"), Card.from_string("KS")]
-        p3 = [Card.from_string("8D"), Card.from_string("4S")]
-
         # Use the known working example from regression test
-        solver = Solver(p1, p2, p3, [1, 2, 3], [3, 1, 2], [2, 3, 1])
-        tables = solver.solve()
+        tables = example_12_25_solver.valid_tables
 
         # Should have valid solutions (this is the example_12_25 scenario)
         assert len(tables) == 1474
@@ -512,42 +419,34 @@ class TestSolverKickerBugRegression:
         # All solutions should use exactly 5 cards
         assert all(len(table) == 5 for table in tables)
 
-    def test_mixed_hand_types_across_phases(self):
+    @pytest.mark.slow
+    def test_mixed_hand_types_across_phases(self, mixed_hands_solver):
         """Test that different hand types in different phases work correctly.
 
         This ensures the kicker bug fix doesn't break scenarios with
         varied hand types (pairs, trips, two pair, etc.) across phases.
         """
-        # Setup with known hole cards
-        p1 = [Card.from_string("9C"), Card.from_string("9D")]
-        p2 = [Card.from_string("7H"), Card.from_string("7S")]
-        p3 = [Card.from_string("5C"), Card.from_string("3D")]
+        p1, p2, p3 = mixed_hands_solver.hole_cards.values()
 
         # Rankings change across phases
-        solver = Solver(p1, p2, p3, [1, 2, 3], [2, 1, 3], [3, 2, 1])
-        tables = solver.solve()
+        tables = mixed_hands_solver.valid_tables
 
         # Should produce consistent results
         assert len(tables) > 0
 
         # Verify solutions are deterministic
         solver2 = Solver(p1, p2, p3, [1, 2, 3], [2, 1, 3], [3, 2, 1])
-        tables2 = solver2.solve()
-        assert len(tables) == len(tables2)
+        assert solver2.solve() == tables
 
-    def test_all_table_cards_used_validation(self):
+    def test_all_table_cards_used_validation(self, broadway_solver):
         """Test that the solver correctly validates all table cards are used.
 
         The kicker bug caused the solver to incorrectly track which cards
         were used, allowing invalid tables through. This test ensures
         the fix properly validates card usage.
         """
-        p1 = [Card.from_string("AS"), Card.from_string("KS")]
-        p2 = [Card.from_string("QH"), Card.from_string("QD")]
-        p3 = [Card.from_string("JC"), Card.from_string("10C")]
-
-        solver = Solver(p1, p2, p3, [1, 2, 3], [2, 1, 3], [1, 3, 2])
-        tables = solver.solve()
+        p1, p2, p3 = broadway_solver.hole_cards.values()
+        tables = broadway_solver.valid_tables
 
         # Manually verify a sample of tables
         for table in tables[:5]:
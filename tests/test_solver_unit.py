@@ -4,26 +4,43 @@ import pytest
 import numpy as np
 
 from pokle_solver.card import Card  # type: ignore
-from pokle_solver.solver import Solver, PhaseEvaluation, MASTER_DECK  # type: ignore
+from pokle_solver.solver import (  # type: ignore
+    Solver,
+    HandRanking,
+    PhaseEvaluation,
+    MASTER_DECK,
+)
+
+
+@pytest.fixture(scope="module")
+def hole_cards():
+    """Hole cards shared by the construction tests, as (P1, P2, P3) lists."""
+    return (
+        [Card(10, "H"), Card(11, "H")],
+        [Card(2, "C"), Card(3, "C")],
+        [Card(14, "D"), Card(13, "D")],
+    )
+
+
+@pytest.fixture(scope="module")
+def base_solver(hole_cards):
+    """Unsolved Solver over hole_cards, shared by tests that only inspect it."""
+    return Solver(*hole_cards, [1, 2, 3], [2, 1, 3], [3, 2, 1])
 
 
 class TestSolverInitialization:
     """Test Solver class initialization and validation."""
 
-    def test_init_valid_inputs(self):
+    def test_init_valid_inputs(self, hole_cards, base_solver):
         """Test initialization with valid inputs."""
-        p1_hole = [Card(10, "H"), Card(11, "H")]
-        p2_hole = [Card(2, "C"), Card(3, "C")]
-        p3_hole = [Card(14, "D"), Card(13, "D")]
+        p1_hole, p2_hole, p3_hole = hole_cards
 
-        solver = Solver(p1_hole, p2_hole, p3_hole, [1, 2, 3], [2, 1, 3], [3, 2, 1])
-
-        assert solver.hole_cards["P1"] == p1_hole
-        assert solver.hole_cards["P2"] == p2_hole
-        assert solver.hole_cards["P3"] == p3_hole
-        assert solver.flop_hand_ranks == [1, 2, 3]
-        assert solver.turn_hand_ranks == [2, 1, 3]
-        assert solver.river_hand_ranks == [3, 2, 1]
+        assert base_solver.hole_cards["P1"] == p1_hole
+        assert base_solver.hole_cards["P2"] == p2_hole
+        assert base_solver.hole_cards["P3"] == p3_hole
+        assert base_solver.flop_hand_ranks == [1, 2, 3]
+        assert base_solver.turn_hand_ranks == [2, 1, 3]
+        assert base_solver.river_hand_ranks == [3, 2, 1]
 
     def test_init_invalid_hole_cards_not_list(self):
         """Test that non-list hole cards raise ValueError."""
@@ -67,115 +84,114 @@ class TestSolverInitialization:
                 [3, 2, 1],
             )
 
-    def test_init_invalid_hand_ranks_not_list(self):
+    def test_init_invalid_hand_ranks_not_list(self, hole_cards):
         """Test that non-list hand ranks raise ValueError."""
-        p1_hole = [Card(10, "H"), Card(11, "H")]
-        p2_hole = [Card(2, "C"), Card(3, "C")]
-        p3_hole = [Card(14, "D"), Card(13, "D")]
+        p1_hole, p2_hole, p3_hole = hole_cards
 
         with pytest.raises(ValueError, match="must be a permutation of"):
             Solver(p1_hole, p2_hole, p3_hole, (1, 2, 3), [2, 1, 3], [3, 2, 1])  # type: ignore[arg-type]
 
-    def test_init_invalid_hand_ranks_wrong_values(self):
+    def test_init_invalid_hand_ranks_wrong_values(self, hole_cards):
         """Test that hand ranks with wrong values raise ValueError."""
-        p1_hole = [Card(10, "H"), Card(11, "H")]
-        p2_hole = [Card(2, "C"), Card(3, "C")]
-        p3_hole = [Card(14, "D"), Card(13, "D")]
+        p1_hole, p2_hole, p3_hole = hole_cards
 
         with pytest.raises(ValueError, match="must be a permutation of"):
             Solver(p1_hole, p2_hole, p3_hole, [1, 2, 4], [2, 1, 3], [3, 2, 1])
 
-    def test_init_invalid_hand_ranks_duplicates(self):
+    def test_init_invalid_hand_ranks_duplicates(self, hole_cards):
         """Test that hand ranks with duplicates raise ValueError."""
-        p1_hole = [Card(10, "H"), Card(11, "H")]
-        p2_hole = [Card(2, "C"), Card(3, "C")]
-        p3_hole = [Card(14, "D"), Card(13, "D")]
+        p1_hole, p2_hole, p3_hole = hole_cards
 
         with pytest.raises(ValueError, match="must be a permutation of"):
             Solver(p1_hole, p2_hole, p3_hole, [1, 1, 2], [2, 1, 3], [3, 2, 1])
 
-    def test_valid_tables_property_initially_empty(self):
-        """Test that valid_tables property starts empty."""
-        p1_hole = [Card(10, "H"), Card(11, "H")]
-        p2_hole = [Card(2, "C"), Card(3, "C")]
-        p3_hole = [Card(14, "D"), Card(13, "D")]
+    def test_init_builds_remaining_deck_in_index_order(
+        self, hole_cards, base_solver
+    ):
+        """Test that the deck minus the hole cards is built once, sorted by index."""
+        p1_hole, p2_hole, p3_hole = hole_cards
 
-        solver = Solver(p1_hole, p2_hole, p3_hole, [1, 2, 3], [2, 1, 3], [3, 2, 1])
+        indices = [card.card_index for card in base_solver.current_deck]
+        assert len(indices) == 46
+        assert indices == sorted(indices)
+        assert not set(p1_hole + p2_hole + p3_hole) & set(base_solver.current_deck)
 
-        assert solver.valid_tables == []
-        assert isinstance(solver.valid_tables, list)
+    def test_from_arrays_matches_card_constructor(self, hole_cards, base_solver):
+        """Test that from_arrays builds the same Solver as the Card lists."""
+        p1_hole, p2_hole, p3_hole = hole_cards
+        holes = Card.indices(p1_hole + p2_hole + p3_hole).astype(np.int32)
 
-    def test_valid_tables_property_is_read_only(self):
-        """Test that valid_tables property cannot be set directly."""
-        p1_hole = [Card(10, "H"), Card(11, "H")]
-        p2_hole = [Card(2, "C"), Card(3, "C")]
-        p3_hole = [Card(14, "D"), Card(13, "D")]
+        solver = Solver.from_arrays(
+            holes, np.array([1, 2, 3], np.int8), [2, 1, 3], [3, 2, 1]
+        )
+
+        assert solver.hole_cards == {"P1": p1_hole, "P2": p2_hole, "P3": p3_hole}
+        assert solver.hole_cards["P1"][0] is Card.intern(10, "H")
+        assert solver.flop_hand_ranks == [1, 2, 3]
+        assert solver.current_deck == base_solver.current_deck
+
+    def test_from_arrays_rejects_wrong_hole_count(self):
+        """Test that from_arrays needs exactly 6 hole card indices."""
+        with pytest.raises(ValueError, match="exactly 6 values"):
+            Solver.from_arrays(np.arange(5), [1, 2, 3], [2, 1, 3], [3, 2, 1])
 
-        solver = Solver(p1_hole, p2_hole, p3_hole, [1, 2, 3], [2, 1, 3], [3, 2, 1])
+    def test_valid_tables_property_initially_empty(self, base_solver):
+        """Test that valid_tables property starts empty."""
+        assert base_solver.valid_tables == []
+        assert isinstance(base_solver.valid_tables, list)
 
+    def test_valid_tables_property_is_read_only(self, base_solver):
+        """Test that valid_tables property cannot be set directly."""
         with pytest.raises(AttributeError):
-            solver.valid_tables = []  # type: ignore[misc]
+            base_solver.valid_tables = []  # type: ignore[misc]
 
 
 class TestSolverPrivateMethods:
     """Test that private methods are not accessible."""
 
-    def test_possible_flops_is_private(self):
+    def test_possible_flops_is_private(self, base_solver):
         """Test that possible_flops is not accessible."""
-        p1_hole = [Card(10, "H"), Card(11, "H")]
-        p2_hole = [Card(2, "C"), Card(3, "C")]
-        p3_hole = [Card(14, "D"), Card(13, "D")]
-
-        solver = Solver(p1_hole, p2_hole, p3_hole, [1, 2, 3], [2, 1, 3], [3, 2, 1])
-
         with pytest.raises(AttributeError):
-            solver.possible_flops()  # type: ignore[attr-defined]
+            base_solver.possible_flops()  # type: ignore[attr-defined]
 
-    def test_possible_turns_is_private(self):
+    def test_possible_turns_is_private(self, base_solver):
         """Test that possible_turns is not accessible."""
-        p1_hole = [Card(10, "H"), Card(11, "H")]
-        p2_hole = [Card(2, "C"), Card(3, "C")]
-        p3_hole = [Card(14, "D"), Card(13, "D")]
-
-        solver = Solver(p1_hole, p2_hole, p3_hole, [1, 2, 3], [2, 1, 3], [3, 2, 1])
-
         with pytest.raises(AttributeError):
-            solver.possible_turns([])  # type: ignore[attr-defined]
+            base_solver.possible_turns([])  # type: ignore[attr-defined]
 
-    def test_possible_rivers_is_private(self):
+    def test_possible_rivers_is_private(self, base_solver):
         """Test that possible_rivers is not accessible."""
-        p1_hole = [Card(10, "H"), Card(11, "H")]
-        p2_hole = [Card(2, "C"), Card(3, "C")]
-        p3_hole = [Card(14, "D"), Card(13, "D")]
-
-        solver = Solver(p1_hole, p2_hole, p3_hole, [1, 2, 3], [2, 1, 3], [3, 2, 1])
-
         with pytest.raises(AttributeError):
-            solver.possible_rivers([])  # type: ignore[attr-defined]
+            base_solver.possible_rivers([])  # type: ignore[attr-defined]
 
-    def test_compare_tables_is_private(self):
+    def test_compare_tables_is_private(self, base_solver):
         """Test that compare_tables is not accessible."""
-        p1_hole = [Card(10, "H"), Card(11, "H")]
-        p2_hole = [Card(2, "C"), Card(3, "C")]
-        p3_hole = [Card(14, "D"), Card(13, "D")]
+        with pytest.raises(AttributeError):
+            base_solver.compare_tables([], [])  # type: ignore[attr-defined]
 
-        solver = Solver(p1_hole, p2_hole, p3_hole, [1, 2, 3], [2, 1, 3], [3, 2, 1])
 
-        with pytest.raises(AttributeError):
-            solver.compare_tables([], [])  # type: ignore[attr-defined]
+@pytest.fixture(scope="module")
+def queens_solved_once():
+    """The queens scenario solved from scratch once for the solve() tests.
+
+    Returns (solver, len(valid_tables) before solving, solve() result). Unlike
+    the session queens_solver, this always runs the real enumeration.
+    """
+    p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
+    p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
+    p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
+
+    solver = Solver(p1_hole, p2_hole, p3_hole, [2, 1, 3], [1, 3, 2], [2, 1, 3])
+    tables_before_solve = len(solver.valid_tables)
+    return solver, tables_before_solve, solver.solve()
 
 
 class TestSolverPublicMethods:
     """Test Solver public methods."""
 
-    def test_solve_returns_list(self):
+    def test_solve_returns_list(self, queens_solved_once):
         """Test that solve returns a list."""
-        p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
-        p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
-        p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
-
-        solver = Solver(p1_hole, p2_hole, p3_hole, [2, 1, 3], [1, 3, 2], [2, 1, 3])
-        result = solver.solve()
+        _, _, result = queens_solved_once
 
         assert isinstance(result, list)
         assert len(result) > 0
@@ -184,18 +200,11 @@ class TestSolverPublicMethods:
         assert all(len(table) == 5 for table in result)
         assert all(all(isinstance(card, Card) for card in table) for table in result)
 
-    def test_solve_updates_valid_tables_property(self):
+    def test_solve_updates_valid_tables_property(self, queens_solved_once):
         """Test that solve updates the valid_tables property."""
-        p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
-        p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
-        p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
-
-        solver = Solver(p1_hole, p2_hole, p3_hole, [2, 1, 3], [1, 3, 2], [2, 1, 3])
-
-        assert len(solver.valid_tables) == 0
-
-        result = solver.solve()
+        solver, tables_before_solve, result = queens_solved_once
 
+        assert tables_before_solve == 0
         assert len(solver.valid_tables) > 0
         assert solver.valid_tables == result
 
@@ -210,14 +219,9 @@ class TestSolverPublicMethods:
         with pytest.raises(ValueError, match="No possible rivers calculated"):
             solver.get_maxh_table()
 
-    def test_get_maxh_table_returns_list(self):
+    def test_get_maxh_table_returns_list(self, fresh_queens_solver):
         """Test that get_maxh_table returns a list of Card objects."""
-        p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
-        p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
-        p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
-
-        solver = Solver(p1_hole, p2_hole, p3_hole, [2, 1, 3], [1, 3, 2], [2, 1, 3])
-        solver.solve()
+        solver = fresh_queens_solver
 
         maxh_table = solver.get_maxh_table()
 
@@ -225,20 +229,55 @@ class TestSolverPublicMethods:
         assert len(maxh_table) == 5
         assert all(isinstance(card, Card) for card in maxh_table)
 
-    def test_get_maxh_table_returns_valid_table(self):
+    def test_get_maxh_table_returns_valid_table(self, fresh_queens_solver):
         """Test that get_maxh_table returns a table from valid_tables."""
-        p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
-        p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
-        p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
-
-        solver = Solver(p1_hole, p2_hole, p3_hole, [2, 1, 3], [1, 3, 2], [2, 1, 3])
-        solver.solve()
+        solver = fresh_queens_solver
 
         maxh_table = solver.get_maxh_table()
 
         # The maxh_table should be in valid_tables
         assert maxh_table in solver.valid_tables
 
+    def test_get_maxh_table_is_cached_until_guess(
+        self, fresh_queens_solver, monkeypatch
+    ):
+        """Test that get_maxh_table reuses its entropy pass until the tables change."""
+        solver = fresh_queens_solver
+        calls = []
+        score_tables = Solver._Solver__max_entropy_table  # type: ignore
+
+        def counting_score(self, use_sampling):
+            calls.append(use_sampling)
+            return score_tables(self, use_sampling)
+
+        monkeypatch.setattr(Solver, "_Solver__max_entropy_table", counting_score)
+
+        first = solver.get_maxh_table()
+        assert solver.get_maxh_table() == first
+        assert calls == [True]
+
+        solver.get_maxh_table(use_sampling=False)
+        assert calls == [True, False]
+
+        solver.next_table_guess(["g", "g", "g", "g", "g"])
+        solver.get_maxh_table(use_sampling=False)
+        assert calls == [True, False, False]
+
+    def test_is_valid_table_tracks_valid_tables(self, fresh_queens_solver):
+        """Test that is_valid_table matches list membership as the tables shrink."""
+        solver = fresh_queens_solver
+        maxh_table = solver.get_maxh_table()
+        other_table = next(t for t in solver.valid_tables if t != maxh_table)
+
+        assert solver.is_valid_table(maxh_table)
+        assert solver.is_valid_table(other_table)
+        assert not solver.is_valid_table(other_table[::-1])
+
+        solver.next_table_guess(["g", "g", "g", "g", "g"])
+
+        assert solver.is_valid_table(maxh_table)
+        assert not solver.is_valid_table(other_table)
+
     def test_next_table_guess_before_solve_raises_error(self):
         """Test that next_table_guess raises error if called before solve."""
         p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
@@ -250,41 +289,70 @@ class TestSolverPublicMethods:
         with pytest.raises(ValueError, match="No current guess available"):
             solver.next_table_guess(["g", "g", "g", "g", "g"])
 
-    def test_next_table_guess_invalid_color_count(self):
+    def test_next_table_guess_invalid_color_count(self, fresh_queens_solver):
         """Test that next_table_guess validates color count."""
-        p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
-        p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
-        p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
-
-        solver = Solver(p1_hole, p2_hole, p3_hole, [2, 1, 3], [1, 3, 2], [2, 1, 3])
-        solver.solve()
+        solver = fresh_queens_solver
         solver.get_maxh_table()
 
         with pytest.raises(ValueError, match="must be a list of 5 colors"):
             solver.next_table_guess(["g", "g", "g"])
 
-    def test_next_table_guess_invalid_color_values(self):
+    def test_next_table_guess_invalid_color_values(self, fresh_queens_solver):
         """Test that next_table_guess validates color values."""
-        p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
-        p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
-        p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
-
-        solver = Solver(p1_hole, p2_hole, p3_hole, [2, 1, 3], [1, 3, 2], [2, 1, 3])
-        solver.solve()
+        solver = fresh_queens_solver
         solver.get_maxh_table()
 
         # Invalid color value should raise KeyError when converting to int
         with pytest.raises(KeyError):
             solver.next_table_guess(["g", "g", "invalid", "g", "g"])
 
-    def test_next_table_guess_filters_valid_tables(self):
-        """Test that next_table_guess correctly filters valid_tables with all-green scenario."""
-        p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
-        p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
-        p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
+    def test_next_table_guess_invalid_color_codes(self, fresh_queens_solver):
+        """Test that next_table_guess validates integer color code arrays."""
+        solver = fresh_queens_solver
+        solver.get_maxh_table()
 
-        solver = Solver(p1_hole, p2_hole, p3_hole, [2, 1, 3], [1, 3, 2], [2, 1, 3])
-        initial_count = len(solver.solve())
+        with pytest.raises(ValueError, match="Color codes must be"):
+            solver.next_table_guess(np.array([2, 2, 3, 2, 2], dtype=np.int8))
+        with pytest.raises(ValueError, match="Color codes must be"):
+            solver.next_table_guess(np.array([2, 2, 2], dtype=np.int8))
+        with pytest.raises(ValueError, match="Color codes must be"):
+            solver.next_table_guess(np.array([2.0, 2, 2, 2, 2]))
+
+    def test_next_table_guess_keeps_tables_with_matching_colors(
+        self, fresh_queens_solver
+    ):
+        """Test that filtering keeps exactly the tables giving the same feedback."""
+        solver = fresh_queens_solver
+        tables = solver.valid_tables
+        guess = solver.get_maxh_table()
+        colors = Solver.compare_colors(guess, tables[-1])
+
+        expected = [
+            table
+            for table in tables
+            if (Solver.compare_colors(guess, table) == colors).all()
+        ]
+        assert solver.next_table_guess(colors) == expected
+
+    def test_valid_boards_follow_valid_tables(self, fresh_queens_solver):
+        """Test that valid_boards stays row-aligned with valid_tables when filtered."""
+        solver = fresh_queens_solver
+
+        def expected_boards():
+            return np.array(solver.valid_tables, dtype=np.int8).reshape(-1, 5)
+
+        assert solver.valid_boards.dtype == np.int8
+        assert np.array_equal(solver.valid_boards, expected_boards())
+
+        guess = solver.get_maxh_table()
+        solver.next_table_guess(Solver.compare_colors(guess, solver.valid_tables[-1]))
+
+        assert np.array_equal(solver.valid_boards, expected_boards())
+
+    def test_next_table_guess_filters_valid_tables(self, fresh_queens_solver):
+        """Test that next_table_guess correctly filters valid_tables with all-green scenario."""
+        solver = fresh_queens_solver
+        initial_count = len(solver.valid_tables)
 
         assert initial_count > 0, "Should have at least one valid table"
 
@@ -313,38 +381,33 @@ class TestSolverPublicMethods:
         with pytest.raises(ValueError, match="No possible rivers calculated"):
             solver.print_game(table)
 
-    def test_print_game_invalid_table_type(self):
+    def test_print_game_invalid_table_type(self, fresh_queens_solver):
         """Test that print_game validates table is a list of 5 Card objects."""
-        p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
-        p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
-        p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
-
-        solver = Solver(p1_hole, p2_hole, p3_hole, [2, 1, 3], [1, 3, 2], [2, 1, 3])
-        solver.solve()
+        solver = fresh_queens_solver
 
         with pytest.raises(ValueError, match="must be a list of 5 Card objects"):
             solver.print_game("not a table")  # type: ignore[arg-type]
 
-    def test_print_game_produces_output(self, capsys):
-        """Test that print_game produces console output."""
+    def test_print_game_produces_output(self, stdout_sink):
+        """Test that print_game writes the display to the given stream."""
         p1_hole = [Card.from_string("QD"), Card.from_string("QC")]
         p2_hole = [Card.from_string("10H"), Card.from_string("2H")]
         p3_hole = [Card.from_string("9H"), Card.from_string("KH")]
-
         solver = Solver(p1_hole, p2_hole, p3_hole, [2, 1, 3], [1, 3, 2], [2, 1, 3])
-        solver.solve()
 
-        maxh_table = solver.get_maxh_table()
-        solver.print_game(maxh_table)
+        # Displaying a table doesn't need a solve, just a non-empty table list
+        table = [Card.from_string(card) for card in ("QH", "10D", "9D", "2S", "3C")]
+        solver._Solver__valid_tables = [table]  # type: ignore[attr-defined]
+        solver.print_game(table, file=stdout_sink)
 
-        captured = capsys.readouterr()
-        assert "Pokle Solver Results" in captured.out
-        assert "P1" in captured.out
-        assert "P2" in captured.out
-        assert "P3" in captured.out
-        assert "flop:" in captured.out
-        assert "turn:" in captured.out
-        assert "river:" in captured.out
+        output = stdout_sink.getvalue()
+        assert "Pokle Solver Results" in output
+        assert "P1" in output
+        assert "P2" in output
+        assert "P3" in output
+        assert "flop:" in output
+        assert "turn:" in output
+        assert "river:" in output
 
 
 class TestPhaseEvaluationDataclass:
@@ -360,10 +423,18 @@ class TestPhaseEvaluationDataclass:
         assert phase_eval.prev_cards_used is None
         assert phase_eval.validate_all_cards_used is False
 
+    def test_per_candidate_dataclasses_have_no_instance_dict(self):
+        """Test that PhaseEvaluation and HandRanking instances are slotted."""
+        phase_eval = PhaseEvaluation(table=[], expected_rankings=[1, 2, 3])
+        ranking = HandRanking(2, (10, 14, 9), ())
+
+        assert not hasattr(phase_eval, "__dict__")
+        assert not hasattr(ranking, "__dict__")
+
     def test_phase_evaluation_with_all_fields(self):
         """Test creating a PhaseEvaluation with all fields."""
         table = [Card(2, "H"), Card(3, "H"), Card(4, "H"), Card(5, "H")]
-        cards_used = {Card(2, "H"), Card(3, "H")}
+        cards_used = (1 << Card(2, "H").card_index) | (1 << Card(3, "H").card_index)
 
         phase_eval = PhaseEvaluation(
             table=table,
@@ -377,6 +448,36 @@ class TestPhaseEvaluationDataclass:
         assert phase_eval.prev_cards_used == cards_used
         assert phase_eval.validate_all_cards_used is True
 
+    def test_evaluate_phase_rejects_before_ranking_every_player(
+        self, queens_solver, monkeypatch
+    ):
+        """Test that a wrong order between two players skips ranking the rest."""
+        rank_hand = Solver._Solver__rank_hand  # type: ignore
+        ranked = []
+
+        def counting_rank_hand(table, hole):
+            ranked.append(hole)
+            return rank_hand(table, hole)
+
+        monkeypatch.setattr(
+            Solver, "_Solver__rank_hand", staticmethod(counting_rank_hand)
+        )
+        # P1's queens beat P2's ten-high, but P2 is expected to lead
+        table = [Card(3, "C"), Card(4, "D"), Card(7, "S")]
+        phase_eval = PhaseEvaluation(table=table, expected_rankings=[2, 1, 3])
+
+        is_valid, _ = queens_solver._Solver__evaluate_phase(phase_eval)  # type: ignore
+
+        assert is_valid is False
+        assert len(ranked) == 2
+
+        ranked.clear()
+        phase_eval = PhaseEvaluation(table=table, expected_rankings=[1, 3, 2])
+        is_valid, _ = queens_solver._Solver__evaluate_phase(phase_eval)  # type: ignore
+
+        assert is_valid is True
+        assert len(ranked) == 3
+
 
 class TestMasterDeck:
     """Test MASTER_DECK constant."""
@@ -403,6 +504,48 @@ class TestMasterDeck:
             assert suits.count(suit) == 13  # 13 ranks per suit
 
 
+# (guess, answer, expected color code, test id) for the compare kernel.
+# Flop cards match anywhere in the answer's flop; turn and river are positional.
+_COMPARE_EXAMPLES = [
+    # 4S, 7S: suit S in flop -> yellow; KD: rank K -> yellow; 4D: grey;
+    # 6S: suit matches at river -> yellow
+    ("4S KD 7S 4D 6S", "3H 9D KS 6C 4S", 11101, "readme-1"),
+    # 6D: exact -> green; 7D: D taken by the green match -> grey;
+    # 9C: rank 9 -> yellow; KC: exact -> green; AS: suit -> yellow
+    ("6D 7D 9C KC AS", "9H 3S 6D KC 9S", 20121, "readme-2"),
+    # KS: exact -> green; 9S: suit S left -> yellow; AS: rank A -> yellow;
+    # 4H: rank 4 -> yellow; 6S: exact -> green
+    ("KS 9S AS 4H 6S", "7S KS AH 4C 6S", 21112, "readme-3"),
+    # AS: exact -> green; KS, QS: nothing left to match -> grey;
+    # JH: rank J -> yellow; 10D: exact -> green
+    ("AS KS QS JH 10D", "AS 2D 3C JD 10D", 20012, "readme-4"),
+    # Three exact flop matches in a different order; 3D, KH: rank -> yellow
+    ("7H 9S 7S 3D KH", "7S 9S 7H 3H KD", 22211, "readme-5"),
+    # JD: exact -> green; JC: grey; KD: rank K -> yellow; 2H: rank -> yellow;
+    # 3S: exact -> green
+    ("JD JC KD 2H 3S", "JD KS QH 2D 3S", 20112, "readme-6"),
+    ("AS KS QS JH 10D", "AS KS QS JH 10D", 22222, "all-green"),
+    ("2H 3H 4H 5H 6H", "7S 8S 9S JS QS", 0, "all-grey"),
+]
+
+
+@pytest.fixture(scope="module")
+def compared_examples():
+    """Color codes for every _COMPARE_EXAMPLES pair from one batched kernel call."""
+
+    def indices(table_strs):
+        return [[Card.from_string(c).card_index for c in t.split()] for t in table_strs]
+
+    guesses = np.array(indices(g for g, *_ in _COMPARE_EXAMPLES), dtype=np.int8)
+    answers = np.array(indices(a for _, a, *_ in _COMPARE_EXAMPLES), dtype=np.int8)
+    result = np.zeros(len(_COMPARE_EXAMPLES), dtype=np.int16)
+    Solver._Solver__compare_tables(guesses, answers, result)  # type: ignore[attr-defined]
+    return {
+        (guess, answer): int(code)
+        for (guess, answer, *_), code in zip(_COMPARE_EXAMPLES, result)
+    }
+
+
 class TestCompareTablesMethod:
     """Unit tests for the Solver.__compare_tables method.
 
@@ -419,183 +562,14 @@ class TestCompareTablesMethod:
     These test cases are taken from the README documentation.
     """
 
-    def test_compare_tables_example_1(self):
-        """Test: guess=[4S, KD, 7S, 4D, 6S] vs answer=[3H, 9D, KS, 6C, 4S]
-
-        Expected result: 11101
-        - 4S in flop: 4 not in [3,9,13], S in [H,D,S] -> yellow (1)
-        - KD in flop: K(13) matches KS rank -> yellow (1)
-        - 7S in flop: 7 not in ranks, S in suits -> yellow (1)
-        - 4D at turn: 4!=6, D!=C -> grey (0)
-        - 6S at river: 6!=4, S==S -> yellow (1)
-        """
-        guess = [Card.from_string(c) for c in ["4S", "KD", "7S", "4D", "6S"]]
-        answer = [Card.from_string(c) for c in ["3H", "9D", "KS", "6C", "4S"]]
-        guess_index = np.array([[card.card_index for card in guess]], dtype=np.int8)
-        answer_index = np.array([[card.card_index for card in answer]], dtype=np.int8)
-
-        result = np.zeros(1, dtype=np.int16)
-        Solver._Solver__compare_tables(guess_index, answer_index, result)  # type: ignore[attr-defined]
-
-        assert result[0] == 11101
-
-    def test_compare_tables_example_2(self):
-        """Test: guess=[6D, 7D, 9C, KC, AS] vs answer=[9H, 3S, 6D, KC, 9S]
-
-        Expected result: 20121
-        - 6D in flop: exact match with 6D -> green (2)
-        - 7D in flop: 7 not in ranks, D used by green match -> grey (0)
-        - 9C in flop: 9 matches 9H rank -> yellow (1)
-        - KC at turn: exact match -> green (2)
-        - AS at river: A!=9, S==S -> yellow (1)
-        """
-        guess = [Card.from_string(c) for c in ["6D", "7D", "9C", "KC", "AS"]]
-        answer = [Card.from_string(c) for c in ["9H", "3S", "6D", "KC", "9S"]]
-        guess_index = np.array([[card.card_index for card in guess]], dtype=np.int8)
-        answer_index = np.array([[card.card_index for card in answer]], dtype=np.int8)
-
-        result = np.zeros(1, dtype=np.int16)
-        Solver._Solver__compare_tables(guess_index, answer_index, result)  # type: ignore[attr-defined]
-
-        assert result[0] == 20121
-
-    def test_compare_tables_example_3(self):
-        """Test: guess=[KS, 9S, AS, 4H, 6S] vs answer=[7S, KS, AH, 4C, 6S]
-
-        Expected result: 21112
-        - KS in flop: exact match with KS -> green (2)
-        - 9S in flop: 9 not in [7,-,14], S in remaining suits -> yellow (1)
-        - AS in flop: A(14) matches AH rank -> yellow (1)
-        - 4H at turn: 4==4 -> yellow (1)
-        - 6S at river: exact match -> green (2)
-        """
-        guess = [Card.from_string(c) for c in ["KS", "9S", "AS", "4H", "6S"]]
-        answer = [Card.from_string(c) for c in ["7S", "KS", "AH", "4C", "6S"]]
-        guess_index = np.array([[card.card_index for card in guess]], dtype=np.int8)
-        answer_index = np.array([[card.card_index for card in answer]], dtype=np.int8)
-
-        result = np.zeros(1, dtype=np.int16)
-        Solver._Solver__compare_tables(guess_index, answer_index, result)  # type: ignore[attr-defined]
-
-        assert result[0] == 21112
-
-    def test_compare_tables_example_4(self):
-        """Test: guess=[AS, KS, QS, JH, 10D] vs answer=[AS, 2D, 3C, JD, 10D]
-
-        Expected result: 20012
-        - AS in flop: exact match -> green (2)
-        - KS in flop: K(13) not in [-,2,3], S not in remaining suits -> grey (0)
-        - QS in flop: Q(12) not in remaining ranks -> grey (0)
-        - JH at turn: J==J -> yellow (1)
-        - 10D at river: exact match -> green (2)
-        """
-        guess = [Card.from_string(c) for c in ["AS", "KS", "QS", "JH", "10D"]]
-        answer = [Card.from_string(c) for c in ["AS", "2D", "3C", "JD", "10D"]]
-        guess_index = np.array([[card.card_index for card in guess]], dtype=np.int8)
-        answer_index = np.array([[card.card_index for card in answer]], dtype=np.int8)
-
-        result = np.zeros(1, dtype=np.int16)
-        Solver._Solver__compare_tables(guess_index, answer_index, result)  # type: ignore[attr-defined]
-
-        assert result[0] == 20012
-
-    def test_compare_tables_example_5(self):
-        """Test: guess=[7H, 9S, 7S, 3D, KH] vs answer=[7S, 9S, 7H, 3H, KD]
-
-        Expected result: 22211
-        - 7H in flop: exact match with 7H -> green (2)
-        - 9S in flop: exact match with 9S -> green (2)
-        - 7S in flop: exact match with 7S -> green (2)
-        - 3D at turn: 3==3, D!=H -> yellow (1)
-        - KH at river: K==K, H!=D -> yellow (1)
-        """
-        guess = [Card.from_string(c) for c in ["7H", "9S", "7S", "3D", "KH"]]
-        answer = [Card.from_string(c) for c in ["7S", "9S", "7H", "3H", "KD"]]
-        guess_index = np.array([[card.card_index for card in guess]], dtype=np.int8)
-        answer_index = np.array([[card.card_index for card in answer]], dtype=np.int8)
-
-        result = np.zeros(1, dtype=np.int16)
-        Solver._Solver__compare_tables(guess_index, answer_index, result)  # type: ignore[attr-defined]
-
-        assert result[0] == 22211
-
-    def test_compare_tables_example_6(self):
-        """Test: guess=[JD, JC, KD, 2H, 3S] vs answer=[JD, KS, QH, 2D, 3S]
-
-        Expected result: 20112
-        - JD in flop: exact match -> green (2)
-        - JC in flop: J not in remaining ranks, C not in remaining suits -> grey (0)
-        - KD in flop: K(13) matches KS rank -> yellow (1)
-        - 2H at turn: 2==2 -> yellow (1)
-        - 3S at river: exact match -> green (2)
-        """
-        guess = [Card.from_string(c) for c in ["JD", "JC", "KD", "2H", "3S"]]
-        answer = [Card.from_string(c) for c in ["JD", "KS", "QH", "2D", "3S"]]
-        guess_index = np.array([[card.card_index for card in guess]], dtype=np.int8)
-        answer_index = np.array([[card.card_index for card in answer]], dtype=np.int8)
-
-        result = np.zeros(1, dtype=np.int16)
-        Solver._Solver__compare_tables(guess_index, answer_index, result)  # type: ignore[attr-defined]
-
-        assert result[0] == 20112
-
-    def test_compare_tables_batch_processing(self):
-        """Test that compare_tables correctly handles batch processing of multiple tables."""
-        # Create 3 tables as guesses against 3 answers
-        guess1 = [Card.from_string(c) for c in ["4S", "KD", "7S", "4D", "6S"]]
-        guess2 = [Card.from_string(c) for c in ["6D", "7D", "9C", "KC", "AS"]]
-        guess3 = [Card.from_string(c) for c in ["JD", "JC", "KD", "2H", "3S"]]
-
-        answer1 = [Card.from_string(c) for c in ["3H", "9D", "KS", "6C", "4S"]]
-        answer2 = [Card.from_string(c) for c in ["9H", "3S", "6D", "KC", "9S"]]
-        answer3 = [Card.from_string(c) for c in ["JD", "KS", "QH", "2D", "3S"]]
-
-        guess_indices = np.array(
-            [
-                [card.card_index for card in guess1],
-                [card.card_index for card in guess2],
-                [card.card_index for card in guess3],
-            ],
-            dtype=np.int8,
-        )
-
-        answer_indices = np.array(
-            [
-                [card.card_index for card in answer1],
-                [card.card_index for card in answer2],
-                [card.card_index for card in answer3],
-            ],
-            dtype=np.int8,
-        )
-
-        result = np.zeros(3, dtype=np.int16)
-        Solver._Solver__compare_tables(guess_indices, answer_indices, result)  # type: ignore[attr-defined]
-
-        assert result[0] == 11101
-        assert result[1] == 20121
-        assert result[2] == 20112
-
-    def test_compare_tables_all_green(self):
-        """Test that identical tables return all green (22222)."""
-        table = [Card.from_string(c) for c in ["AS", "KS", "QS", "JH", "10D"]]
-        table_index = np.array([[card.card_index for card in table]], dtype=np.int8)
-
-        result = np.zeros(1, dtype=np.int16)
-        Solver._Solver__compare_tables(table_index, table_index, result)  # type: ignore[attr-defined]
-
-        assert result[0] == 22222
-
-    def test_compare_tables_all_grey(self):
-        """Test that completely non-matching tables return all grey (00000)."""
-        guess = [Card.from_string(c) for c in ["2H", "3H", "4H", "5H", "6H"]]
-        answer = [Card.from_string(c) for c in ["7S", "8S", "9S", "JS", "QS"]]
-        guess_index = np.array([[card.card_index for card in guess]], dtype=np.int8)
-        answer_index = np.array([[card.card_index for card in answer]], dtype=np.int8)
-
-        result = np.zeros(1, dtype=np.int16)
-        Solver._Solver__compare_tables(guess_index, answer_index, result)  # type: ignore[attr-defined]
-
-        assert result[0] == 0  # 00000
+    @pytest.mark.parametrize(
+        "guess, answer, expected",
+        [(guess, answer, expected) for guess, answer, expected, _ in _COMPARE_EXAMPLES],
+        ids=[example_id for *_, example_id in _COMPARE_EXAMPLES],
+    )
+    def test_compare_tables_example(self, compared_examples, guess, answer, expected):
+        """Test each README example's row of the single batched kernel call."""
+        assert compared_examples[(guess, answer)] == expected
 
     def test_compare_tables_green_match_priority_over_yellow(self):
         """Test that green matches are found before yellow matches consume the card.
@@ -637,6 +611,17 @@ class TestCompareTablesMethod:
             "Green matches should be found before yellow matches consume the answer card."
         )
 
+    def test_compare_colors_unpacks_the_color_code(self):
+        """Test that compare_colors returns the per-card digits of the color code."""
+        guess = [Card.from_string(c) for c in ["4C", "9H", "2C", "AD", "3D"]]
+        answer = [Card.from_string(c) for c in ["2C", "9S", "2S", "4S", "5S"]]
+
+        colors = Solver.compare_colors(guess, answer)
+
+        assert colors.dtype == np.int8
+        assert colors.tolist() == [0, 1, 2, 0, 0]
+        assert Solver.compare_colors(answer, answer).tolist() == [2, 2, 2, 2, 2]
+
 
 class TestRankHandBestHandTuple:
     """Test that rank_hand returns correct best_hand tuples.
@@ -797,6 +782,106 @@ class TestRankHandBestHandTuple:
         assert ranking.tie_breakers == (14,)
 
 
+    def test_rank_lookup_matches_full_evaluation(self):
+        """Test that the rank-pattern lookup agrees with full hand evaluation.
+
+        Each hand is ranked twice so both the cache-filling and the cached
+        path are compared, including the exact cards in best_hand.
+        """
+        rng = np.random.default_rng(0)
+        for _ in range(3000):
+            size = int(rng.integers(5, 8))
+            picks = rng.choice(52, size=size, replace=False)
+            cards = [MASTER_DECK[i] for i in picks]
+            hole, table = cards[:2], cards[2:]
+            expected = Solver._Solver__evaluate_hand(hole + table)  # type: ignore
+
+            assert Solver._Solver__rank_hand(table, hole) == expected  # type: ignore
+            assert Solver._Solver__rank_hand(table, hole) == expected  # type: ignore
+
+    def test_rank_lookup_rebuilds_best_hand_from_current_cards(self):
+        """Test that a cached rank pattern returns the caller's cards, not cached ones."""
+        first = Solver._Solver__rank_hand(  # type: ignore
+            [Card(10, "H"), Card(10, "D"), Card(5, "S")], [Card(7, "C"), Card(13, "H")]
+        )
+        second = Solver._Solver__rank_hand(  # type: ignore
+            [Card(10, "C"), Card(10, "S"), Card(5, "D")], [Card(7, "H"), Card(13, "S")]
+        )
+
+        assert first.best_hand == (Card(10, "H"), Card(10, "D"))
+        assert second.best_hand == (Card(10, "C"), Card(10, "S"))
+
+    def test_rank_keys_extend_one_card_at_a_time(self):
+        """Test that folding a new card into cached keys ranks like a fresh pass."""
+        hand_keys = Solver._Solver__hand_keys  # type: ignore
+        rank_keyed_hand = Solver._Solver__rank_keyed_hand  # type: ignore
+        rng = np.random.default_rng(1)
+        for _ in range(500):
+            picks = rng.choice(52, size=int(rng.integers(6, 8)), replace=False)
+            cards = [MASTER_DECK[i] for i in picks]
+            hole, table = cards[:2], cards[2:]
+            suit_counts, rank_key = hand_keys(cards[:-1])
+            new_card = cards[-1]
+
+            assert rank_keyed_hand(
+                cards, suit_counts + new_card._suit_count, rank_key * new_card._prime
+            ) == Solver._Solver__rank_hand(table, hole)  # type: ignore
+
+    def test_flush_lookup_matches_full_evaluation(self):
+        """Test that cached flush patterns rebuild the same hand for any suit."""
+        evaluate_hand = Solver._Solver__evaluate_hand  # type: ignore
+        rotate_suit = dict(zip("HDCS", "DCSH"))
+        rng = np.random.default_rng(3)
+        checked = 0
+        while checked < 300:
+            cards = [MASTER_DECK[i] for i in rng.choice(52, size=7, replace=False)]
+            if max(sum(card.suit == suit for card in cards) for suit in "HDCS") < 5:
+                continue
+            # The rotated hand has the same lookup keys but different Cards,
+            # so it is ranked from the pattern cached for the first one
+            rotated = [Card(card.rank, rotate_suit[card.suit]) for card in cards]
+            for hand in (cards, rotated):
+                ranking = Solver._Solver__rank_hand(hand[2:], hand[:2])  # type: ignore
+                assert ranking == evaluate_hand(hand)
+                assert ranking.key == evaluate_hand(hand).key
+            checked += 1
+
+    def test_rank_keys_match_per_hand_keys(self, rank_keys):
+        """Test that the conftest batch ranker matches ranking each board on its own."""
+        rng = np.random.default_rng(4)
+        hole = [Card.from_string("AH"), Card.from_string("KH")]
+        deck = np.setdiff1d(np.arange(52), Card.indices(hole))
+        for size in (3, 4, 5):
+            boards = np.array(
+                [rng.choice(deck, size=size, replace=False) for _ in range(400)],
+                dtype=np.int8,
+            )
+            expected = [
+                Solver._Solver__rank_hand(list(Card.from_indices(board)), hole).key  # type: ignore
+                for board in boards
+            ]
+            assert rank_keys(boards, hole).tolist() == expected
+
+    def test_hand_key_orders_like_rank_and_tie_breakers(self):
+        """Test that HandRanking.key sorts and ties exactly like (rank, tie_breakers)."""
+        rng = np.random.default_rng(2)
+        deals = (
+            [MASTER_DECK[i] for i in rng.choice(52, size=int(size), replace=False)]
+            for size in rng.integers(5, 8, size=2000)
+        )
+        hands = [
+            Solver._Solver__rank_hand(cards[2:], cards[:2])  # type: ignore
+            for cards in deals
+        ]
+
+        for a, b in zip(hands, hands[1:]):
+            a_tuple, b_tuple = (a.rank, a.tie_breakers), (b.rank, b.tie_breakers)
+            assert (a.key < b.key) == (a_tuple < b_tuple)
+            assert (a.key == b.key) == (a_tuple == b_tuple)
+
+        assert HandRanking(2, (10, 14, 9), ()).key == HandRanking.pack_key(2, (10, 14, 9))
+
+
 class TestSolverTableCountRegression:
     """Regression tests to ensure solver returns correct number of possible tables.
 
@@ -804,28 +889,21 @@ class TestSolverTableCountRegression:
     the solver's output by affecting the cards_used_accumulated validation logic.
     """
 
-    def test_specific_scenario_returns_1474_tables(self):
+    def test_specific_scenario_returns_1474_tables(self, example_12_25_solver):
         """Test the specific scenario that previously returned 1468 instead of 1474.
 
         This regression test ensures that when rank_hand was optimized, it still
         produces the exact same solver results. The bug was that best_hand for
         high card only returned 1 card instead of 5, which affected cards_used_accumulated.
         """
-        p1_hole = [Card.from_string("7C"), Card.from_string("9D")]
-        p2_hole = [Card.from_string("KH"), Card.from_string("KS")]
-        p3_hole = [Card.from_string("8D"), Card.from_string("4S")]
-
-        flop = [1, 2, 3]
-        turn = [3, 1, 2]
-        river = [2, 3, 1]
-
-        solver = Solver(p1_hole, p2_hole, p3_hole, flop, turn, river)
-        possible_tables = solver.solve()
+        possible_tables = example_12_25_solver.valid_tables
 
         # The critical assertion: must find exactly 1474 possible tables
         assert len(possible_tables) == 1474
 
-    def test_solver_produces_consistent_results_across_runs(self):
+    def test_solver_produces_consistent_results_across_runs(
+        self, example_12_25_solver
+    ):
         """Test that solver produces identical results across multiple runs.
 
         This ensures that any card selection in rank_hand is deterministic.
@@ -838,16 +916,12 @@ class TestSolverTableCountRegression:
         turn = [3, 1, 2]
         river = [2, 3, 1]
 
-        # Run solver multiple times
-        results = []
-        for _ in range(3):
-            solver = Solver(p1_hole, p2_hole, p3_hole, flop, turn, river)
-            possible_tables = solver.solve()
-            results.append(len(possible_tables))
+        # A fresh run must reproduce the shared fixture's tables, in order
+        solver = Solver(p1_hole, p2_hole, p3_hole, flop, turn, river)
+        possible_tables = solver.solve()
 
-        # All runs should produce identical counts
-        assert all(count == results[0] for count in results)
-        assert results[0] == 1474
+        assert len(possible_tables) == 1474
+        assert possible_tables == example_12_25_solver.valid_tables
 
 
 class TestSolverTableCountRegressionKickerBug:
@@ -862,19 +936,15 @@ class TestSolverTableCountRegressionKickerBug:
     the bug: slow_output and very_slow.
     """
 
-    def test_slow_output_scenario_exact_count(self):
+    @pytest.mark.slow
+    def test_slow_output_scenario_exact_count(self, slow_output_solver):
         """Test that slow_output scenario produces exactly 1,323 tables.
 
         This was the primary test case that caught the bug:
         - Buggy version: 20,873 tables (15.8x too many)
         - Correct version: 1,323 tables
         """
-        p1 = [Card.from_string("KH"), Card.from_string("6S")]
-        p2 = [Card.from_string("8C"), Card.from_string("8H")]
-        p3 = [Card.from_string("4H"), Card.from_string("9S")]
-
-        solver = Solver(p1, p2, p3, [2, 3, 1], [3, 2, 1], [3, 1, 2])
-        tables = solver.solve()
+        tables = slow_output_solver.valid_tables
 
         assert len(tables) == 1323, (
             f"slow_output scenario should produce exactly 1,323 tables, "
@@ -882,19 +952,15 @@ class TestSolverTableCountRegressionKickerBug:
             f"kicker card selection logic."
         )
 
-    def test_very_slow_scenario_exact_count(self):
+    @pytest.mark.slow
+    def test_very_slow_scenario_exact_count(self, very_slow_solver):
         """Test that very_slow scenario produces exactly 7,606 tables.
 
         This was the secondary test case that confirmed the bug:
         - Buggy version: 14,528 tables (1.9x too many)
         - Correct version: 7,606 tables
         """
-        p1 = [Card.from_string("JH"), Card.from_string("6H")]
-        p2 = [Card.from_string("4H"), Card.from_string("7S")]
-        p3 = [Card.from_string("5D"), Card.from_string("8D")]
-
-        solver = Solver(p1, p2, p3, [3, 2, 1], [2, 3, 1], [2, 1, 3])
-        tables = solver.solve()
+        tables = very_slow_solver.valid_tables
 
         assert len(tables) == 7606, (
             f"very_slow scenario should produce exactly 7,606 tables, "